@@ -0,0 +1,354 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient l'analyseur exhaustif d'un format de plateau: il énumère toutes les positions atteignables
+(X joue en premier, la partie s'arrête à la première victoire), réduites par symétrie, et calcule la valeur
+théorique de chacune. Il rapporte le nombre de positions par profondeur, les fins de partie, et peut vérifier
+qu'un niveau de l'ordinateur ne perd jamais de valeur, par exemple qu'il ne perd jamais une position nulle.
+
+Le travail est partagé entre processus selon les coups d'ouverture: chaque processus résout le sous-arbre
+d'une ouverture (à symétrie près) avec les coups et annulations de Plateau. Les positions déjà résolues sont
+marquées dans une mémoire partagée, indexée par le rang en base 3 de leur forme canonique: une position atteinte
+par plusieurs ouvertures n'est résolue qu'une fois, par le premier processus qui l'atteint.
+
+    python analyse.py [-m 3] [-n 3] [-k 3] [-p processus] [--partage 2] [--verifier normal parfait] [--json]
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+from livre import _image
+from plateau import Plateau, symetries
+
+# Issue d'une position terminale: le joueur qui vient de jouer a gagné, ou le plateau est plein.
+VICTOIRE, NULLE = "victoire", "nulle"
+
+
+@lru_cache(maxsize=None)
+def _tables_images(m, n):
+    """
+    Retourne, pour chaque symétrie du plateau, les images de chaque octet d'une clé (joueur << m * n | adversaire).
+    L'image d'une clé est ainsi l'union de quelques lectures de table plutôt qu'un parcours de ses bits.
+    """
+    nb_cases = m * n
+    tables = []
+    for permutation in symetries(m, n):
+        # La permutation appliquée aux deux moitiés de la clé.
+        double = tuple(permutation) + tuple(position + nb_cases for position in permutation)
+        tables.append(tuple(
+            tuple(_image(octet << debut, double) for octet in range(1 << min(8, 2 * nb_cases - debut)))
+            for debut in range(0, 2 * nb_cases, 8)
+        ))
+    return tuple(tables)
+
+
+def _canonique(cle, tables):
+    """
+    Retourne la clé canonique (la plus petite image de la clé) et le nombre d'images distinctes de la position,
+    c'est-à-dire le nombre de positions qu'elle représente.
+    """
+    images = set()
+    for octets in tables:
+        image, reste = 0, cle
+        for table in octets:
+            image |= table[reste & 0xFF]
+            reste >>= 8
+        images.add(image)
+    return min(images), len(images)
+
+
+@lru_cache(maxsize=None)
+def _tables_rangs(m, n):
+    """
+    Retourne, pour chaque octet d'une clé (joueur << m * n | adversaire), sa contribution au rang de la position
+    en base 3, où chaque case vaut 0 (vide), 1 (joueur dont c'est le tour) ou 2 (adversaire).
+    """
+    nb_cases = m * n
+    return tuple(
+        tuple(sum(3 ** (position - nb_cases) if position >= nb_cases else 2 * 3 ** position
+                  for position in range(debut, debut + 8) if octet >> (position - debut) & 1)
+              for octet in range(1 << min(8, 2 * nb_cases - debut)))
+        for debut in range(0, 2 * nb_cases, 8)
+    )
+
+
+def _rang(cle, tables):
+    rang = 0
+    for table in tables:
+        rang += table[cle & 0xFF]
+        cle >>= 8
+    return rang
+
+
+class _Solveur:
+    """
+    Classe modélisant la résolution des positions par un processus.
+
+    Attributes:
+        table       (dict)          : clé canonique -> (valeur pour le joueur dont c'est le tour, issue, nombre
+                                      d'images), pour les positions résolues par ce processus.
+        memoire     (memoryview)    : Les positions résolues par tous les processus, un octet par rang: 0 si la
+                                      position n'est pas encore résolue, sinon sa valeur + 2.
+    """
+
+    def __init__(self, m, n, memoire, table=None):
+        self.nb_cases = m * n
+        self.images = _tables_images(m, n)
+        self.rangs = _tables_rangs(m, n)
+        self.memoire = memoire
+        self.table = {} if table is None else table
+
+    def resoudre(self, plateau, pion):
+        """
+        Résout la position du plateau, où c'est au tour de pion, et toutes celles qui la suivent.
+        Les coups sont essayés directement sur le plateau (jouer_coup puis annuler_coup).
+
+        Returns:
+            int: La valeur de la position: 1 si le joueur dont c'est le tour gagne, 0 si nulle, -1 s'il perd.
+        """
+        autre = "O" if pion == "X" else "X"
+        cle, nb_images = _canonique(plateau.pions[pion] << self.nb_cases | plateau.pions[autre], self.images)
+        entree = self.table.get(cle)
+        if entree is not None:
+            return entree[0]
+        # Une position résolue par un autre processus l'a été avec toutes celles qui la suivent.
+        rang = _rang(cle, self.rangs)
+        if self.memoire[rang]:
+            return self.memoire[rang] - 2
+
+        if plateau.a_gagne(autre):
+            valeur, issue = -1, VICTOIRE
+        elif not plateau.non_plein():
+            valeur, issue = 0, NULLE
+        else:
+            # Pas de coupure quand un coup gagne: les positions qui suivent les autres coups doivent être énumérées.
+            valeur, issue = -1, None
+            for position in list(plateau.coups_legaux()):
+                plateau.jouer_coup(position, pion)
+                valeur = max(valeur, -self.resoudre(plateau, autre))
+                plateau.annuler_coup()
+        self.table[cle] = (valeur, issue, nb_images)
+        self.memoire[rang] = valeur + 2
+        return valeur
+
+
+def _pion_au_trait(nb_pions):
+    return "X" if nb_pions % 2 == 0 else "O"
+
+
+def _plateau_de(m, n, k, coups):
+    plateau = Plateau(m, n, k)
+    for indice, position in enumerate(coups):
+        plateau.jouer_coup(position, _pion_au_trait(indice))
+    return plateau
+
+
+# La mémoire partagée des positions résolues, ouverte une seule fois par chaque processus.
+_partagee = None
+
+
+def _initialiser_analyse(nom):
+    global _partagee
+    _partagee = shared_memory.SharedMemory(nom)
+
+
+def _analyser_ouverture(m, n, k, coups):
+    """
+    Tâche d'un processus: résout le sous-arbre qui suit une suite de coups d'ouverture.
+    """
+    solveur = _Solveur(m, n, _partagee.buf)
+    solveur.resoudre(_plateau_de(m, n, k, coups), _pion_au_trait(len(coups)))
+    return solveur.table
+
+
+def ouvertures(m, n, k, profondeur):
+    """
+    Retourne une suite de coups pour chaque position (à symétrie près) atteinte après profondeur coups
+    sans fin de partie. Ce sont les tâches partagées entre les processus.
+    """
+    tables = _tables_images(m, n)
+    niveau = [()]
+    for _ in range(profondeur):
+        vues = set()
+        suivant = []
+        for coups in niveau:
+            plateau = _plateau_de(m, n, k, coups)
+            pion = _pion_au_trait(len(coups))
+            autre = "O" if pion == "X" else "X"
+            for position in sorted(plateau.coups_legaux()):
+                plateau.jouer_coup(position, pion)
+                cle, _ = _canonique(plateau.pions[autre] << m * n | plateau.pions[pion], tables)
+                if cle not in vues and not plateau.a_gagne(pion) and plateau.non_plein():
+                    vues.add(cle)
+                    suivant.append(coups + (position,))
+                plateau.annuler_coup()
+        niveau = suivant
+    return niveau
+
+
+def analyser(m=3, n=3, k=3, nb_processus=None, partage=2):
+    """
+    Énumère et résout toutes les positions atteignables. Les processus partagent un octet par position possible
+    (3 ** (m * n) octets), de sorte qu'une position atteinte par plusieurs ouvertures n'est résolue qu'une fois.
+
+    Args:
+        m (int): Le nombre de lignes du plateau.
+        n (int): Le nombre de colonnes du plateau.
+        k (int): Le nombre de pions à aligner pour gagner.
+        nb_processus (int): Le nombre de processus (par défaut, le nombre de processeurs).
+        partage (int): Le nombre de coups d'ouverture qui définissent une tâche.
+
+    Returns:
+        dict: clé canonique -> (valeur, issue, nombre d'images), pour toutes les positions atteignables.
+    """
+    assert m * n <= 16, "Analyse: l'énumération exhaustive est limitée aux plateaux de 16 cases."
+    partage = min(partage, m * n)
+    taches = ouvertures(m, n, k, partage)
+    partagee = shared_memory.SharedMemory(create=True, size=3 ** (m * n))
+    try:
+        table = {}
+        with ProcessPoolExecutor(nb_processus, initializer=_initialiser_analyse,
+                                 initargs=(partagee.name,)) as executeur:
+            futurs = [executeur.submit(_analyser_ouverture, m, n, k, coups) for coups in taches]
+            for futur in futurs:
+                table.update(futur.result())
+        # Les positions d'avant le partage sont résolues ici: les suivantes sont déjà dans la table.
+        _Solveur(m, n, partagee.buf, table).resoudre(Plateau(m, n, k), "X")
+    finally:
+        partagee.close()
+        partagee.unlink()
+    return table
+
+
+def rapport(table):
+    """
+    Résume la table par profondeur (nombre de pions).
+
+    Returns:
+        dict: Pour chaque profondeur, le nombre de positions, de positions canoniques, de victoires de X,
+              de victoires de O et de parties nulles (positions terminales).
+    """
+    profondeurs = {}
+    for cle, (valeur, issue, nb_images) in table.items():
+        profondeur = bin(cle).count("1")
+        ligne = profondeurs.setdefault(profondeur, {"positions": 0, "canoniques": 0, "victoires_x": 0,
+                                                   "victoires_o": 0, "nulles": 0})
+        ligne["positions"] += nb_images
+        ligne["canoniques"] += 1
+        if issue == VICTOIRE:
+            # Le gagnant est celui qui vient de jouer, donc pas celui dont c'est le tour.
+            ligne["victoires_x" if _pion_au_trait(profondeur) == "O" else "victoires_o"] += nb_images
+        elif issue == NULLE:
+            ligne["nulles"] += nb_images
+    return dict(sorted(profondeurs.items()))
+
+
+# La table des valeurs, transmise une seule fois à chaque processus de vérification.
+_table = None
+
+
+def _initialiser_verification(table):
+    global _table
+    _table = table
+
+
+def _verifier_positions(m, n, k, niveau, cles):
+    """
+    Tâche d'un processus: joue le coup de l'ordinateur dans chaque position et retourne celles où il perd
+    de la valeur, avec la valeur avant et après le coup (du point de vue de l'ordinateur).
+    """
+    nb_cases = m * n
+    tables = _tables_images(m, n)
+    masque = (1 << nb_cases) - 1
+    pertes = []
+    for cle in cles:
+        joueur, adversaire = cle >> nb_cases, cle & masque
+        pion = _pion_au_trait(bin(cle).count("1"))
+        autre = "O" if pion == "X" else "X"
+        plateau = Plateau(m, n, k)
+        for position in range(nb_cases):
+            if joueur >> position & 1:
+                plateau.jouer_coup(position, pion)
+            elif adversaire >> position & 1:
+                plateau.jouer_coup(position, autre)
+        # Le pion passé est celui de l'adversaire de l'ordinateur, qui vient de jouer.
+        ligne, colonne = plateau.choisir_prochaine_case(autre, niveau)
+        plateau.jouer_coup(ligne * n + colonne, pion)
+        apres, _ = _canonique(plateau.pions[autre] << nb_cases | plateau.pions[pion], tables)
+        valeur, valeur_apres = _table[cle][0], -_table[apres][0]
+        if valeur_apres < valeur:
+            pertes.append((cle, valeur, valeur_apres))
+    return pertes
+
+
+def verifier(table, m, n, k, niveau, nb_processus=None, taille_paquet=2000):
+    """
+    Vérifie qu'un niveau de l'ordinateur conserve la valeur de toutes les positions non terminales: il ne doit
+    jamais laisser filer une position gagnante, ni perdre une position nulle.
+
+    Returns:
+        list: Les positions (clé, valeur avant, valeur après) où le coup choisi perd de la valeur.
+    """
+    cles = sorted(cle for cle, (_, issue, _) in table.items() if issue is None)
+    pertes = []
+    with ProcessPoolExecutor(nb_processus, initializer=_initialiser_verification, initargs=(table,)) as executeur:
+        futurs = [executeur.submit(_verifier_positions, m, n, k, niveau, cles[debut:debut + taille_paquet])
+                  for debut in range(0, len(cles), taille_paquet)]
+        for futur in futurs:
+            pertes.extend(futur.result())
+    return pertes
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Analyse exhaustive d'un format de plateau.")
+    analyseur.add_argument("-m", type=int, default=3)
+    analyseur.add_argument("-n", type=int, default=3)
+    analyseur.add_argument("-k", type=int, default=3)
+    analyseur.add_argument("-p", "--processus", type=int, default=None)
+    analyseur.add_argument("--partage", type=int, default=2, help="coups d'ouverture par tâche (défaut: 2)")
+    analyseur.add_argument("--verifier", nargs="*", default=[], help="niveaux de l'ordinateur à vérifier")
+    analyseur.add_argument("--json", action="store_true", help="écrit le rapport en JSON")
+    arguments = analyseur.parse_args()
+    m, n, k = arguments.m, arguments.n, arguments.k
+
+    debut = time.perf_counter()
+    table = analyser(m, n, k, arguments.processus, arguments.partage)
+    duree = time.perf_counter() - debut
+    profondeurs = rapport(table)
+    valeurs = {-1: 0, 0: 0, 1: 0}
+    for valeur, issue, nb_images in table.values():
+        if issue is None:
+            valeurs[valeur] += nb_images
+    valeur_initiale = table[0][0]
+    verifications = {niveau: verifier(table, m, n, k, niveau, arguments.processus) for niveau in arguments.verifier}
+
+    if arguments.json:
+        print(json.dumps({
+            "format": [m, n, k],
+            "duree": duree,
+            "valeur_initiale": valeur_initiale,
+            "profondeurs": profondeurs,
+            "valeurs_non_terminales": {"gagnantes": valeurs[1], "nulles": valeurs[0], "perdantes": valeurs[-1]},
+            "pertes_de_valeur": {niveau: {"positions": len(pertes),
+                                          "nulles_perdues": sum(1 for _, avant, _ in pertes if avant == 0)}
+                                 for niveau, pertes in verifications.items()},
+        }, indent=2))
+    else:
+        print("Plateau {} x {}, {} à aligner: {} positions ({} à symétrie près) en {:.2f} s".format(
+            m, n, k, sum(ligne["positions"] for ligne in profondeurs.values()), len(table), duree))
+        print("{:>10} {:>12} {:>12} {:>12} {:>12} {:>12}".format(
+            "profondeur", "positions", "canoniques", "gagne X", "gagne O", "nulles"))
+        for profondeur, ligne in profondeurs.items():
+            print("{:>10} {:>12} {:>12} {:>12} {:>12} {:>12}".format(
+                profondeur, ligne["positions"], ligne["canoniques"], ligne["victoires_x"], ligne["victoires_o"],
+                ligne["nulles"]))
+        print("Valeur du plateau vide pour X: {}".format({1: "gagnante", 0: "nulle", -1: "perdante"}[valeur_initiale]))
+        print("Positions non terminales: {} gagnantes, {} nulles, {} perdantes (pour le joueur au trait)".format(
+            valeurs[1], valeurs[0], valeurs[-1]))
+        for niveau, pertes in verifications.items():
+            print("Niveau {}: {} positions canoniques où le coup choisi perd de la valeur, dont {} nulles perdues".format(
+                niveau, len(pertes), sum(1 for _, avant, _ in pertes if avant == 0)))
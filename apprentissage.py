@@ -0,0 +1,307 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le joueur du niveau "appris", qui apprend à jouer en jouant contre lui-même.
+
+Le joueur garde une table de valeurs NumPy avec une entrée par position, indexée par son rang en base 3 (comme
+dans retrograde.py): la valeur estimée de la position pour X, de -1 (O gagne) à 1 (X gagne). À son tour, il joue
+le coup qui mène à la meilleure position pour lui. L'entraînement fait avancer des milliers de parties en même
+temps: chaque pas joue un coup dans toutes les parties par des opérations vectorielles, puis rapproche la valeur
+de la position précédente de chaque partie de celle de la nouvelle (différence temporelle), les positions
+atteintes par plusieurs parties étant mises à jour une seule fois avec la moyenne de leurs cibles.
+
+La force du joueur se règle par le nombre de parties d'entraînement, et par la part de coups au hasard qu'il
+joue (hasard). L'entraînement est sauvegardé régulièrement et reprend là où il s'était arrêté:
+    python apprentissage.py [-m 3] [-n 3] [-k 3] [-e parties] [-t taille du lot] [-o chemin]
+
+Format du fichier (ordre des octets petit-boutiste):
+    En-tête (24 octets):    "APPR", version, m, n, k, nombre de parties jouées (uint64), nombre de pas (uint64).
+    Valeurs:                3 ** (m * n) float32.
+"""
+
+import argparse
+import os
+import struct
+import time
+
+import numpy as np
+
+from plateau import lignes_par_case, ouverture_par_x
+
+MAGIQUE = b"APPR"
+VERSION = 1
+EN_TETE = struct.Struct("<4sBBBBQQ")
+
+
+def chemin_apprenti(m=3, n=3, k=3):
+    """
+    Retourne le chemin par défaut de la table d'un format de plateau (à côté de ce module).
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "appris_{}x{}x{}.bin".format(m, n, k))
+
+
+class Lot:
+    """
+    Classe modélisant un lot de parties jouées en même temps.
+
+    Attributes:
+        chiffres    (ndarray)   : Le contenu des cases de chaque partie (0: vide, 1: X, 2: O).
+        rangs       (ndarray)   : Le rang en base 3 de chaque partie.
+        bits        (ndarray)   : Les bitboards de X (ligne 0) et de O (ligne 1) de chaque partie.
+        nb_pions    (ndarray)   : Le nombre de pions joués dans chaque partie.
+        precedents  (ndarray)   : Le rang de la position précédente de chaque partie (-1 au premier coup).
+    """
+
+    def __init__(self, m, n, k, taille):
+        self.nb_cases = m * n
+        self.lignes = np.array(sorted(set(masque for masques in lignes_par_case(m, n, k) for masque in masques)),
+                               dtype=np.uint32)
+        self.puissances = 3 ** np.arange(self.nb_cases, dtype=np.int64)
+        self.chiffres = np.zeros((taille, self.nb_cases), dtype=np.uint8)
+        self.rangs = np.zeros(taille, dtype=np.int64)
+        self.bits = np.zeros((2, taille), dtype=np.uint32)
+        self.nb_pions = np.zeros(taille, dtype=np.int64)
+        self.precedents = np.full(taille, -1, dtype=np.int64)
+
+    def recommencer(self, parties):
+        self.chiffres[parties] = 0
+        self.rangs[parties] = 0
+        self.bits[:, parties] = 0
+        self.nb_pions[parties] = 0
+        self.precedents[parties] = -1
+
+    def jouer(self, valeurs, hasard, generateur):
+        """
+        Joue un coup dans chaque partie: le meilleur selon la table pour le joueur au trait, ou un coup au hasard
+        avec la probabilité hasard de la partie.
+
+        Args:
+            valeurs (ndarray): La table des valeurs.
+            hasard (ndarray): La probabilité de jouer au hasard, par partie.
+            generateur (Generator): Le générateur aléatoire.
+
+        Returns:
+            (ndarray,ndarray,ndarray): Les parties où le coup a été joué au hasard, les parties gagnées par ce
+                                       coup et les parties nulles.
+        """
+        taille = len(self.rangs)
+        parties = np.arange(taille)
+        x_joue = self.nb_pions % 2 == 0
+        chiffre = np.where(x_joue, 1, 2)
+        libres = self.chiffres == 0
+
+        enfants = np.where(libres, self.rangs[:, None] + chiffre[:, None] * self.puissances, 0)
+        scores = valeurs[enfants]
+        scores = np.where(x_joue[:, None], scores, -scores)
+        au_hasard = generateur.random(taille) < hasard
+        scores[au_hasard] = generateur.random((np.count_nonzero(au_hasard), self.nb_cases))
+        # Départage au hasard les coups de même valeur.
+        scores = scores + generateur.random(scores.shape, dtype=np.float32) * 1e-4
+        scores[~libres] = -np.inf
+        coups = scores.argmax(axis=1)
+
+        self.chiffres[parties, coups] = chiffre
+        self.rangs = enfants[parties, coups]
+        joueur = np.where(x_joue, 0, 1)
+        self.bits[joueur, parties] |= np.left_shift(1, coups).astype(np.uint32)
+        self.nb_pions += 1
+
+        bits = self.bits[joueur, parties]
+        gagnees = ((bits[:, None] & self.lignes) == self.lignes).any(axis=1)
+        nulles = ~gagnees & (self.nb_pions == self.nb_cases)
+        return au_hasard, gagnees, nulles
+
+
+def _mettre_a_jour(valeurs, rangs, cibles, pas):
+    """
+    Rapproche la valeur de chaque position de la moyenne de ses cibles.
+    """
+    if len(rangs) == 0:
+        return
+    uniques, inverses = np.unique(rangs, return_inverse=True)
+    moyennes = np.bincount(inverses, weights=cibles) / np.bincount(inverses)
+    valeurs[uniques] += pas * (moyennes - valeurs[uniques])
+
+
+def entrainer(valeurs, m, n, k, nb_parties, taille=4096, pas=0.1, hasard=0.1, graine=None):
+    """
+    Entraîne la table par des parties de l'apprenti contre lui-même.
+
+    Args:
+        valeurs (ndarray): La table des valeurs à entraîner (modifiée en place).
+        m (int): Le nombre de lignes du plateau.
+        n (int): Le nombre de colonnes du plateau.
+        k (int): Le nombre de pions à aligner pour gagner.
+        nb_parties (int): Le nombre de parties à terminer.
+        taille (int): Le nombre de parties jouées en même temps.
+        pas (float): Le pas d'apprentissage.
+        hasard (float): La probabilité de jouer un coup au hasard (exploration).
+        graine (int): La graine du générateur aléatoire.
+
+    Returns:
+        (int,int): Le nombre de parties terminées et le nombre de pas joués.
+    """
+    generateur = np.random.default_rng(graine)
+    lot = Lot(m, n, k, taille)
+    probabilites = np.full(taille, hasard)
+    terminees = nb_pas = 0
+    while terminees < nb_parties:
+        precedents = lot.precedents
+        au_hasard, gagnees, nulles = lot.jouer(valeurs, probabilites, generateur)
+        nb_pas += 1
+
+        # Les positions finales prennent leur vraie valeur; les autres tendent vers la valeur de la suivante.
+        finies = gagnees | nulles
+        valeurs[lot.rangs[finies]] = np.where(gagnees[finies], np.where(lot.nb_pions[finies] % 2 == 1, 1.0, -1.0), 0.0)
+        # Un coup joué au hasard n'apprend rien sur la position précédente.
+        apprises = (precedents >= 0) & ~au_hasard
+        _mettre_a_jour(valeurs, precedents[apprises], valeurs[lot.rangs[apprises]], pas)
+
+        lot.precedents = lot.rangs.copy()
+        terminees += np.count_nonzero(finies)
+        lot.recommencer(finies)
+    return terminees, nb_pas
+
+
+def evaluer(valeurs, m, n, k, nb_parties=10000, graine=None):
+    """
+    Fait jouer l'apprenti (sans hasard) contre un joueur qui joue au hasard, la moitié des parties avec X.
+
+    Returns:
+        (int,int,int): Le nombre de parties gagnées, nulles et perdues par l'apprenti.
+    """
+    generateur = np.random.default_rng(graine)
+    lot = Lot(m, n, k, nb_parties)
+    apprenti_x = np.arange(nb_parties) % 2 == 0
+    en_cours = np.ones(nb_parties, dtype=bool)
+    gagnees = nulles = perdues = 0
+    while en_cours.any():
+        x_joue = lot.nb_pions % 2 == 0
+        _, gagne, nulle = lot.jouer(valeurs, np.where(x_joue == apprenti_x, 0.0, 1.0), generateur)
+        gagne &= en_cours
+        nulle &= en_cours
+        gagnees += np.count_nonzero(gagne & (x_joue == apprenti_x))
+        perdues += np.count_nonzero(gagne & (x_joue != apprenti_x))
+        nulles += np.count_nonzero(nulle)
+        en_cours &= ~(gagne | nulle)
+        # Les parties terminées continuent sur un plateau vide, mais ne comptent plus.
+        lot.recommencer(gagne | nulle)
+    return gagnees, nulles, perdues
+
+
+def lire(chemin):
+    """
+    Lit une table sauvegardée.
+
+    Returns:
+        (tuple,ndarray,int,int): Le format (m, n, k), la table, le nombre de parties et le nombre de pas.
+    """
+    with open(chemin, "rb") as fichier:
+        magique, version, m, n, k, nb_parties, nb_pas = EN_TETE.unpack(fichier.read(EN_TETE.size))
+        assert magique == MAGIQUE and version == VERSION, "Apprentissage: fichier invalide."
+        valeurs = np.fromfile(fichier, dtype="<f4")
+    assert len(valeurs) == 3 ** (m * n), "Apprentissage: taille de fichier invalide."
+    return (m, n, k), valeurs.astype(np.float32, copy=False), nb_parties, nb_pas
+
+
+def ecrire(chemin, m, n, k, valeurs, nb_parties, nb_pas):
+    """
+    Sauvegarde une table. Le fichier est remplacé d'un coup: un arrêt pendant l'écriture laisse l'ancien intact.
+    """
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "wb") as fichier:
+        fichier.write(EN_TETE.pack(MAGIQUE, VERSION, m, n, k, nb_parties, nb_pas))
+        valeurs.astype("<f4", copy=False).tofile(fichier)
+        fichier.flush()
+        os.fsync(fichier.fileno())
+    os.replace(temporaire, chemin)
+
+
+class Apprenti:
+    """
+    Classe modélisant le joueur du niveau "appris", qui joue avec une table entraînée.
+
+    Attributes:
+        valeurs     (ndarray)   : La table des valeurs.
+        hasard      (float)     : La probabilité de jouer un coup au hasard (0 pour la pleine force).
+    """
+
+    def __init__(self, chemin, hasard=0.0):
+        (self.m, self.n, self.k), self.valeurs, self.nb_parties, _ = lire(chemin)
+        self.nb_cases = self.m * self.n
+        self.hasard = hasard
+        self.generateur = np.random.default_rng()
+
+    def choisir_coup(self, bits_x, bits_o, pion):
+        """
+        Retourne le coup de pion ("X" ou "O") qui mène à la meilleure position selon la table. L'entraînement
+        ne joue que des parties où X ouvre: si O a ouvert, la position est lue avec les pions échangés (voir
+        plateau.ouverture_par_x).
+
+        Returns:
+            int: La position du coup (ligne * n + colonne).
+        """
+        occupees = bits_x | bits_o
+        libres = [position for position in range(self.nb_cases) if not occupees >> position & 1]
+        if self.hasard and self.generateur.random() < self.hasard:
+            return libres[self.generateur.integers(len(libres))]
+        bits_x, bits_o, pion = ouverture_par_x(bits_x, bits_o, pion)
+        rang = 0
+        for position in range(self.nb_cases):
+            if bits_x >> position & 1:
+                rang += 3 ** position
+            elif bits_o >> position & 1:
+                rang += 2 * 3 ** position
+        chiffre, signe = (1, 1.0) if pion == "X" else (2, -1.0)
+        return max(libres, key=lambda position: signe * self.valeurs[rang + chiffre * 3 ** position])
+
+
+# Apprentis chargés par le processus, un par format de plateau (None si la table n'existe pas).
+_apprentis = {}
+
+
+def apprenti(m=3, n=3, k=3):
+    """
+    Retourne l'apprenti d'un format de plateau, chargé au premier appel, ou None s'il n'a pas été entraîné.
+    """
+    if (m, n, k) not in _apprentis:
+        chemin = chemin_apprenti(m, n, k)
+        _apprentis[m, n, k] = Apprenti(chemin) if os.path.exists(chemin) else None
+    return _apprentis[m, n, k]
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Entraîne l'apprenti d'un format de plateau.")
+    analyseur.add_argument("-m", type=int, default=3)
+    analyseur.add_argument("-n", type=int, default=3)
+    analyseur.add_argument("-k", type=int, default=3)
+    analyseur.add_argument("-e", "--parties", type=int, default=200000, help="parties à jouer (défaut: 200000)")
+    analyseur.add_argument("-t", "--taille", type=int, default=4096, help="parties jouées en même temps")
+    analyseur.add_argument("-s", "--sauvegarde", type=int, default=50000, help="parties entre deux sauvegardes")
+    analyseur.add_argument("--pas", type=float, default=0.1, help="pas d'apprentissage (défaut: 0.1)")
+    analyseur.add_argument("--hasard", type=float, default=0.1, help="probabilité d'exploration (défaut: 0.1)")
+    analyseur.add_argument("-o", "--sortie", default=None, help="chemin de la table (défaut: appris_MxNxK.bin)")
+    arguments = analyseur.parse_args()
+    m, n, k = arguments.m, arguments.n, arguments.k
+    assert m * n <= 16, "Apprentissage: la table est limitée aux plateaux de 16 cases."
+
+    sortie = arguments.sortie or chemin_apprenti(m, n, k)
+    nb_parties = nb_pas = 0
+    if os.path.exists(sortie):
+        format_, valeurs, nb_parties, nb_pas = lire(sortie)
+        assert format_ == (m, n, k), "Apprentissage: la table existante est d'un autre format."
+        print("Reprise après {} parties.".format(nb_parties))
+    else:
+        valeurs = np.zeros(3 ** (m * n), dtype=np.float32)
+
+    debut = time.perf_counter()
+    while nb_parties < arguments.parties:
+        # La graine dépend de l'avancement, pour qu'une reprise ne rejoue pas les mêmes parties.
+        terminees, pas_joues = entrainer(valeurs, m, n, k, min(arguments.sauvegarde, arguments.parties - nb_parties),
+                                         arguments.taille, arguments.pas, arguments.hasard, graine=nb_parties)
+        nb_parties += terminees
+        nb_pas += pas_joues
+        ecrire(sortie, m, n, k, valeurs, nb_parties, nb_pas)
+        gagnees, nulles, perdues = evaluer(valeurs, m, n, k)
+        print("{:>10} parties ({:.1f} s): contre le hasard, {} gagnées, {} nulles, {} perdues".format(
+            nb_parties, time.perf_counter() - debut, gagnees, nulles, perdues))
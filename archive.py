@@ -0,0 +1,231 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le format binaire d'archive des parties. Chaque partie occupe un enregistrement de taille
+fixe: l'horodatage, la suite des coups à raison de deux coups par octet (un demi-octet par position), les deux
+joueurs, le pion du premier joueur et le résultat. L'écrivain accumule les enregistrements dans un tampon avant de
+les ajouter au fichier, et le lecteur projette le fichier en mémoire (mmap) pour le parcourir sans copie ou lire
+directement la i-ème partie.
+
+Format du fichier:
+    En-tête (8 octets):     "TTT" + version, m, n, k, taille d'un enregistrement.
+    Enregistrement:         horodatage (uint32, secondes), coups (demi-octets, ceil(m * n / 2) octets),
+                            nombre de coups, joueur 1, joueur 2, drapeaux (uint8 chacun).
+Un joueur vaut 0 pour une personne, et 1 + l'indice de son niveau dans NIVEAUX pour l'ordinateur.
+Les drapeaux contiennent le pion du joueur 1 (bit 0: 0 pour X, 1 pour O) et le résultat (bits 1 et 2).
+"""
+
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+from plateau import NIVEAUX
+
+MAGIQUE = b"TTT"
+VERSION = 1
+EN_TETE = struct.Struct("<3sBBBBB")
+
+# Résultat d'une partie, tel qu'il est stocké dans les drapeaux.
+INACHEVEE, VICTOIRE_X, VICTOIRE_O, NULLE = 0, 1, 2, 3
+
+PERSONNE = 0
+
+Enregistrement = namedtuple("Enregistrement", "horodatage coups joueur1 joueur2 pion_joueur1 resultat")
+
+# DEMI_OCTETS[octet] donne les deux positions (demi-octet bas, demi-octet haut) stockées dans un octet.
+DEMI_OCTETS = tuple((octet & 0xF, octet >> 4) for octet in range(256))
+
+
+def _format(m, n):
+    """
+    Retourne le struct d'un enregistrement pour un plateau de m x n cases.
+    """
+    return struct.Struct("<I{}sBBBB".format((m * n + 1) // 2))
+
+
+def code_joueur(joueur):
+    """
+    Retourne le code d'un Joueur dans l'archive: 0 pour une personne, 1 + l'indice du niveau pour l'ordinateur.
+    """
+    if joueur.type == "PERSONNE":
+        return PERSONNE
+    return 1 + NIVEAUX.index(joueur.niveau)
+
+
+def resultat_plateau(plateau):
+    """
+    Retourne le résultat (INACHEVEE, VICTOIRE_X, VICTOIRE_O ou NULLE) de la partie sur le plateau.
+    """
+    if plateau.est_gagnant("X"):
+        return VICTOIRE_X
+    if plateau.est_gagnant("O"):
+        return VICTOIRE_O
+    if not plateau.non_plein():
+        return NULLE
+    return INACHEVEE
+
+
+class EcrivainArchive:
+    """
+    Classe modélisant l'écriture d'une archive. Les enregistrements sont gardés dans un tampon et ajoutés
+    à la fin du fichier quand le tampon est plein, à l'appel de vider() et à la fermeture.
+
+    Attributes:
+        chemin          (str)   : Le chemin du fichier.
+        dimensions      (tuple) : Les dimensions (m, n, k) du plateau des parties de l'archive.
+        taille_tampon   (int)   : La taille du tampon, en octets.
+    """
+
+    def __init__(self, chemin, m=3, n=3, k=3, taille_tampon=1 << 20):
+        """
+        Méthode spéciale ouvrant une archive en ajout. L'en-tête est écrit si le fichier est vide,
+        sinon il doit correspondre aux dimensions données.
+
+        Args:
+            chemin (string): Le chemin du fichier.
+            m (int): Le nombre de lignes du plateau.
+            n (int): Le nombre de colonnes du plateau.
+            k (int): Le nombre de pions à aligner pour gagner.
+            taille_tampon (int): La taille du tampon, en octets.
+        """
+        assert m * n <= 16, "Archive: une position doit tenir dans un demi-octet (16 cases au plus)."
+
+        self.chemin = chemin
+        self.dimensions = (m, n, k)
+        self.taille_tampon = taille_tampon
+        self.nb_cases = m * n
+        self.format = _format(m, n)
+        self.tampon = bytearray()
+        if os.path.exists(chemin):
+            # Un enregistrement incomplet à la fin (écriture interrompue) est retiré avant d'en ajouter d'autres.
+            taille = os.path.getsize(chemin)
+            if taille > EN_TETE.size and (taille - EN_TETE.size) % self.format.size:
+                os.truncate(chemin, taille - (taille - EN_TETE.size) % self.format.size)
+        self.fichier = open(chemin, "ab")
+        if self.fichier.tell() == 0:
+            self.fichier.write(EN_TETE.pack(MAGIQUE, VERSION, m, n, k, self.format.size))
+        else:
+            with open(chemin, "rb") as fichier:
+                en_tete = EN_TETE.unpack(fichier.read(EN_TETE.size))
+            assert en_tete == (MAGIQUE, VERSION, m, n, k, self.format.size), "Archive: en-tête incompatible."
+
+    def ecrire(self, coups, joueur1, joueur2, pion_joueur1, resultat, horodatage=None):
+        """
+        Ajoute une partie au tampon.
+
+        Args:
+            coups (list): Les positions jouées (ligne * n + colonne), dans l'ordre.
+            joueur1 (int): Le code du premier joueur (voir code_joueur).
+            joueur2 (int): Le code du deuxième joueur.
+            pion_joueur1 (string): Le pion du premier joueur ("X" ou "O").
+            resultat (int): INACHEVEE, VICTOIRE_X, VICTOIRE_O ou NULLE.
+            horodatage (int): Le moment de la partie en secondes depuis l'époque (par défaut, maintenant).
+        """
+        assert len(coups) <= self.nb_cases, "Archive: trop de coups."
+        assert pion_joueur1 in ["O", "X"], "Archive: pion_joueur1 doit être 'O' ou 'X'."
+
+        paquet = bytearray(self.format.size - 8)
+        for indice, position in enumerate(coups):
+            paquet[indice >> 1] |= position << 4 * (indice & 1)
+        if horodatage is None:
+            horodatage = int(time.time())
+        drapeaux = (pion_joueur1 == "O") | resultat << 1
+        self.tampon += self.format.pack(horodatage, bytes(paquet), len(coups), joueur1, joueur2, drapeaux)
+        if len(self.tampon) >= self.taille_tampon:
+            self.vider()
+
+    def ecrire_partie(self, partie):
+        """
+        Ajoute le match qui vient de se jouer dans une Partie.
+        """
+        joueur1, joueur2 = partie.joueurs
+        coups = [position for position, _, _, _, _ in partie.plateau.historique]
+        self.ecrire(coups, code_joueur(joueur1), code_joueur(joueur2), joueur1.pion,
+                    resultat_plateau(partie.plateau))
+
+    def vider(self):
+        """
+        Ajoute le contenu du tampon à la fin du fichier.
+        """
+        if self.tampon:
+            self.fichier.write(self.tampon)
+            self.tampon.clear()
+        self.fichier.flush()
+
+    def fermer(self):
+        self.vider()
+        self.fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
+
+
+class LecteurArchive:
+    """
+    Classe modélisant la lecture d'une archive projetée en mémoire.
+
+    Attributes:
+        m, n, k         (int)   : Les dimensions du plateau des parties de l'archive.
+    """
+
+    def __init__(self, chemin):
+        """
+        Méthode spéciale ouvrant une archive en lecture.
+
+        Args:
+            chemin (string): Le chemin du fichier.
+        """
+        with open(chemin, "rb") as fichier:
+            magique, version, self.m, self.n, self.k, taille = EN_TETE.unpack(fichier.read(EN_TETE.size))
+            assert magique == MAGIQUE and version == VERSION, "Archive: fichier invalide."
+            self.format = _format(self.m, self.n)
+            assert taille == self.format.size, "Archive: taille d'enregistrement invalide."
+            # Un enregistrement incomplet à la fin (écriture interrompue) est ignoré.
+            self.nb_parties = (os.fstat(fichier.fileno()).st_size - EN_TETE.size) // taille
+            if self.nb_parties > 0:
+                self.memoire = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+                self.vue = memoryview(self.memoire)[EN_TETE.size:EN_TETE.size + self.nb_parties * taille]
+            else:
+                self.memoire = None
+                self.vue = memoryview(b"")
+
+    def _decoder(self, champs):
+        horodatage, paquet, nb_coups, joueur1, joueur2, drapeaux = champs
+        coups = []
+        for octet in paquet[:(nb_coups + 1) // 2]:
+            coups.extend(DEMI_OCTETS[octet])
+        del coups[nb_coups:]
+        return Enregistrement(horodatage, coups, joueur1, joueur2, "O" if drapeaux & 1 else "X", drapeaux >> 1)
+
+    def __len__(self):
+        return self.nb_parties
+
+    def __getitem__(self, indice):
+        """
+        Lit la partie numéro indice directement à sa position dans le fichier.
+        """
+        if indice < 0:
+            indice += self.nb_parties
+        if not 0 <= indice < self.nb_parties:
+            raise IndexError("Archive: indice hors de l'archive.")
+        return self._decoder(self.format.unpack_from(self.vue, indice * self.format.size))
+
+    def __iter__(self):
+        for champs in self.format.iter_unpack(self.vue):
+            yield self._decoder(champs)
+
+    def fermer(self):
+        self.vue.release()
+        if self.memoire is not None:
+            self.memoire.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
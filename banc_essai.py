@@ -0,0 +1,278 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le banc d'essai des chemins critiques du jeu: est_gagnant, a_gagne et non_plein sur toutes
+les positions atteignables, selectionner_case et jouer_coup, la distribution du temps de choisir_prochaine_case
+(p50, p99), Plateau.__str__ (premier affichage et affichage en cache) et les parties complètes par seconde jouées
+par Partie sans affichage.
+
+Les résultats sont écrits en JSON et peuvent être comparés à une référence sauvegardée:
+    python banc_essai.py -o resultats.json
+    python banc_essai.py --reference reference.json --seuil 0.15
+Le programme se termine avec le code 1 si une mesure est plus lente que la référence au-delà du seuil.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+
+from joueur import Joueur
+from partie import Partie
+from plateau import Plateau, _rendre
+
+# Version du format des résultats (les comparaisons n'ont de sens qu'entre résultats de même version).
+VERSION = 1
+
+
+def positions_atteignables(m=3, n=3, k=3):
+    """
+    Retourne un plateau pour chaque position atteignable depuis le plateau vide (X joue en premier, et la partie
+    s'arrête dès qu'un joueur gagne), y compris le plateau vide et les positions terminales.
+
+    Returns:
+        list: Les plateaux, dans l'ordre de leur découverte.
+    """
+    plateaux = []
+    vues = set()
+    pile = [Plateau(m, n, k)]
+    while pile:
+        plateau = pile.pop()
+        cle = (plateau.pions["X"], plateau.pions["O"])
+        if cle in vues:
+            continue
+        vues.add(cle)
+        plateaux.append(plateau)
+        if plateau.a_gagne("X") or plateau.a_gagne("O") or not plateau.non_plein():
+            continue
+        pion = "X" if len(plateau.historique) % 2 == 0 else "O"
+        for position in list(plateau.coups_legaux()):
+            suivant = Plateau(m, n, k)
+            for coup, pion_joue, _, _, _ in plateau.historique:
+                suivant.jouer_coup(coup, pion_joue)
+            suivant.jouer_coup(position, pion)
+            pile.append(suivant)
+    return plateaux
+
+
+def _centile(durees, fraction):
+    durees = sorted(durees)
+    return durees[min(len(durees) - 1, int(fraction * len(durees)))]
+
+
+def mesurer(fonction, nb_operations, repetitions):
+    """
+    Exécute fonction() plusieurs fois et retourne le meilleur temps moyen par opération, en nanosecondes.
+    fonction() doit faire nb_operations opérations.
+    """
+    meilleur = None
+    for _ in range(repetitions):
+        debut = time.perf_counter_ns()
+        fonction()
+        duree = (time.perf_counter_ns() - debut) / nb_operations
+        if meilleur is None or duree < meilleur:
+            meilleur = duree
+    return meilleur
+
+
+def banc_est_gagnant(plateaux, repetitions):
+    def executer():
+        for plateau in plateaux:
+            plateau.est_gagnant("X")
+            plateau.est_gagnant("O")
+    return {"ns": mesurer(executer, 2 * len(plateaux), repetitions), "operations": 2 * len(plateaux)}
+
+
+def banc_a_gagne(plateaux, repetitions):
+    def executer():
+        for plateau in plateaux:
+            plateau.a_gagne("X")
+            plateau.a_gagne("O")
+    return {"ns": mesurer(executer, 2 * len(plateaux), repetitions), "operations": 2 * len(plateaux)}
+
+
+def banc_non_plein(plateaux, repetitions):
+    def executer():
+        for plateau in plateaux:
+            plateau.non_plein()
+    return {"ns": mesurer(executer, len(plateaux), repetitions), "operations": len(plateaux)}
+
+
+def banc_str(plateaux, repetitions):
+    """
+    Mesure le premier affichage de chaque position: le cache de _rendre est vidé avant chaque passage.
+    """
+    def executer():
+        _rendre.cache_clear()
+        for plateau in plateaux:
+            str(plateau)
+    return {"ns": mesurer(executer, len(plateaux), repetitions), "operations": len(plateaux)}
+
+
+def banc_str_cache(plateaux, repetitions):
+    """
+    Mesure l'affichage d'une position déjà affichée: un premier passage remplit le cache de _rendre, qui garde
+    toutes les positions atteignables du plateau de 3 x 3.
+    """
+    for plateau in plateaux:
+        str(plateau)
+
+    def executer():
+        for plateau in plateaux:
+            str(plateau)
+    avant = _rendre.cache_info()
+    ns = mesurer(executer, len(plateaux), repetitions)
+    apres = _rendre.cache_info()
+    succes, echecs = apres.hits - avant.hits, apres.misses - avant.misses
+    return {"ns": ns, "taux_succes": succes / (succes + echecs), "operations": len(plateaux)}
+
+
+def banc_selectionner_case(repetitions, nb_parties=2000):
+    # Une suite de coups qui remplit le plateau sans victoire (partie nulle).
+    coups = [(0, 0, "X"), (1, 1, "O"), (2, 2, "X"), (0, 1, "O"), (2, 1, "X"), (2, 0, "O"), (0, 2, "X"),
+             (1, 2, "O"), (1, 0, "X")]
+    plateau = Plateau()
+
+    def executer():
+        for _ in range(nb_parties):
+            plateau.initialiser()
+            for ligne, colonne, pion in coups:
+                plateau.selectionner_case(ligne, colonne, pion)
+    return {"ns": mesurer(executer, nb_parties * len(coups), repetitions), "operations": nb_parties * len(coups)}
+
+
+def banc_jouer_coup(repetitions, nb_parties=2000):
+    # La même partie nulle que banc_selectionner_case, par l'interface de confiance.
+    coups = [(0, "X"), (4, "O"), (8, "X"), (1, "O"), (7, "X"), (6, "O"), (2, "X"), (5, "O"), (3, "X")]
+    plateau = Plateau()
+
+    def executer():
+        for _ in range(nb_parties):
+            plateau.initialiser()
+            for position, pion in coups:
+                plateau.jouer_coup(position, pion)
+    return {"ns": mesurer(executer, nb_parties * len(coups), repetitions), "operations": nb_parties * len(coups)}
+
+
+def banc_choisir_prochaine_case(plateaux, niveau):
+    """
+    Mesure chaque appel séparément sur toutes les positions non terminales, pour en tirer la distribution.
+    """
+    durees = []
+    for plateau in plateaux:
+        if plateau.a_gagne("X") or plateau.a_gagne("O") or not plateau.non_plein():
+            continue
+        # Le pion passé est celui de l'adversaire de l'ordinateur, qui vient de jouer.
+        adversaire = "O" if len(plateau.historique) % 2 == 0 else "X"
+        debut = time.perf_counter_ns()
+        plateau.choisir_prochaine_case(adversaire, niveau)
+        durees.append(time.perf_counter_ns() - debut)
+    return {
+        "ns": sum(durees) / len(durees),
+        "p50_ns": _centile(durees, 0.50),
+        "p99_ns": _centile(durees, 0.99),
+        "operations": len(durees),
+    }
+
+
+def banc_parties(niveau, repetitions, nb_parties=300):
+    """
+    Joue des parties complètes entre deux ordinateurs par Partie.tour, l'affichage étant redirigé.
+    """
+    partie = Partie()
+    partie.joueurs = [Joueur("ORDINATEUR", "X", "1", "Colosse 1", niveau),
+                      Joueur("ORDINATEUR", "O", "2", "Colosse 2", niveau)]
+
+    def executer():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(nb_parties):
+                partie.tour(1)
+    ns = mesurer(executer, nb_parties, repetitions)
+    return {"ns": ns, "parties_par_s": 1e9 / ns, "operations": nb_parties}
+
+
+def executer_banc(repetitions=5, niveaux=("normal", "parfait")):
+    """
+    Exécute tous les bancs d'essai.
+
+    Returns:
+        dict: Les résultats, par nom de banc d'essai.
+    """
+    plateaux = positions_atteignables()
+    resultats = {
+        "est_gagnant": banc_est_gagnant(plateaux, repetitions),
+        "a_gagne": banc_a_gagne(plateaux, repetitions),
+        "non_plein": banc_non_plein(plateaux, repetitions),
+        "selectionner_case": banc_selectionner_case(repetitions),
+        "jouer_coup": banc_jouer_coup(repetitions),
+        "str": banc_str(plateaux, repetitions),
+        "str.cache": banc_str_cache(plateaux, repetitions),
+    }
+    for niveau in niveaux:
+        # Un premier appel hors mesure pour les tables construites au premier coup.
+        Plateau().choisir_prochaine_case("O", niveau)
+        resultats["choisir_prochaine_case." + niveau] = banc_choisir_prochaine_case(plateaux, niveau)
+        resultats["partie." + niveau] = banc_parties(niveau, repetitions)
+    return resultats
+
+
+def comparer(resultats, reference, seuil):
+    """
+    Compare des résultats à une référence.
+
+    Args:
+        resultats (dict): Les résultats de executer_banc().
+        reference (dict): Les résultats de référence.
+        seuil (float): La hausse relative tolérée (0.1 pour 10 %).
+
+    Returns:
+        list: Les régressions (nom, mesure, valeur de référence, valeur actuelle).
+    """
+    regressions = []
+    for nom, mesures in resultats.items():
+        if nom not in reference:
+            continue
+        for mesure in ("ns", "p99_ns"):
+            if mesure in mesures and mesure in reference[nom]:
+                if mesures[mesure] > reference[nom][mesure] * (1 + seuil):
+                    regressions.append((nom, mesure, reference[nom][mesure], mesures[mesure]))
+    return regressions
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Banc d'essai des chemins critiques du jeu.")
+    analyseur.add_argument("-r", "--repetitions", type=int, default=5)
+    analyseur.add_argument("-o", "--sortie", default=None, help="fichier JSON des résultats (défaut: la console)")
+    analyseur.add_argument("--reference", default=None, help="fichier JSON de référence à comparer")
+    analyseur.add_argument("--seuil", type=float, default=0.10, help="hausse relative tolérée (défaut: 0.10)")
+    analyseur.add_argument("niveaux", nargs="*", default=["normal", "parfait"])
+    arguments = analyseur.parse_args()
+
+    document = {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "resultats": executer_banc(arguments.repetitions, arguments.niveaux),
+    }
+    texte = json.dumps(document, indent=2, ensure_ascii=False)
+    if arguments.sortie:
+        with open(arguments.sortie, "w", encoding="utf-8") as fichier:
+            fichier.write(texte + "\n")
+    else:
+        print(texte)
+
+    if arguments.reference:
+        with open(arguments.reference, encoding="utf-8") as fichier:
+            reference = json.load(fichier)
+        assert reference.get("version") == VERSION, "Banc d'essai: version de référence incompatible."
+        regressions = comparer(document["resultats"], reference["resultats"], arguments.seuil)
+        for nom, mesure, avant, apres in regressions:
+            print("RÉGRESSION {} {}: {:.0f} -> {:.0f} ns (+{:.0%})".format(nom, mesure, avant, apres,
+                                                                        apres / avant - 1), file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("Aucune régression au-delà de {:.0%}.".format(arguments.seuil), file=sys.stderr)
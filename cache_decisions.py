@@ -0,0 +1,154 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le cache des décisions de l'ordinateur, partagé par toutes les parties du processus
+(par exemple, toutes les sessions du serveur). Une décision est gardée sous la forme canonique de la position
+(la même pour toutes ses images symétriques) et le niveau de l'ordinateur: une position déjà vue dans une autre
+partie, ou une de ses images, ne demande plus de recherche.
+
+Le cache est borné par une estimation de sa mémoire et retire les décisions utilisées le moins récemment (LRU).
+Il est partagé en fragments, chacun protégé par son propre verrou: des fils qui consultent des positions
+différentes se bloquent rarement. La recherche d'une décision absente se fait hors verrou.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import instrumentation
+from livre import forme_canonique
+from plateau import symetries
+
+# Surcoût approximatif (en octets) d'une entrée, en plus de l'entier de la forme canonique: le nœud de
+# l'OrderedDict, le tuple de la clé et le coup.
+SURCOUT_ENTREE = 200
+
+
+@lru_cache(maxsize=None)
+def _reperes(m, n):
+    permutations = symetries(m, n)
+    inverses = tuple(tuple(permutation.index(p) for p in range(m * n)) for permutation in permutations)
+    return permutations, inverses
+
+
+def _taille(cle):
+    return sys.getsizeof(cle[4]) + SURCOUT_ENTREE
+
+
+class _Fragment:
+    """
+    Classe modélisant un fragment du cache: ses entrées (de la moins récemment utilisée à la plus récente),
+    son verrou et ses compteurs.
+    """
+
+    def __init__(self, octets_max):
+        self.verrou = threading.Lock()
+        self.entrees = OrderedDict()
+        self.octets = 0
+        self.octets_max = octets_max
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+
+
+class CacheDecisions:
+    """
+    Classe modélisant le cache des décisions de l'ordinateur.
+
+    Attributes:
+        octets_max      (int)   : La mémoire maximale (estimée) des entrées.
+        fragments       (list)  : Les fragments du cache, chacun avec sa part de la mémoire.
+    """
+
+    def __init__(self, octets_max=64 * 2 ** 20, nb_fragments=16):
+        """
+        Méthode spéciale initialisant un cache vide.
+
+        Args:
+            octets_max (int): La mémoire maximale (estimée) des entrées.
+            nb_fragments (int): Le nombre de fragments (et de verrous).
+        """
+        assert isinstance(octets_max, int) and octets_max > 0, "CacheDecisions: octets_max doit être positif."
+        assert isinstance(nb_fragments, int) and nb_fragments > 0, "CacheDecisions: nb_fragments doit être positif."
+        self.octets_max = octets_max
+        self.fragments = [_Fragment(octets_max // nb_fragments) for _ in range(nb_fragments)]
+
+    def obtenir(self, m, n, k, niveau, joueur, adversaire, calculer):
+        """
+        Retourne la décision de l'ordinateur pour une position, lue dans le cache ou calculée puis ajoutée.
+
+        Args:
+            m, n, k (int): Le format du plateau.
+            niveau (string): Le niveau de l'ordinateur.
+            joueur (int): Le bitboard de l'ordinateur, dont c'est le tour.
+            adversaire (int): Le bitboard de son adversaire.
+            calculer (callable): Fonction sans argument qui calcule la décision (ligne * n + colonne).
+
+        Returns:
+            int: La position de la case à jouer.
+        """
+        permutations, inverses = _reperes(m, n)
+        canonique, symetrie = forme_canonique(joueur, adversaire, permutations, m * n)
+        cle = (m, n, k, niveau, canonique)
+        fragment = self.fragments[hash(cle) % len(self.fragments)]
+        with fragment.verrou:
+            coup = fragment.entrees.get(cle)
+            if coup is not None:
+                fragment.entrees.move_to_end(cle)
+                fragment.succes += 1
+            else:
+                fragment.echecs += 1
+        if coup is not None:
+            if instrumentation.mesures is not None:
+                instrumentation.mesures.compter("cache_decisions", resultat="succes")
+            return inverses[symetrie][coup]
+
+        position = calculer()
+        retirees = 0
+        with fragment.verrou:
+            if cle not in fragment.entrees:
+                fragment.entrees[cle] = permutations[symetrie][position]
+                fragment.octets += _taille(cle)
+                while fragment.octets > fragment.octets_max and len(fragment.entrees) > 1:
+                    ancienne, _ = fragment.entrees.popitem(last=False)
+                    fragment.octets -= _taille(ancienne)
+                    retirees += 1
+                fragment.evictions += retirees
+        if instrumentation.mesures is not None:
+            instrumentation.mesures.compter("cache_decisions", resultat="echec")
+            if retirees:
+                instrumentation.mesures.compter("cache_decisions_evictions", retirees)
+        return position
+
+    def vider(self):
+        """
+        Retire toutes les décisions (les compteurs sont conservés).
+        """
+        for fragment in self.fragments:
+            with fragment.verrou:
+                fragment.entrees.clear()
+                fragment.octets = 0
+
+    def statistiques(self):
+        """
+        Retourne les compteurs du cache, additionnés sur tous les fragments.
+
+        Returns:
+            dict: Les entrées, la mémoire estimée, les succès, les échecs, les évictions et le taux de succès.
+        """
+        totaux = {"entrees": 0, "octets": 0, "succes": 0, "echecs": 0, "evictions": 0}
+        for fragment in self.fragments:
+            with fragment.verrou:
+                totaux["entrees"] += len(fragment.entrees)
+                totaux["octets"] += fragment.octets
+                totaux["succes"] += fragment.succes
+                totaux["echecs"] += fragment.echecs
+                totaux["evictions"] += fragment.evictions
+        consultations = totaux["succes"] + totaux["echecs"]
+        totaux["taux_succes"] = totaux["succes"] / consultations if consultations else 0.0
+        return totaux
+
+
+# Le cache partagé par toutes les parties du processus.
+cache = CacheDecisions()
@@ -0,0 +1,129 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient l'instrumentation du jeu: des compteurs et des histogrammes à intervalles fixes, remplis
+par Partie.tour (durée de chaque tour), par le tour de l'ordinateur (temps de réflexion) et par
+Plateau.choisir_prochaine_case (branche qui a décidé du coup: gagner, bloquer, hasard, ou le niveau de recherche).
+
+L'instrumentation s'active et se désactive pendant l'exécution. Désactivée, mesures vaut None et chaque point de
+mesure ne coûte qu'un test:
+    if instrumentation.mesures is not None:
+        instrumentation.mesures.compter("decisions", branche="gagner")
+Les mises à jour ne prennent pas de verrou: si plusieurs fils jouent des coups en même temps (par exemple les
+fils du serveur), un incrément peut rarement se perdre, ce qui est acceptable pour des statistiques de latence.
+"""
+
+import json
+from bisect import bisect_left
+
+# Bornes supérieures (en nanosecondes) des intervalles des histogrammes: de 1 µs à 10 s.
+BORNES_NS = tuple(int(facteur * 10 ** exposant) for exposant in range(3, 10) for facteur in (1, 2.5, 5)) + (10 ** 10,)
+
+PREFIXE = "tictactoe_"
+
+# Les mesures courantes, ou None si l'instrumentation est désactivée.
+mesures = None
+
+
+class Histogramme:
+    """
+    Classe modélisant un histogramme de durées à intervalles fixes.
+
+    Attributes:
+        comptes     (list)  : Le nombre d'observations par intervalle (le dernier compte celles au-delà des bornes).
+        somme       (int)   : La somme des observations, en nanosecondes.
+        nombre      (int)   : Le nombre d'observations.
+    """
+
+    def __init__(self):
+        self.comptes = [0] * (len(BORNES_NS) + 1)
+        self.somme = 0
+        self.nombre = 0
+
+    def observer(self, duree_ns):
+        self.comptes[bisect_left(BORNES_NS, duree_ns)] += 1
+        self.somme += duree_ns
+        self.nombre += 1
+
+
+class Mesures:
+    """
+    Classe modélisant un ensemble de compteurs et d'histogrammes, indexés par nom et par étiquettes.
+    """
+
+    def __init__(self):
+        self.compteurs = {}
+        self.histogrammes = {}
+
+    def compter(self, nom, increment=1, **etiquettes):
+        cle = (nom, tuple(etiquettes.items()))
+        self.compteurs[cle] = self.compteurs.get(cle, 0) + increment
+
+    def observer(self, nom, duree_ns, **etiquettes):
+        cle = (nom, tuple(etiquettes.items()))
+        histogramme = self.histogrammes.get(cle)
+        if histogramme is None:
+            histogramme = self.histogrammes[cle] = Histogramme()
+        histogramme.observer(duree_ns)
+
+    def en_json(self):
+        """
+        Retourne les mesures en JSON.
+        """
+        return json.dumps({
+            "bornes_ns": BORNES_NS,
+            "compteurs": [{"nom": nom, "etiquettes": dict(etiquettes), "valeur": valeur}
+                          for (nom, etiquettes), valeur in sorted(self.compteurs.items())],
+            "histogrammes": [{"nom": nom, "etiquettes": dict(etiquettes), "comptes": h.comptes,
+                              "somme_ns": h.somme, "nombre": h.nombre}
+                             for (nom, etiquettes), h in sorted(self.histogrammes.items())],
+        }, ensure_ascii=False)
+
+    def en_prometheus(self):
+        """
+        Retourne les mesures au format texte de Prometheus (les durées y sont en secondes).
+        """
+        def etiqueter(etiquettes, *supplementaires):
+            paires = ['{}="{}"'.format(cle, str(valeur).replace("\\", "\\\\").replace('"', '\\"'))
+                      for cle, valeur in etiquettes + supplementaires]
+            return "{" + ",".join(paires) + "}" if paires else ""
+
+        lignes = []
+        types = set()
+        for (nom, etiquettes), valeur in sorted(self.compteurs.items()):
+            nom = PREFIXE + nom + "_total"
+            if nom not in types:
+                types.add(nom)
+                lignes.append("# TYPE {} counter".format(nom))
+            lignes.append("{}{} {}".format(nom, etiqueter(etiquettes), valeur))
+        for (nom, etiquettes), histogramme in sorted(self.histogrammes.items()):
+            nom = PREFIXE + nom + "_secondes"
+            if nom not in types:
+                types.add(nom)
+                lignes.append("# TYPE {} histogram".format(nom))
+            cumul = 0
+            for borne, compte in zip(BORNES_NS, histogramme.comptes):
+                cumul += compte
+                lignes.append("{}_bucket{} {}".format(nom, etiqueter(etiquettes, ("le", repr(borne / 1e9))), cumul))
+            lignes.append("{}_bucket{} {}".format(nom, etiqueter(etiquettes, ("le", "+Inf")), histogramme.nombre))
+            lignes.append("{}_sum{} {}".format(nom, etiqueter(etiquettes), histogramme.somme / 1e9))
+            lignes.append("{}_count{} {}".format(nom, etiqueter(etiquettes), histogramme.nombre))
+        return "\n".join(lignes) + "\n"
+
+
+def activer():
+    """
+    Active l'instrumentation avec des mesures vides et les retourne.
+    """
+    global mesures
+    mesures = Mesures()
+    return mesures
+
+
+def desactiver():
+    """
+    Désactive l'instrumentation et retourne les dernières mesures (ou None).
+    """
+    global mesures
+    anciennes, mesures = mesures, None
+    return anciennes
@@ -0,0 +1,212 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le livre de coups de l'ordinateur au niveau "livre": un fichier binaire où les positions,
+réduites par symétrie, sont triées par clé avec leur meilleur coup et leur valeur théorique. Le fichier est
+projeté en mémoire (mmap) au premier coup de l'ordinateur seulement, et chaque coup est une recherche dichotomique
+dans le tableau des clés. Plusieurs processus partagent ainsi la même copie du fichier en mémoire.
+
+Le fichier est produit par ce même module, exécuté en ligne de commande:
+    python livre.py [-m 3] [-n 3] [-k 3] [-p profondeur] [-o chemin]
+
+Format du fichier (ordre des octets petit-boutiste):
+    En-tête (16 octets):    "LIVR", version, m, n, k, nombre d'entrées (uint64).
+    Clés:                   nombre * uint64, triées (joueur << m * n | adversaire, forme canonique).
+    Coups:                  nombre * uint8, le meilleur coup dans le repère de la forme canonique.
+    Valeurs:                nombre * int8, 1 si le joueur dont c'est le tour gagne, 0 si nulle, -1 s'il perd.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+
+from plateau import lignes_par_case, symetries
+
+MAGIQUE = b"LIVR"
+VERSION = 1
+EN_TETE = struct.Struct("<4sBBBBQ")
+
+
+def chemin_livre(m=3, n=3, k=3):
+    """
+    Retourne le chemin par défaut du livre d'un format de plateau (à côté de ce module).
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "livre_{}x{}x{}.bin".format(m, n, k))
+
+
+def _image(bits, permutation):
+    resultat = 0
+    while bits:
+        bas = bits & -bits
+        resultat |= 1 << permutation[bas.bit_length() - 1]
+        bits ^= bas
+    return resultat
+
+
+def forme_canonique(joueur, adversaire, permutations, nb_cases):
+    """
+    Retourne la plus petite clé (joueur << nb_cases | adversaire) parmi les images symétriques de la position,
+    et l'indice de la symétrie qui y mène.
+    """
+    cle, symetrie = None, 0
+    for s, permutation in enumerate(permutations):
+        candidate = _image(joueur, permutation) << nb_cases | _image(adversaire, permutation)
+        if cle is None or candidate < cle:
+            cle, symetrie = candidate, s
+    return cle, symetrie
+
+
+class Livre:
+    """
+    Classe modélisant un livre ouvert en lecture, projeté en mémoire.
+
+    Attributes:
+        m, n, k     (int)   : Le format de plateau du livre.
+        nombre      (int)   : Le nombre de positions du livre.
+    """
+
+    def __init__(self, chemin):
+        """
+        Méthode spéciale ouvrant un livre.
+
+        Args:
+            chemin (string): Le chemin du fichier.
+        """
+        assert sys.byteorder == "little", "Livre: les clés sont lues dans l'ordre natif (petit-boutiste)."
+        with open(chemin, "rb") as fichier:
+            self.memoire = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, version, self.m, self.n, self.k, self.nombre = EN_TETE.unpack_from(self.memoire)
+        assert magique == MAGIQUE and version == VERSION, "Livre: fichier invalide."
+        assert len(self.memoire) == EN_TETE.size + 10 * self.nombre, "Livre: taille de fichier invalide."
+
+        vue = memoryview(self.memoire)
+        debut = EN_TETE.size
+        self.cles = vue[debut:debut + 8 * self.nombre].cast("Q")
+        debut += 8 * self.nombre
+        self.coups = vue[debut:debut + self.nombre]
+        self.valeurs = vue[debut + self.nombre:].cast("b")
+
+        self.nb_cases = self.m * self.n
+        self.permutations = symetries(self.m, self.n)
+        self.inverses = tuple(
+            tuple(permutation.index(position) for position in range(self.nb_cases))
+            for permutation in self.permutations
+        )
+
+    def chercher(self, joueur, adversaire):
+        """
+        Cherche une position dans le livre.
+
+        Args:
+            joueur (int): Le bitboard du joueur dont c'est le tour.
+            adversaire (int): Le bitboard de son adversaire.
+
+        Returns:
+            (int,int): Le meilleur coup (ligne * n + colonne) et la valeur de la position, ou None si la position
+                       n'est pas dans le livre.
+        """
+        cle, symetrie = forme_canonique(joueur, adversaire, self.permutations, self.nb_cases)
+        indice = bisect_left(self.cles, cle)
+        if indice == self.nombre or self.cles[indice] != cle:
+            return None
+        return self.inverses[symetrie][self.coups[indice]], self.valeurs[indice]
+
+
+# Livres ouverts par le processus, un par format de plateau (None si le fichier n'existe pas).
+_livres = {}
+
+
+def livre(m=3, n=3, k=3):
+    """
+    Retourne le livre d'un format de plateau, ouvert au premier appel, ou None s'il n'a pas été produit.
+    """
+    if (m, n, k) not in _livres:
+        chemin = chemin_livre(m, n, k)
+        _livres[m, n, k] = Livre(chemin) if os.path.exists(chemin) else None
+    return _livres[m, n, k]
+
+
+def ecrire_livre(chemin, m=3, n=3, k=3, profondeur=None):
+    """
+    Résout toutes les positions atteignables en moins de profondeur coups (réduites par symétrie) avec une
+    recherche alpha-bêta exacte, puis écrit le livre. Le fichier est remplacé d'un coup: les processus qui
+    ont encore l'ancien livre projeté en mémoire ne sont pas dérangés.
+
+    Args:
+        chemin (string): Le chemin du fichier à écrire.
+        m (int): Le nombre de lignes du plateau.
+        n (int): Le nombre de colonnes du plateau.
+        k (int): Le nombre de pions à aligner pour gagner.
+        profondeur (int): Le nombre de coups déjà joués au-delà duquel on arrête (par défaut, toute la partie).
+
+    Returns:
+        int: Le nombre de positions du livre.
+    """
+    assert m * n <= 16, "Livre: la recherche exacte est limitée aux plateaux de 16 cases."
+    from recherche import Moteur
+
+    nb_cases = m * n
+    plein = (1 << nb_cases) - 1
+    if profondeur is None:
+        profondeur = nb_cases
+    permutations = symetries(m, n)
+    lignes = lignes_par_case(m, n, k)
+    moteur = Moteur(m, n, k)
+
+    entrees = {}
+    niveau = [(0, 0)]
+    for _ in range(profondeur):
+        suivant = []
+        for joueur, adversaire in niveau:
+            cle, s = forme_canonique(joueur, adversaire, permutations, nb_cases)
+            if cle in entrees:
+                continue
+            # La recherche se fait sur la forme canonique, pour que le coup soit dans son repère.
+            joueur, adversaire = _image(joueur, permutations[s]), _image(adversaire, permutations[s])
+            coup = moteur.choisir_coup(joueur, adversaire)
+            valeur = moteur.statistiques["valeur"]
+            entrees[cle] = (coup, (valeur > 0) - (valeur < 0))
+
+            occupees = joueur | adversaire
+            for position in range(nb_cases):
+                if occupees >> position & 1:
+                    continue
+                essai = joueur | 1 << position
+                gagne = any(essai & masque == masque for masque in lignes[position])
+                if not gagne and essai | adversaire != plein:
+                    suivant.append((adversaire, essai))
+        niveau = suivant
+
+    cles = array("Q", sorted(entrees))
+    coups = bytes(entrees[cle][0] for cle in cles)
+    valeurs = array("b", (entrees[cle][1] for cle in cles))
+    if sys.byteorder != "little":
+        cles.byteswap()
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "wb") as fichier:
+        fichier.write(EN_TETE.pack(MAGIQUE, VERSION, m, n, k, len(cles)))
+        fichier.write(cles.tobytes())
+        fichier.write(coups)
+        fichier.write(valeurs.tobytes())
+    os.replace(temporaire, chemin)
+    return len(cles)
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Produit le livre de coups d'un format de plateau.")
+    analyseur.add_argument("-m", type=int, default=3)
+    analyseur.add_argument("-n", type=int, default=3)
+    analyseur.add_argument("-k", type=int, default=3)
+    analyseur.add_argument("-p", "--profondeur", type=int, default=None, help="coups joués au plus (défaut: tous)")
+    analyseur.add_argument("-o", "--sortie", default=None, help="chemin du livre (défaut: livre_MxNxK.bin)")
+    arguments = analyseur.parse_args()
+
+    sortie = arguments.sortie or chemin_livre(arguments.m, arguments.n, arguments.k)
+    debut = time.perf_counter()
+    nombre = ecrire_livre(sortie, arguments.m, arguments.n, arguments.k, arguments.profondeur)
+    print("{} positions écrites dans {} en {:.2f} s".format(nombre, sortie, time.perf_counter() - debut))
@@ -0,0 +1,242 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le joueur de l'ordinateur au niveau "mcts": une recherche arborescente Monte-Carlo (UCT)
+qui s'arrête après un budget de temps en millisecondes et retourne le meilleur coup trouvé. Les nœuds de l'arbre
+sont rangés dans un bassin réutilisé d'un tour à l'autre d'une même partie, et les parties aléatoires ne manipulent
+que des bitboards."""
+
+import math
+import random
+import time
+
+from plateau import lignes_par_case
+
+# État d'un nœud selon le coup qui y mène: partie en cours, victoire du joueur qui vient de jouer, ou partie nulle.
+EN_COURS, VICTOIRE, NULLE = 0, 1, 2
+
+
+class MCTS:
+    """
+    Classe modélisant la recherche Monte-Carlo. Les positions sont vues du point de vue du joueur dont
+    c'est le tour (joueur, adversaire).
+
+    Les nœuds sont des indices dans des listes parallèles (le bassin). Les nœuds qui ne servent plus,
+    par exemple les branches abandonnées après un coup, sont recyclés plutôt que réalloués.
+
+    Attributes:
+        budget_ms       (float) : Le temps de réflexion par coup, en millisecondes.
+        exploration     (float) : La constante d'exploration de la formule UCB1.
+        statistiques    (dict)  : Les itérations, la taille du bassin et les visites réutilisées au dernier coup.
+    """
+
+    def __init__(self, m=3, n=3, k=3, budget_ms=100, exploration=1.4, graine=None):
+        """
+        Méthode spéciale initialisant une recherche Monte-Carlo.
+
+        Args:
+            m (int): Le nombre de lignes du plateau.
+            n (int): Le nombre de colonnes du plateau.
+            k (int): Le nombre de pions à aligner pour gagner.
+            budget_ms (float): Le temps de réflexion par coup, en millisecondes.
+            exploration (float): La constante d'exploration de la formule UCB1.
+            graine (int): La graine du générateur aléatoire.
+        """
+        self.nb_cases = m * n
+        self.plein = (1 << m * n) - 1
+        self.lignes_par_case = lignes_par_case(m, n, k)
+        self.budget_ms = budget_ms
+        self.exploration = exploration
+        self.generateur = random.Random(graine)
+        self.statistiques = {}
+
+        # Le bassin de nœuds: le nœud i est décrit par l'entrée i de chacune de ces listes.
+        self.parents = []
+        self.coups = []         # Le coup qui mène au nœud.
+        self.etats = []         # EN_COURS, VICTOIRE ou NULLE après ce coup.
+        self.visites = []
+        self.gains = []         # Du point de vue du joueur qui a joué le coup menant au nœud.
+        self.enfants = []
+        self.a_essayer = []     # Les coups pas encore développés (None tant que le nœud n'a pas été visité).
+        self.recyclables = []
+
+        self.racine = None
+        self.etat_racine = None
+
+    def _nouveau_noeud(self, parent, coup, etat):
+        if self.recyclables:
+            noeud = self.recyclables.pop()
+            self.parents[noeud] = parent
+            self.coups[noeud] = coup
+            self.etats[noeud] = etat
+            self.visites[noeud] = 0
+            self.gains[noeud] = 0.0
+            self.enfants[noeud].clear()
+            self.a_essayer[noeud] = None
+        else:
+            noeud = len(self.parents)
+            self.parents.append(parent)
+            self.coups.append(coup)
+            self.etats.append(etat)
+            self.visites.append(0)
+            self.gains.append(0.0)
+            self.enfants.append([])
+            self.a_essayer.append(None)
+        return noeud
+
+    def _recycler(self, noeud, sauf=None):
+        """
+        Remet dans le bassin le sous-arbre du nœud, à l'exception du sous-arbre sauf.
+        """
+        pile = [noeud]
+        while pile:
+            courant = pile.pop()
+            if courant == sauf:
+                continue
+            pile.extend(self.enfants[courant])
+            self.recyclables.append(courant)
+
+    def _complete_ligne(self, bits, position):
+        for masque in self.lignes_par_case[position]:
+            if bits & masque == masque:
+                return True
+        return False
+
+    def _placer_racine(self, joueur, adversaire):
+        """
+        Place la racine sur la position donnée. Si elle se trouve à un ou deux coups de l'ancienne racine
+        (le coup de l'ordinateur, puis la réponse de l'adversaire), son sous-arbre est conservé.
+
+        Returns:
+            int: Le nombre de visites déjà accumulées à la nouvelle racine.
+        """
+        nouvelle = None
+        if self.racine is not None:
+            candidats = [(self.racine, self.etat_racine)]
+            for profondeur in range(3):
+                suivants = []
+                for noeud, (j, a) in candidats:
+                    if (j, a) == (joueur, adversaire):
+                        nouvelle = noeud
+                        break
+                    if profondeur < 2:
+                        for enfant in self.enfants[noeud]:
+                            suivants.append((enfant, (a, j | 1 << self.coups[enfant])))
+                if nouvelle is not None:
+                    break
+                candidats = suivants
+            if nouvelle is None:
+                self._recycler(self.racine)
+            else:
+                self._recycler(self.racine, sauf=nouvelle)
+        if nouvelle is None:
+            nouvelle = self._nouveau_noeud(-1, -1, EN_COURS)
+        self.parents[nouvelle] = -1
+        self.racine = nouvelle
+        self.etat_racine = (joueur, adversaire)
+        return self.visites[nouvelle]
+
+    def _partie_aleatoire(self, joueur, adversaire):
+        """
+        Termine la partie au hasard à partir de la position, en ne manipulant que des entiers.
+
+        Returns:
+            float: 1 si le joueur dont c'est le tour gagne, 0 s'il perd, 0.5 pour une partie nulle.
+        """
+        occupees = joueur | adversaire
+        libres = [p for p in range(self.nb_cases) if not occupees >> p & 1]
+        self.generateur.shuffle(libres)
+        resultat = 1.0
+        for position in libres:
+            joueur |= 1 << position
+            if self._complete_ligne(joueur, position):
+                return resultat
+            joueur, adversaire = adversaire, joueur
+            resultat = 1.0 - resultat
+        return 0.5
+
+    def _iteration(self):
+        noeud = self.racine
+        joueur, adversaire = self.etat_racine
+        chemin = [noeud]
+
+        # Sélection (UCB1) puis développement d'un nouveau nœud.
+        while self.etats[noeud] == EN_COURS:
+            a_essayer = self.a_essayer[noeud]
+            if a_essayer is None:
+                occupees = joueur | adversaire
+                a_essayer = [p for p in range(self.nb_cases) if not occupees >> p & 1]
+                self.generateur.shuffle(a_essayer)
+                self.a_essayer[noeud] = a_essayer
+            if a_essayer:
+                coup = a_essayer.pop()
+                joueur |= 1 << coup
+                if self._complete_ligne(joueur, coup):
+                    etat = VICTOIRE
+                elif joueur | adversaire == self.plein:
+                    etat = NULLE
+                else:
+                    etat = EN_COURS
+                enfant = self._nouveau_noeud(noeud, coup, etat)
+                self.enfants[noeud].append(enfant)
+                joueur, adversaire = adversaire, joueur
+                chemin.append(enfant)
+                noeud = enfant
+                break
+            facteur = self.exploration * math.sqrt(math.log(self.visites[noeud]))
+            gains, visites = self.gains, self.visites
+            noeud = max(self.enfants[noeud],
+                        key=lambda e: gains[e] / visites[e] + facteur / math.sqrt(visites[e]))
+            joueur, adversaire = adversaire, joueur | 1 << self.coups[noeud]
+            chemin.append(noeud)
+
+        # Simulation, du point de vue du joueur qui a joué le coup menant au nœud.
+        if self.etats[noeud] == VICTOIRE:
+            resultat = 1.0
+        elif self.etats[noeud] == NULLE:
+            resultat = 0.5
+        else:
+            resultat = 1.0 - self._partie_aleatoire(joueur, adversaire)
+
+        # Rétropropagation: le résultat change de point de vue à chaque niveau.
+        for noeud in reversed(chemin):
+            self.visites[noeud] += 1
+            self.gains[noeud] += resultat
+            resultat = 1.0 - resultat
+
+    def choisir_coup(self, joueur, adversaire, budget_ms=None):
+        """
+        Cherche pendant budget_ms millisecondes et retourne le coup le plus visité à la racine.
+
+        Args:
+            joueur (int): Le bitboard du joueur dont c'est le tour.
+            adversaire (int): Le bitboard de son adversaire.
+            budget_ms (float): Le temps de réflexion (par défaut, self.budget_ms).
+
+        Returns:
+            int: La position (ligne * n + colonne) de la case à jouer.
+        """
+        assert joueur | adversaire != self.plein, "MCTS: le plateau est plein."
+
+        if budget_ms is None:
+            budget_ms = self.budget_ms
+        debut = time.perf_counter()
+        echeance = debut + budget_ms / 1000
+        visites_reutilisees = self._placer_racine(joueur, adversaire)
+
+        iterations = 0
+        while True:
+            self._iteration()
+            iterations += 1
+            if time.perf_counter() >= echeance:
+                break
+
+        meilleur = max(self.enfants[self.racine], key=lambda e: self.visites[e])
+        self.statistiques = {
+            "iterations": iterations,
+            "visites_reutilisees": visites_reutilisees,
+            "noeuds": len(self.parents) - len(self.recyclables),
+            "bassin": len(self.parents),
+            "duree": time.perf_counter() - debut,
+        }
+        return self.coups[meilleur]
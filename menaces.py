@@ -0,0 +1,114 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient l'évaluateur des menaces d'une position, pour les recherches sur les grands plateaux.
+
+Chaque ligne gagnante de k cases (une fenêtre) garde le nombre de pions de chaque joueur qu'elle contient.
+Une fenêtre qui ne contient les pions que d'un seul joueur est une menace ouverte de ce joueur, d'autant plus
+forte qu'elle en contient (deux, trois, quatre pions alignés sans pion adverse, etc.); une fenêtre qui contient
+les pions des deux joueurs ne peut plus être gagnée et ne vaut rien. La valeur d'une fenêtre est lue dans une
+table précalculée selon ses deux nombres de pions, et la valeur de la position est la somme de celles des
+fenêtres.
+
+Jouer ou annuler un coup ne met à jour que les fenêtres qui passent par sa case (au plus 4 * k): la valeur de
+la position est ainsi tenue à jour en O(k) par coup, et se lit en O(1), peu importe la taille du plateau.
+"""
+
+from plateau import lignes_par_case
+
+# Valeur heuristique d'une fenêtre ouverte pour un seul joueur selon son nombre de pions.
+POIDS = tuple(10 ** nombre if nombre else 0 for nombre in range(64))
+
+
+def table_motifs(k):
+    """
+    Retourne la table des valeurs des fenêtres: table[a][b] est la valeur d'une fenêtre contenant a pions
+    d'un joueur et b pions de son adversaire, du point de vue du joueur.
+    """
+    return tuple(
+        tuple(POIDS[a] if not b else -POIDS[b] if not a else 0 for b in range(k + 1))
+        for a in range(k + 1)
+    )
+
+
+class EvaluateurMenaces:
+    """
+    Classe modélisant l'évaluation incrémentale d'une position. Les deux joueurs sont désignés par leur côté:
+    0 et 1 (par exemple, 0 pour le joueur dont c'est le tour à la racine d'une recherche).
+
+    Attributes:
+        fenetres    (tuple) : Pour chaque case, les indices des fenêtres qui y passent.
+        comptes     (list)  : Pour chaque côté, le nombre de ses pions dans chaque fenêtre.
+        score       (int)   : La valeur de la position du point de vue du côté 0.
+    """
+
+    def __init__(self, m, n, k):
+        """
+        Méthode spéciale initialisant l'évaluateur d'un plateau vide.
+
+        Args:
+            m (int): Le nombre de lignes du plateau.
+            n (int): Le nombre de colonnes du plateau.
+            k (int): Le nombre de pions à aligner pour gagner.
+        """
+        masques_par_case = lignes_par_case(m, n, k)
+        masques = sorted(set(masque for masques_case in masques_par_case for masque in masques_case))
+        indices = {masque: indice for indice, masque in enumerate(masques)}
+        self.fenetres = tuple(tuple(indices[masque] for masque in masques_case) for masques_case in masques_par_case)
+        self.nb_fenetres = len(masques)
+        self.table = table_motifs(k)
+        self.vider()
+
+    def vider(self):
+        """
+        Remet l'évaluateur à l'état du plateau vide.
+        """
+        self.comptes = [[0] * self.nb_fenetres, [0] * self.nb_fenetres]
+        self.score = 0
+
+    def charger(self, bits_0, bits_1):
+        """
+        Remet l'évaluateur à l'état d'une position.
+
+        Args:
+            bits_0 (int): Le bitboard des pions du côté 0.
+            bits_1 (int): Le bitboard des pions du côté 1.
+        """
+        self.vider()
+        for cote, bits in ((0, bits_0), (1, bits_1)):
+            while bits:
+                bas = bits & -bits
+                self.jouer(bas.bit_length() - 1, cote)
+                bits ^= bas
+
+    def jouer(self, position, cote):
+        """
+        Met à jour les fenêtres qui passent par la case d'un pion ajouté.
+        """
+        propres, autres = self.comptes[cote], self.comptes[1 - cote]
+        table = self.table
+        delta = 0
+        for fenetre in self.fenetres[position]:
+            a, b = propres[fenetre], autres[fenetre]
+            delta += table[a + 1][b] - table[a][b]
+            propres[fenetre] = a + 1
+        self.score += delta if cote == 0 else -delta
+
+    def annuler(self, position, cote):
+        """
+        Met à jour les fenêtres qui passent par la case d'un pion retiré (l'inverse de jouer).
+        """
+        propres, autres = self.comptes[cote], self.comptes[1 - cote]
+        table = self.table
+        delta = 0
+        for fenetre in self.fenetres[position]:
+            a, b = propres[fenetre], autres[fenetre]
+            delta += table[a - 1][b] - table[a][b]
+            propres[fenetre] = a - 1
+        self.score += delta if cote == 0 else -delta
+
+    def valeur(self, cote):
+        """
+        Retourne la valeur de la position du point de vue d'un côté (positive si elle le favorise).
+        """
+        return self.score if cote == 0 else -self.score
@@ -1,238 +1,737 @@
-__authors__ = 'Carl Dumont et Simon Provencher!'
-__date__ = "31 avril 2015"
-
-"""Ce fichier permet d'afficher un plateau de tic-tac-toe, d'initialiser les positions des pièces et de modifier le plateau
-selon les commandes envoyées par les joueurs dans la partie! Il gère aussi l'intelligence artificielle de l'ordinateur"""
-
-from case import Case
-from random import randrange
-
-class Plateau:
-    """
-    Classe modélisant le plateau du jeu Tic-Tac-Toe.
-
-    Attributes:
-        cases           (dict)      : Dictionnaire des cases et de leur contenu
-        chaîne_plateau  (str)       : Contient la chaîne affichant le plateau de jeu
-        victoire        (bool)      : Retourne si le jouer a gagné la partie, Vrai si oui, Faux si non
-        non_plein       (bool)      : Retourne si le plateau est plein
-        choisir_prochaine_case (int): Retourne deux coordonnées numériques correspondant au prochain mouvement de
-                                        l'ordinateur
-
-
-
-    """
-
-    def __init__(self):
-        """
-        Méthode spéciale initialisant un nouveau plateau contenant les 9 cases du jeu.
-        """
-
-        # Dictionnaire de cases.
-        # La clé est une position (ligne, colonne), et la valeur est une instance de la classe Case.
-        self.cases = {}
-
-        # Appel d'une méthode qui initialise un plateau contenant des cases vides.
-        self.initialiser()
-
-    def initialiser(self):
-        """
-        Initialise le plateau avec des cases vides (contenant des espaces).
-        """
-
-        # Vider le dictionnaire (pratique si on veut recommencer le jeu).
-        self.cases.clear()
-        # Parcourir le dictionnaire et mettre des objets de la classe Case.
-        # dont l'attribut "contenu" serait un espace (" ").
-
-        for i in range(0, 3):
-            for j in range(0, 3):
-                self.cases[i,j] = Case(" ")
-
-    def __str__(self):
-        """Méthode spéciale indiquant à Python comment représenter une instance de Plateau
-        sous la forme d'une chaîne de caractères. Permet donc d'afficher le plateau du jeu
-        à l'écran en faisant par exemple:
-        p1 = Plateau()
-        print(p1)
-
-        Voici un exemple d'affichage:
-         +-0-+-1-+-2-+
-        0|   | X | X |
-         +---+---+---+
-        1| O | O | X |
-         +---+---+---+
-        2|   |   | O |
-         +---+---+---+
-
-        Returns:
-            string: Retourne la chaîne de caractères à afficher.
-        """
-
-        chaîne_plateau= " +-0-+-1-+-2-+ \n"
-        for i in range(0,3):
-            chaîne_plateau += str(i) + "| "
-            for j in range(0,3):
-                chaîne_plateau += self.cases[i,j].contenu +" | "
-            chaîne_plateau += " \n"
-            chaîne_plateau += " +---+---+---+ \n"
-        return chaîne_plateau
-
-
-
-
-    def non_plein(self):
-        """
-        Retourne si le plateau n'est pas encore plein.
-        Il y a donc encore des cases vides (contenant des espaces et non des "X" ou des "O").
-
-        Returns:
-            bool: True si le plateau n'est pas plein, False autrement.
-        """
-        for i in range(0,3):
-            for j in range(0,3):
-                if self.cases[i,j].est_vide():
-                    return True
-        return False
-
-    def position_valide(self, ligne, colonne):
-        """
-        Vérifie si une position est valide pour jouer.
-        La position ne doit pas être occupée.
-        Il faut utiliser la méthode est_vide() de la classe Case.
-
-        Args:
-            ligne (int): Le numéro de la ligne dans le plateau du jeu.
-            colonne (int): Le numéro de la colonne dans le plateau du jeu.
-
-        Returns:
-            bool: True si la position est valide, False autrement.
-        """
-        assert isinstance(ligne, int), "Plateau: ligne doit être un entier."
-        assert isinstance(colonne, int), "Plateau: colonne doit être un entier."
-
-        return self.cases[ligne, colonne].est_vide()
-
-
-    def selectionner_case(self, ligne, colonne, pion):
-        """
-        Permet de modifier le contenu de la case
-        qui a les coordonnées (ligne,colonne) dans le plateau du jeu
-        en utilisant la valeur de la variable pion.
-
-        Args:
-            ligne (int): Le numéro de la ligne dans le plateau du jeu.
-            colonne (int): Le numéro de la colonne dans le plateau du jeu.
-            pion (string): Une chaîne de caractères ("X" ou "O").
-        """
-        assert isinstance(ligne, int), "Plateau: ligne doit être un entier."
-        assert isinstance(colonne, int), "Plateau: colonne doit être un entier."
-        assert isinstance(pion, str), "Plateau: pion doit être une chaîne de caractères."
-        assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
-        assert ligne in [0, 1, 2], "Plateau: ligne doit être 0, 1 ou 2."
-        assert colonne in [0, 1, 2], "Plateau: colonne doit être 0, 1 ou 2."
-
-        self.cases[ligne, colonne].contenu = pion
-
-
-    def est_gagnant(self, pion):
-        """
-        Permet de vérifier si un joueur a gagné le jeu.
-        Il faut vérifier toutes les lignes, colonnes et diagonales du plateau.
-
-        Args:
-            pion (string): La forme du pion utilisé par le joueur en question ("X" ou "O").
-
-        Returns:
-            bool: True si le joueur a gagné, False autrement.
-        """
-
-        assert isinstance(pion, str), "Plateau: pion doit être une chaîne de caractères."
-        assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
-        for i in range (0,3):
-            victoire = (self.cases[i,0].contenu == pion and self.cases[i,1].contenu == pion and self.cases[i,2].contenu == pion) or \
-                       (self.cases[0,i].contenu == pion and self.cases[1,i].contenu == pion and self.cases[2,i].contenu == pion)
-            if victoire == True:
-                return victoire #comparaison pour les lignes ou les colonnes gagnantes
-
-        victoire = True
-        i=0
-        while i<=2:
-            if self.cases[i,i].contenu != pion:
-                victoire = False
-            i +=1
-        if victoire == True:
-            return victoire
-        i = 0
-        j = 2
-        victoire = True
-        while i <=2:
-            if self.cases[i,j].contenu != pion:
-                victoire = False
-            i += 1
-            j -= 1
-        if victoire == True:
-            return victoire
-        #comparaison pour les deux diagonales possibles
-        return False
-
-
-
-
-
-    def choisir_prochaine_case(self, pion):
-        """
-        Permet de retourner les coordonnées (ligne, colonne) de la case que l'ordinateur
-        peut choisir afin de jouer contre un autre joueur qui est normalement une personne.
-        Ce choix doit se faire en fonction de la configuration actuelle du plateau.
-        L'algorithme que vous allez concevoir permettant de faire jouer l'ordinateur
-        n'a pas besoin d'être optimal. Cela permettra à l'adversaire de gagner de temps en temps.
-        Il faut par contre essayer de mettre le pion de l'ordinateur dans une ligne, une colonne
-        ou une diagonale contenant deux pions de l'adversaire pour que ce dernier ne gagne pas facilement.
-        Il faut aussi essayer de mettre le pion de l'ordinateur dans une ligne, une colonne
-        ou une diagonale contenant deux pions de l'ordinateur pour que ce dernier puisse gagner.
-        Vous pouvez utiliser ici la fonction randrange() du module random.
-        Par exemple: randrange(1,10) vous retourne une valeur entre 1 et 9 au hasard.
-
-        Args:
-            pion (string): La forme du pion de l'adversaire de l'ordinateur ("X" ou "O").
-
-        Returns:
-            (int,int): Une paire d'entiers représentant les coordonnées de la case choisie.
-        """
-        assert isinstance(pion, str), "Plateau: pion doit être une chaîne de caractères."
-        assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
-
-        if pion == "X":
-            pion_ordi= "O"
-        else:
-            pion_ordi = "X"
-        for i in range(0,3):
-            for j in range(0,3):
-                if self.position_valide(i, j):
-                    self.cases[i,j] = Case(pion_ordi)
-                    if self.est_gagnant(pion_ordi):
-                        return (i,j)
-                    else: self.cases[i,j]=Case(" ")
-                    #teste si l'ordinateur peut gagner au prochain tour
-                    #si oui, il place un pion pour gagner
-        for i in range(0,3):
-            for j in range(0,3):
-                if self.position_valide(i,j):
-                    self.cases[i,j] = Case(pion)
-                    if self.est_gagnant(pion):
-                        return (i,j)
-                    else: self.cases[i,j]=Case(" ")
-                    #teste si l'humain peut gagner au prochain tour
-                    #si oui, il place un pion pour le bloquer
-        x = 0
-        while x != 10:
-            a = randrange(0,3)
-            b = randrange(0,3)
-            if self.position_valide(a,b):
-                return (a,b)
-        #si il n'y a pas de mouvement victorieux, on place un pion au hasard
-
-
-
-
+__authors__ = 'Carl Dumont et Simon Provencher!'
+__date__ = "31 avril 2015"
+
+"""Ce fichier permet d'afficher un plateau de tic-tac-toe, d'initialiser les positions des pièces et de modifier le plateau
+selon les commandes envoyées par les joueurs dans la partie! Il gère aussi l'intelligence artificielle de l'ordinateur"""
+
+from functools import lru_cache
+from random import Random, randrange
+
+import instrumentation
+from case import Case
+
+
+@lru_cache(maxsize=None)
+def lignes_par_case(m, n, k):
+    """
+    Précalcule, pour chaque case d'un plateau de m lignes et n colonnes, les masques de toutes les
+    lignes gagnantes de k cases qui passent par cette case (horizontales, verticales et diagonales).
+    Une case fait partie d'au plus 4 * k de ces lignes: vérifier une victoire autour du dernier
+    pion joué coûte donc O(k), peu importe la taille du plateau.
+
+    Args:
+        m (int): Le nombre de lignes du plateau.
+        n (int): Le nombre de colonnes du plateau.
+        k (int): Le nombre de pions à aligner pour gagner.
+
+    Returns:
+        tuple: Pour chaque position (ligne * n + colonne), le tuple des masques des lignes qui y passent.
+    """
+    lignes = [[] for _ in range(m * n)]
+    for direction_ligne, direction_colonne in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for ligne in range(m):
+            for colonne in range(n):
+                fin_ligne = ligne + (k - 1) * direction_ligne
+                fin_colonne = colonne + (k - 1) * direction_colonne
+                if not (0 <= fin_ligne < m and 0 <= fin_colonne < n):
+                    continue
+                positions = [(ligne + d * direction_ligne) * n + colonne + d * direction_colonne for d in range(k)]
+                masque = sum(1 << position for position in positions)
+                for position in positions:
+                    lignes[position].append(masque)
+    return tuple(tuple(masques) for masques in lignes)
+
+
+@lru_cache(maxsize=None)
+def symetries(m, n):
+    """
+    Retourne les symétries d'un plateau de m lignes et n colonnes, sous forme de permutations des positions:
+    les huit symétries du carré (rotations et miroirs) si m == n, sinon les quatre du rectangle.
+    La première permutation est toujours l'identité.
+
+    Args:
+        m (int): Le nombre de lignes du plateau.
+        n (int): Le nombre de colonnes du plateau.
+
+    Returns:
+        tuple: Des tuples permutation tels que permutation[position] est l'image de la position.
+    """
+    transformations = [
+        lambda i, j: (i, j),                    # identité
+        lambda i, j: (m - 1 - i, n - 1 - j),    # rotation de 180 degrés
+        lambda i, j: (m - 1 - i, j),            # miroir horizontal
+        lambda i, j: (i, n - 1 - j),            # miroir vertical
+    ]
+    if m == n:
+        transformations += [
+            lambda i, j: (j, m - 1 - i),        # rotation de 90 degrés
+            lambda i, j: (n - 1 - j, i),        # rotation de 270 degrés
+            lambda i, j: (j, i),                # diagonale principale
+            lambda i, j: (n - 1 - j, m - 1 - i),  # diagonale secondaire
+        ]
+    return tuple(
+        tuple(ligne * n + colonne for ligne, colonne in (transformation(p // n, p % n) for p in range(m * n)))
+        for transformation in transformations
+    )
+
+
+def ouverture_par_x(bits_x, bits_o, pion):
+    """
+    Retourne une position telle que X l'aurait atteinte en ouvrant la partie: si c'est O qui a ouvert, les deux
+    pions sont échangés. Les tables indexées par rang (voir retrograde.py et apprentissage.py) ne contiennent que
+    les positions où X a ouvert; les cases ne changent pas, le coup choisi se joue donc tel quel.
+
+    Args:
+        bits_x (int): Le bitboard de X.
+        bits_o (int): Le bitboard de O.
+        pion (string): Le pion qui joue ("X" ou "O").
+
+    Returns:
+        (int,int,string): Les bitboards de X et de O et le pion qui joue, vus du côté du joueur qui a ouvert.
+    """
+    # Le joueur au trait est celui qui a ouvert si les deux joueurs ont autant de pions.
+    autre = "O" if pion == "X" else "X"
+    ouvreur = pion if bin(bits_x).count("1") == bin(bits_o).count("1") else autre
+    if ouvreur == "X":
+        return bits_x, bits_o, pion
+    return bits_o, bits_x, autre
+
+
+# Les niveaux de jeu de l'ordinateur acceptés par choisir_prochaine_case.
+NIVEAUX = ("normal", "parfait", "alphabeta", "mcts", "livre", "retrograde", "appris")
+
+# Les niveaux qui cherchent leur coup: leurs décisions sont gardées dans le cache partagé par toutes les parties
+# du processus (voir cache_decisions.py). Les autres niveaux lisent déjà leur coup dans une table.
+NIVEAUX_MEMORISES = ("alphabeta", "mcts")
+
+# Le plateau classique de 3 x 3 est représenté par deux entiers de 9 bits (un par pion).
+# La case (ligne, colonne) correspond au bit numéro ligne * 3 + colonne.
+PLATEAU_PLEIN = 0b111111111
+
+# Table précalculée des huit lignes gagnantes du plateau classique: trois lignes, trois colonnes et deux diagonales.
+LIGNES_GAGNANTES = tuple(sorted(set(masque for masques in lignes_par_case(3, 3, 3) for masque in masques)))
+
+@lru_cache(maxsize=None)
+def cles_zobrist(nb_cases):
+    """
+    Retourne les clés de Zobrist d'un plateau de nb_cases cases: un entier aléatoire de 64 bits par pion et par case.
+    Le générateur est initialisé par nb_cases, de sorte que les clés (et donc les hachages) sont les mêmes
+    d'un processus à l'autre.
+
+    Returns:
+        dict: Pour chaque pion ("X" ou "O"), le tuple des clés de ses positions.
+    """
+    generateur = Random(nb_cases)
+    return {pion: tuple(generateur.getrandbits(64) for _ in range(nb_cases)) for pion in ("X", "O")}
+
+
+@lru_cache(maxsize=None)
+def _cadre(m, n):
+    """
+    Retourne les parties fixes de l'affichage d'un plateau de m x n cases: la largeur des numéros de ligne,
+    l'en-tête (numéros de colonne) et le séparateur entre les lignes.
+    """
+    # Les numéros de ligne sont alignés à droite pour les plateaux de plus de 10 lignes.
+    largeur = len(str(m - 1))
+    marge = " " * largeur
+    entete = marge + "+" + "".join("{:-^3}+".format(colonne) for colonne in range(n)) + " \n"
+    separateur = marge + "+" + "---+" * n + " \n"
+    return largeur, entete, separateur
+
+
+# Nombre d'affichages gardés en cache: plus que les 5478 positions atteignables du plateau de 3 x 3, qui y
+# tiennent toutes (environ 2 Mo). Sur les grands plateaux, seules les positions récentes sont gardées: un
+# affichage de 15 x 15 fait environ 2 ko, soit au plus une vingtaine de Mo.
+RENDUS_MAX = 2 ** 13
+
+
+@lru_cache(maxsize=RENDUS_MAX)
+def _rendre(m, n, bits_x, bits_o):
+    """
+    Construit l'affichage d'une position. Le résultat est gardé en cache par position: un plateau affiché
+    plusieurs fois sans changer (ou la même position sur plusieurs plateaux) n'est construit qu'une fois.
+    """
+    largeur, entete, separateur = _cadre(m, n)
+    morceaux = [entete]
+    position = 0
+    for ligne in range(m):
+        cases = []
+        for _ in range(n):
+            cases.append("X" if bits_x >> position & 1 else "O" if bits_o >> position & 1 else " ")
+            position += 1
+        morceaux.append(str(ligne).rjust(largeur) + "| " + " | ".join(cases) + " |  \n" + separateur)
+    return "".join(morceaux)
+
+
+class Plateau:
+    """
+    Classe modélisant le plateau du jeu Tic-Tac-Toe, généralisé à m lignes, n colonnes
+    et k pions à aligner (par exemple 15 x 15 avec cinq pions à aligner).
+
+    Attributes:
+        m, n, k         (int)       : Le nombre de lignes, de colonnes et de pions à aligner pour gagner
+        plein           (int)       : Le masque des m * n cases du plateau
+        pions           (dict)      : Dictionnaire associant chaque pion ("X" ou "O") à son bitboard de m * n bits
+                                      (le bit ligne * n + colonne vaut 1 si le pion occupe cette case)
+        victoires       (dict)      : Dictionnaire indiquant, pour chaque pion, s'il a aligné k pions (tenu à jour
+                                      à chaque coup)
+        libres          (list)      : Les positions (ligne * n + colonne) des cases vides, dans un ordre quelconque
+        indices_libres  (list)      : Pour chaque position, son indice dans libres (-1 si la case est occupée)
+        historique      (list)      : La pile des coups joués, pour pouvoir les annuler: (position, pion, contenu
+                                      précédent de la case, victoires de X et de O avant le coup)
+        hachage         (int)       : Le hachage de Zobrist de la position, tenu à jour à chaque coup
+        lignes_par_case (tuple)     : Pour chaque position, les masques des lignes gagnantes qui y passent
+        cles_zobrist    (dict)      : Les clés de Zobrist de chaque pion, une par position
+        mcts            (MCTS)      : La recherche Monte-Carlo du niveau "mcts", gardée d'un tour à l'autre
+        non_plein       (bool)      : Retourne si le plateau est plein
+        choisir_prochaine_case (int): Retourne deux coordonnées numériques correspondant au prochain mouvement de
+                                        l'ordinateur
+
+
+
+    """
+
+    def __init__(self, m=3, n=3, k=3):
+        """
+        Méthode spéciale initialisant un nouveau plateau de m x n cases.
+
+        Args:
+            m (int): Le nombre de lignes du plateau.
+            n (int): Le nombre de colonnes du plateau.
+            k (int): Le nombre de pions à aligner pour gagner.
+        """
+        assert isinstance(m, int) and m > 0, "Plateau: m doit être un entier positif."
+        assert isinstance(n, int) and n > 0, "Plateau: n doit être un entier positif."
+        assert isinstance(k, int) and 0 < k <= max(m, n), "Plateau: k doit être entre 1 et max(m, n)."
+
+        self.m = m
+        self.n = n
+        self.k = k
+        self.plein = (1 << m * n) - 1
+        self.lignes_par_case = lignes_par_case(m, n, k)
+        self.cles_zobrist = cles_zobrist(m * n)
+
+        # Hachage de Zobrist de la position: le ou exclusif des clés de chaque pion sur le plateau,
+        # tenu à jour à chaque coup (voir __hash__).
+        self.hachage = 0
+
+        # Dictionnaire de bitboards.
+        # La clé est un pion ("X" ou "O"), et la valeur est un entier dont le bit ligne * n + colonne
+        # vaut 1 si ce pion occupe la case (ligne, colonne).
+        self.pions = {"X": 0, "O": 0}
+        self.victoires = {"X": False, "O": False}
+
+        # Ensemble indexable des cases vides: la liste permet un tirage au hasard en O(1), et l'indice de
+        # chaque position dans la liste permet de la retirer en O(1) (en la remplaçant par la dernière).
+        self.libres = []
+        self.indices_libres = []
+
+        # Pile des coups joués: (position, pion, contenu précédent de la case, victoires de X et de O avant le coup).
+        self.historique = []
+
+        # Recherche Monte-Carlo du niveau "mcts", créée au premier coup puis gardée d'un tour à l'autre
+        # pour réutiliser son arbre (voir mcts.py).
+        self.mcts = None
+
+        # Appel d'une méthode qui initialise un plateau contenant des cases vides.
+        self.initialiser()
+
+    def initialiser(self):
+        """
+        Initialise le plateau avec des cases vides (contenant des espaces).
+        """
+
+        # Remettre les deux bitboards à zéro (pratique si on veut recommencer le jeu).
+        self.pions["X"] = 0
+        self.pions["O"] = 0
+        self.victoires["X"] = False
+        self.victoires["O"] = False
+        self.hachage = 0
+        self.libres = list(range(self.m * self.n))
+        self.indices_libres = list(range(self.m * self.n))
+        self.historique.clear()
+
+    def _occuper(self, position):
+        """
+        Retire une position de l'ensemble des cases vides en O(1).
+
+        Args:
+            position (int): La position (ligne * n + colonne) de la case qui devient occupée.
+        """
+        indice = self.indices_libres[position]
+        derniere = self.libres.pop()
+        if derniere != position:
+            self.libres[indice] = derniere
+            self.indices_libres[derniere] = indice
+        self.indices_libres[position] = -1
+
+    def _liberer(self, position):
+        """
+        Remet une position dans l'ensemble des cases vides en O(1).
+
+        Args:
+            position (int): La position (ligne * n + colonne) de la case qui redevient vide.
+        """
+        self.indices_libres[position] = len(self.libres)
+        self.libres.append(position)
+
+    def coups_legaux(self):
+        """
+        Retourne les positions (ligne * n + colonne) des cases vides, en O(1).
+        La liste retournée est celle que le plateau tient à jour: il ne faut pas la modifier.
+
+        Returns:
+            list: Les positions des cases vides, dans un ordre quelconque.
+        """
+        return self.libres
+
+    def case_libre_au_hasard(self):
+        """
+        Retourne une case vide choisie uniformément au hasard, en O(1).
+
+        Returns:
+            (int,int): Les coordonnées (ligne, colonne) de la case.
+        """
+        assert self.libres, "Plateau: le plateau est plein."
+
+        return divmod(self.libres[randrange(len(self.libres))], self.n)
+
+    def case(self, ligne, colonne):
+        """
+        Retourne la case (ligne, colonne). Aucun objet n'est créé: c'est l'une des trois cases partagées
+        Case.VIDE, Case.X ou Case.O.
+
+        Args:
+            ligne (int): Le numéro de la ligne dans le plateau du jeu.
+            colonne (int): Le numéro de la colonne dans le plateau du jeu.
+
+        Returns:
+            Case: La case à cette position.
+        """
+        bit = 1 << (ligne * self.n + colonne)
+        if self.pions["X"] & bit:
+            return Case.X
+        if self.pions["O"] & bit:
+            return Case.O
+        return Case.VIDE
+
+    def contenu(self, ligne, colonne):
+        """
+        Retourne le contenu de la case (ligne, colonne).
+
+        Args:
+            ligne (int): Le numéro de la ligne dans le plateau du jeu.
+            colonne (int): Le numéro de la colonne dans le plateau du jeu.
+
+        Returns:
+            string: " ", "O" ou "X".
+        """
+        return self.case(ligne, colonne).contenu
+
+    def __str__(self):
+        """Méthode spéciale indiquant à Python comment représenter une instance de Plateau
+        sous la forme d'une chaîne de caractères. Permet donc d'afficher le plateau du jeu
+        à l'écran en faisant par exemple:
+        p1 = Plateau()
+        print(p1)
+
+        Voici un exemple d'affichage:
+         +-0-+-1-+-2-+
+        0|   | X | X |
+         +---+---+---+
+        1| O | O | X |
+         +---+---+---+
+        2|   |   | O |
+         +---+---+---+
+
+        Returns:
+            string: Retourne la chaîne de caractères à afficher.
+        """
+
+        return _rendre(self.m, self.n, self.pions["X"], self.pions["O"])
+
+    def etat_affichage(self):
+        """
+        Retourne la position affichée, sous une forme à passer plus tard à differences_ansi().
+
+        Returns:
+            (int,int): Les bitboards de X et de O.
+        """
+        return self.pions["X"], self.pions["O"]
+
+    def differences_ansi(self, precedent=None):
+        """
+        Retourne les séquences ANSI qui font passer un terminal de l'affichage de la position precedent à celui
+        du plateau actuel, en ne réécrivant que les cases qui ont changé. Le plateau est supposé dessiné en haut
+        à gauche de l'écran; le curseur est ensuite placé sous le plateau. La même chaîne peut être envoyée à
+        tous les terminaux qui affichaient la position precedent.
+
+        Args:
+            precedent ((int,int)): La position du dernier affichage (voir etat_affichage()), ou None pour
+                                   effacer l'écran et dessiner le plateau au complet.
+
+        Returns:
+            string: Les séquences à écrire dans le terminal.
+        """
+        largeur = len(str(self.m - 1))
+        fin = "\x1b[{};1H".format(2 * self.m + 2)
+        if precedent is None:
+            return "\x1b[H\x1b[2J" + str(self) + fin
+        bits_x, bits_o = self.pions["X"], self.pions["O"]
+        changees = (bits_x ^ precedent[0]) | (bits_o ^ precedent[1])
+        if not changees:
+            return ""
+        morceaux = []
+        while changees:
+            bas = changees & -changees
+            changees ^= bas
+            ligne, colonne = divmod(bas.bit_length() - 1, self.n)
+            contenu = "X" if bits_x & bas else "O" if bits_o & bas else " "
+            # La case (ligne, colonne) est à la ligne 2 + 2 * ligne et à la colonne largeur + 3 + 4 * colonne.
+            morceaux.append("\x1b[{};{}H{}".format(2 + 2 * ligne, largeur + 3 + 4 * colonne, contenu))
+        morceaux.append(fin)
+        return "".join(morceaux)
+
+    def __hash__(self):
+        """
+        Méthode spéciale retournant le hachage de Zobrist de la position, tenu à jour à chaque coup: le calculer
+        ne coûte rien, peu importe la taille du plateau. Un plateau peut donc servir directement de clé de
+        dictionnaire, à condition de ne plus le modifier tant qu'il y est.
+        """
+        return self.hachage
+
+    def __eq__(self, autre):
+        """
+        Méthode spéciale indiquant si deux plateaux ont le même format et les mêmes pions aux mêmes cases.
+        """
+        if not isinstance(autre, Plateau):
+            return NotImplemented
+        return (self.hachage == autre.hachage and (self.m, self.n, self.k) == (autre.m, autre.n, autre.k)
+                and self.pions == autre.pions)
+
+    def non_plein(self):
+        """
+        Retourne si le plateau n'est pas encore plein.
+        Il y a donc encore des cases vides (contenant des espaces et non des "X" ou des "O").
+
+        Returns:
+            bool: True si le plateau n'est pas plein, False autrement.
+        """
+        return len(self.libres) > 0
+
+    def position_valide(self, ligne, colonne):
+        """
+        Vérifie si une position est valide pour jouer.
+        La position ne doit pas être occupée, c'est-à-dire que son bit doit être nul dans les deux bitboards.
+
+        Args:
+            ligne (int): Le numéro de la ligne dans le plateau du jeu.
+            colonne (int): Le numéro de la colonne dans le plateau du jeu.
+
+        Returns:
+            bool: True si la position est valide, False autrement.
+        """
+        assert isinstance(ligne, int), "Plateau: ligne doit être un entier."
+        assert isinstance(colonne, int), "Plateau: colonne doit être un entier."
+        assert 0 <= ligne < self.m, "Plateau: ligne doit être entre 0 et m - 1."
+        assert 0 <= colonne < self.n, "Plateau: colonne doit être entre 0 et n - 1."
+
+        return not (self.pions["X"] | self.pions["O"]) & (1 << (ligne * self.n + colonne))
+
+    def position_libre(self, position):
+        """
+        Comme position_valide, sans vérifier les arguments: réservée au code de confiance (ordinateur,
+        simulations, recherches) dont les positions viennent du plateau lui-même (voir verifications()).
+
+        Args:
+            position (int): La position (ligne * n + colonne) de la case.
+
+        Returns:
+            bool: True si la case est vide, False autrement.
+        """
+        return self.indices_libres[position] >= 0
+
+    def complete_ligne(self, bits, position):
+        """
+        Vérifie si le pion en position complète une ligne de k pions dans bits.
+        Seules les lignes passant par cette position sont vérifiées (les quatre directions autour d'elle).
+
+        Args:
+            bits (int): Le bitboard d'un pion, contenant la position.
+            position (int): La position (ligne * n + colonne) du pion qui vient d'être placé.
+
+        Returns:
+            bool: True si une ligne est complète, False autrement.
+        """
+        for masque in self.lignes_par_case[position]:
+            if bits & masque == masque:
+                return True
+        return False
+
+
+    def selectionner_case(self, ligne, colonne, pion):
+        """
+        Permet de modifier le contenu de la case
+        qui a les coordonnées (ligne,colonne) dans le plateau du jeu
+        en utilisant la valeur de la variable pion.
+        La victoire du pion est mise à jour en ne vérifiant que les lignes passant par cette case.
+
+        Args:
+            ligne (int): Le numéro de la ligne dans le plateau du jeu.
+            colonne (int): Le numéro de la colonne dans le plateau du jeu.
+            pion (string): Une chaîne de caractères ("X" ou "O").
+        """
+        assert isinstance(ligne, int), "Plateau: ligne doit être un entier."
+        assert isinstance(colonne, int), "Plateau: colonne doit être un entier."
+        assert isinstance(pion, str), "Plateau: pion doit être une chaîne de caractères."
+        assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
+        assert 0 <= ligne < self.m, "Plateau: ligne doit être entre 0 et m - 1."
+        assert 0 <= colonne < self.n, "Plateau: colonne doit être entre 0 et n - 1."
+
+        self.jouer_coup(ligne * self.n + colonne, pion)
+
+    def jouer_coup(self, position, pion):
+        """
+        Place le pion en position et empile le coup dans l'historique, pour pouvoir l'annuler avec
+        annuler_coup(). Ce couple de méthodes permet à une recherche d'essayer des coups directement sur
+        le plateau, sans le copier. La victoire du pion est mise à jour en ne vérifiant que les lignes
+        passant par cette case. Contrairement à selectionner_case, les arguments ne sont pas vérifiés
+        (voir verifications()).
+
+        Args:
+            position (int): La position (ligne * n + colonne) de la case.
+            pion (string): Une chaîne de caractères ("X" ou "O").
+        """
+        bit = 1 << position
+        autre = "O" if pion == "X" else "X"
+        victoire_x, victoire_o = self.victoires["X"], self.victoires["O"]
+        if self.indices_libres[position] >= 0:
+            ancien = " "
+            self._occuper(position)
+        elif self.pions[autre] & bit:
+            ancien = autre
+            # La case appartenait à l'autre pion: sa victoire doit être revérifiée au complet.
+            self.pions[autre] &= ~bit
+            self.victoires[autre] = self._victoire_complete(autre)
+            self.hachage ^= self.cles_zobrist[autre][position]
+        else:
+            ancien = pion
+        self.historique.append((position, pion, ancien, victoire_x, victoire_o))
+        if ancien != pion:
+            self.hachage ^= self.cles_zobrist[pion][position]
+        self.pions[pion] |= bit
+        if not self.victoires[pion]:
+            self.victoires[pion] = self.complete_ligne(self.pions[pion], position)
+
+    def annuler_coup(self):
+        """
+        Annule le dernier coup de l'historique et remet le plateau exactement dans l'état précédent.
+
+        Returns:
+            (int,string): La position et le pion du coup annulé.
+        """
+        assert self.historique, "Plateau: aucun coup à annuler."
+
+        position, pion, ancien, victoire_x, victoire_o = self.historique.pop()
+        bit = 1 << position
+        if ancien == " ":
+            self.pions[pion] &= ~bit
+            self._liberer(position)
+            self.hachage ^= self.cles_zobrist[pion][position]
+        elif ancien != pion:
+            self.pions[pion] &= ~bit
+            self.pions[ancien] |= bit
+            self.hachage ^= self.cles_zobrist[pion][position] ^ self.cles_zobrist[ancien][position]
+        self.victoires["X"] = victoire_x
+        self.victoires["O"] = victoire_o
+        return position, pion
+
+    def _victoire_complete(self, pion):
+        """
+        Vérifie toutes les lignes passant par les pions donnés (utilisé seulement quand un pion est retiré).
+        """
+        bits = self.pions[pion]
+        return any(self.complete_ligne(bits, p) for p in range(self.m * self.n) if bits >> p & 1)
+
+
+    def est_gagnant(self, pion):
+        """
+        Permet de vérifier si un joueur a gagné le jeu, c'est-à-dire s'il a aligné k pions.
+        La victoire est tenue à jour par selectionner_case, cette vérification ne coûte donc rien.
+
+        Args:
+            pion (string): La forme du pion utilisé par le joueur en question ("X" ou "O").
+
+        Returns:
+            bool: True si le joueur a gagné, False autrement.
+        """
+
+        assert isinstance(pion, str), "Plateau: pion doit être une chaîne de caractères."
+        assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
+        return self.victoires[pion]
+
+    def a_gagne(self, pion):
+        """
+        Comme est_gagnant, sans vérifier le pion: réservée au code de confiance (voir verifications()).
+
+        Args:
+            pion (string): La forme du pion utilisé par le joueur en question ("X" ou "O").
+
+        Returns:
+            bool: True si le joueur a gagné, False autrement.
+        """
+        return self.victoires[pion]
+
+
+
+
+
+    def _chercher(self, pion_ordi, pion, niveau):
+        """
+        Cherche le coup de l'ordinateur aux niveaux de NIVEAUX_MEMORISES.
+
+        Returns:
+            int: La position (ligne * n + colonne) de la case choisie.
+        """
+        if niveau == "alphabeta":
+            from recherche import moteur
+            return moteur(self.m, self.n, self.k).choisir_coup(self.pions[pion_ordi], self.pions[pion])
+        if self.mcts is None:
+            from mcts import MCTS
+            self.mcts = MCTS(self.m, self.n, self.k)
+        return self.mcts.choisir_coup(self.pions[pion_ordi], self.pions[pion])
+
+    def choisir_prochaine_case(self, pion, niveau="normal"):
+        """
+        Permet de retourner les coordonnées (ligne, colonne) de la case que l'ordinateur
+        peut choisir afin de jouer contre un autre joueur qui est normalement une personne.
+        Ce choix doit se faire en fonction de la configuration actuelle du plateau.
+        L'algorithme que vous allez concevoir permettant de faire jouer l'ordinateur
+        n'a pas besoin d'être optimal. Cela permettra à l'adversaire de gagner de temps en temps.
+        Il faut par contre essayer de mettre le pion de l'ordinateur dans une ligne, une colonne
+        ou une diagonale contenant deux pions de l'adversaire pour que ce dernier ne gagne pas facilement.
+        Il faut aussi essayer de mettre le pion de l'ordinateur dans une ligne, une colonne
+        ou une diagonale contenant deux pions de l'ordinateur pour que ce dernier puisse gagner.
+        Vous pouvez utiliser ici la fonction randrange() du module random.
+        Par exemple: randrange(1,10) vous retourne une valeur entre 1 et 9 au hasard.
+
+        Au niveau "parfait", le coup est plutôt lu dans la table de jeu parfait (voir table_parfaite.py),
+        ce qui prend un temps constant peu importe la configuration du plateau.
+        Au niveau "alphabeta", le coup est cherché par le moteur alpha-bêta (voir recherche.py).
+        Au niveau "mcts", le coup est cherché par une recherche Monte-Carlo limitée dans le temps (voir mcts.py).
+        Les coups de ces deux niveaux sont gardés dans le cache partagé des décisions (voir cache_decisions.py).
+        Au niveau "livre", le coup est lu dans le livre de coups du format de plateau (voir livre.py), ouvert au
+        premier coup; hors du livre, l'ordinateur joue comme au niveau "normal".
+        Au niveau "retrograde", le coup est lu dans la table de toutes les positions du format de plateau, résolue
+        à l'avance (voir retrograde.py); sans table résolue, l'ordinateur joue comme au niveau "normal".
+        Au niveau "appris", le coup est choisi avec la table apprise en jouant contre soi-même (voir
+        apprentissage.py); sans table entraînée, l'ordinateur joue comme au niveau "normal".
+
+        Args:
+            pion (string): La forme du pion de l'adversaire de l'ordinateur ("X" ou "O").
+            niveau (string): Le niveau de l'ordinateur (voir NIVEAUX; "parfait" seulement en 3 x 3).
+
+        Returns:
+            (int,int): Une paire d'entiers représentant les coordonnées de la case choisie.
+        """
+        assert isinstance(pion, str), "Plateau: pion doit être une chaîne de caractères."
+        assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
+        assert niveau in NIVEAUX, "Plateau: niveau inconnu."
+
+        if pion == "X":
+            pion_ordi= "O"
+        else:
+            pion_ordi = "X"
+        if niveau in ("parfait", "alphabeta", "mcts") and instrumentation.mesures is not None:
+            instrumentation.mesures.compter("decisions", branche=niveau)
+        if niveau == "parfait":
+            assert (self.m, self.n, self.k) == (3, 3, 3), "Plateau: le niveau 'parfait' n'existe qu'en 3 x 3."
+            # Importé ici pour ne résoudre la table qu'au premier coup parfait.
+            from table_parfaite import coup_parfait
+            return divmod(coup_parfait(self.pions[pion_ordi], self.pions[pion]), 3)
+        if niveau in NIVEAUX_MEMORISES:
+            from cache_decisions import cache
+            return divmod(cache.obtenir(self.m, self.n, self.k, niveau, self.pions[pion_ordi], self.pions[pion],
+                                        lambda: self._chercher(pion_ordi, pion, niveau)), self.n)
+        if niveau == "livre":
+            from livre import livre
+            ouvert = livre(self.m, self.n, self.k)
+            if ouvert is not None:
+                trouve = ouvert.chercher(self.pions[pion_ordi], self.pions[pion])
+                if trouve is not None:
+                    if instrumentation.mesures is not None:
+                        instrumentation.mesures.compter("decisions", branche="livre")
+                    return divmod(trouve[0], self.n)
+        if niveau == "retrograde":
+            from retrograde import table_retrograde
+            table = table_retrograde(self.m, self.n, self.k)
+            if table is not None:
+                if instrumentation.mesures is not None:
+                    instrumentation.mesures.compter("decisions", branche="retrograde")
+                return divmod(table.choisir_coup(self.pions["X"], self.pions["O"], pion_ordi), self.n)
+        if niveau == "appris":
+            from apprentissage import apprenti
+            joueur_appris = apprenti(self.m, self.n, self.k)
+            if joueur_appris is not None:
+                if instrumentation.mesures is not None:
+                    instrumentation.mesures.compter("decisions", branche="appris")
+                return divmod(joueur_appris.choisir_coup(self.pions["X"], self.pions["O"], pion_ordi), self.n)
+        occupees = self.pions["X"] | self.pions["O"]
+        for branche, bits in (("gagner", self.pions[pion_ordi]), ("bloquer", self.pions[pion])):
+            for position in range(0, self.m * self.n):
+                bit = 1 << position
+                if not occupees & bit and self.complete_ligne(bits | bit, position):
+                    if instrumentation.mesures is not None:
+                        instrumentation.mesures.compter("decisions", branche=branche)
+                    return divmod(position, self.n)
+            #premier passage: teste si l'ordinateur peut gagner au prochain tour, si oui, il place un pion pour gagner
+            #deuxième passage: teste si l'humain peut gagner au prochain tour, si oui, il place un pion pour le bloquer
+        if instrumentation.mesures is not None:
+            instrumentation.mesures.compter("decisions", branche="hasard")
+        return self.case_libre_au_hasard()
+        #si il n'y a pas de mouvement victorieux, on place un pion au hasard parmi les cases vides
+
+
+# Les méthodes de confiance du plateau, qui ne vérifient pas leurs arguments. Les méthodes publiques
+# (selectionner_case, position_valide, est_gagnant) les vérifient toujours: elles reçoivent les coups
+# saisis par les joueurs (voir partie.py et serveur.py), alors que l'ordinateur, les simulations et les
+# recherches passent par les méthodes de confiance, appelées des millions de fois.
+_METHODES_RAPIDES = {nom: getattr(Plateau, nom) for nom in ("jouer_coup", "position_libre", "a_gagne")}
+
+
+def _jouer_coup_verifie(self, position, pion):
+    assert isinstance(position, int), "Plateau: position doit être un entier."
+    assert 0 <= position < self.m * self.n, "Plateau: position doit être entre 0 et m * n - 1."
+    assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
+    _METHODES_RAPIDES["jouer_coup"](self, position, pion)
+
+
+def _position_libre_verifiee(self, position):
+    assert isinstance(position, int), "Plateau: position doit être un entier."
+    assert 0 <= position < self.m * self.n, "Plateau: position doit être entre 0 et m * n - 1."
+    return _METHODES_RAPIDES["position_libre"](self, position)
+
+
+def _a_gagne_verifie(self, pion):
+    assert pion in ["O", "X"], "Plateau: pion doit être 'O' ou 'X'."
+    return _METHODES_RAPIDES["a_gagne"](self, pion)
+
+
+_METHODES_VERIFIEES = {
+    "jouer_coup": _jouer_coup_verifie,
+    "position_libre": _position_libre_verifiee,
+    "a_gagne": _a_gagne_verifie,
+}
+
+
+def verifications(actif=True):
+    """
+    Active (ou désactive) le mode de débogage, dans lequel les méthodes de confiance vérifient leurs arguments
+    comme les méthodes publiques. Les méthodes sont remplacées dans la classe: hors du mode de débogage, elles
+    ne coûtent aucun test de plus. Les processus créés ensuite (par fork) héritent du mode.
+
+    Args:
+        actif (bool): True pour vérifier les arguments, False pour revenir aux méthodes rapides.
+    """
+    for nom, methode in (_METHODES_VERIFIEES if actif else _METHODES_RAPIDES).items():
+        setattr(Plateau, nom, methode)
@@ -0,0 +1,488 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le moteur de recherche de l'ordinateur au niveau "alphabeta": un negamax avec élagage
+alpha-bêta, un ordre des coups (centre, coins, puis bords) et une table de transposition bornée dont la clé
+est un hachage de Zobrist canonique, c'est-à-dire le même pour toutes les images symétriques d'une position.
+Quand la profondeur est limitée, les feuilles sont évaluées par l'évaluateur incrémental des menaces
+(voir menaces.py), tenu à jour à chaque coup essayé et annulé.
+
+Sur les grands plateaux, la recherche peut être répartie sur un groupe de processus gardé d'un coup à l'autre
+(voir RechercheParallele et configurer_parallele): chaque coup de la racine est cherché par un processus, qui
+reçoit la position sous forme de deux bitboards et partage avec les autres la meilleure valeur trouvée."""
+
+import multiprocessing
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from menaces import POIDS, EvaluateurMenaces
+from plateau import lignes_par_case, symetries
+
+# Valeur d'une victoire. On y retranche le nombre de pions sur le plateau pour préférer les victoires rapides;
+# la valeur ne dépend donc que de la position, pas du chemin qui y mène (nécessaire pour la table).
+GAGNE = 10 ** 12
+
+# Types d'entrées de la table de transposition: valeur exacte, borne inférieure ou borne supérieure.
+EXACTE, MINIMUM, MAXIMUM = 0, 1, 2
+
+
+class TableTransposition:
+    """
+    Table de transposition de taille bornée. Lorsqu'elle est pleine, l'entrée utilisée le moins
+    récemment est retirée (éviction LRU).
+
+    Attributes:
+        taille_max      (int)           : Le nombre maximal d'entrées.
+        entrees         (OrderedDict)   : Les entrées, de la moins récemment utilisée à la plus récente.
+        consultations   (int)           : Le nombre de lectures.
+        succes          (int)           : Le nombre de lectures ayant trouvé une entrée.
+        evictions       (int)           : Le nombre d'entrées retirées faute de place.
+    """
+
+    def __init__(self, taille_max=200000):
+        assert isinstance(taille_max, int) and taille_max > 0, "TableTransposition: taille_max doit être positif."
+
+        self.taille_max = taille_max
+        self.entrees = OrderedDict()
+        self.consultations = 0
+        self.succes = 0
+        self.evictions = 0
+
+    def lire(self, cle):
+        """
+        Retourne l'entrée associée à la clé, ou None.
+        """
+        self.consultations += 1
+        entree = self.entrees.get(cle)
+        if entree is not None:
+            self.succes += 1
+            self.entrees.move_to_end(cle)
+        return entree
+
+    def ecrire(self, cle, entree):
+        """
+        Associe une entrée à la clé, en retirant au besoin l'entrée la moins récemment utilisée.
+        """
+        self.entrees[cle] = entree
+        self.entrees.move_to_end(cle)
+        if len(self.entrees) > self.taille_max:
+            self.entrees.popitem(last=False)
+            self.evictions += 1
+
+
+class Moteur:
+    """
+    Classe modélisant le moteur de recherche alpha-bêta pour un plateau de m x n cases et k pions à aligner.
+    Les positions sont toujours vues du point de vue du joueur dont c'est le tour (joueur, adversaire).
+
+    Attributes:
+        profondeur      (int)               : La profondeur maximale de recherche (None: recherche exacte).
+        rayon           (int)               : Si non nul, seules les cases à au plus cette distance d'un pion
+                                              sont considérées (indispensable sur les grands plateaux).
+        table           (TableTransposition): La table de transposition, conservée d'un coup à l'autre.
+        menaces         (EvaluateurMenaces) : L'évaluateur des feuilles (None pour une recherche exacte), où le côté
+                                              0 est le joueur dont c'est le tour à la racine.
+        statistiques    (dict)              : Les nœuds visités et le taux de succès de la table au dernier coup.
+        verrou          (Lock)              : Le verrou qui empêche deux recherches en même temps.
+    """
+
+    def __init__(self, m=3, n=3, k=3, profondeur=None, rayon=None, taille_table=200000, graine=0):
+        """
+        Méthode spéciale initialisant un moteur de recherche.
+
+        Args:
+            m (int): Le nombre de lignes du plateau.
+            n (int): Le nombre de colonnes du plateau.
+            k (int): Le nombre de pions à aligner pour gagner.
+            profondeur (int): La profondeur maximale de recherche, en demi-coups (None: jusqu'à la fin).
+            rayon (int): La distance maximale entre un coup considéré et un pion déjà joué (None: aucune limite).
+            taille_table (int): Le nombre maximal d'entrées de la table de transposition.
+            graine (int): La graine servant à tirer les clés de Zobrist.
+        """
+        self.m = m
+        self.n = n
+        self.k = k
+        self.profondeur = profondeur
+        self.rayon = rayon
+        self.plein = (1 << m * n) - 1
+        self.lignes_par_case = lignes_par_case(m, n, k)
+        self.lignes = tuple(sorted(set(masque for masques in self.lignes_par_case for masque in masques)))
+        self.table = TableTransposition(taille_table)
+        self.menaces = None if profondeur is None else EvaluateurMenaces(m, n, k)
+        self.statistiques = {}
+        self.verrou = threading.Lock()
+
+        # Ordre des coups: les cases qui font partie du plus grand nombre de lignes d'abord, puis les plus
+        # proches du centre. En 3 x 3, cela donne le centre (4 lignes), les coins (3 lignes), puis les bords.
+        self.ordre = tuple(sorted(range(m * n), key=lambda p: (-len(self.lignes_par_case[p]),
+                                                               abs(2 * (p // n) - m + 1) + abs(2 * (p % n) - n + 1),
+                                                               p)))
+
+        # voisinages[position]: masque des cases à au plus rayon lignes et colonnes de la position.
+        if rayon:
+            self.voisinages = tuple(
+                sum(1 << (i * n + j)
+                    for i in range(max(0, p // n - rayon), min(m, p // n + rayon + 1))
+                    for j in range(max(0, p % n - rayon), min(n, p % n + rayon + 1)))
+                for p in range(m * n))
+
+        # Clés de Zobrist: zobrist[s][r][position] est la clé d'un pion en position après la symétrie s,
+        # r valant 0 pour un pion du joueur dont c'est le tour et 1 pour un pion de son adversaire.
+        # On garde un hachage par symétrie; le plus petit sert de clé canonique.
+        generateur = random.Random(graine)
+        cles = [[generateur.getrandbits(64) for _ in range(m * n)] for _ in range(2)]
+        self.permutations = symetries(m, n)
+        self.inverses = tuple(
+            tuple(permutation.index(p) for p in range(m * n)) for permutation in self.permutations)
+        self.zobrist = tuple(
+            tuple(tuple(cles[r][permutation[p]] for p in range(m * n)) for r in range(2))
+            for permutation in self.permutations)
+
+    def _hachages(self, joueur, adversaire):
+        """
+        Calcule au complet les hachages de la position sous chaque symétrie. Retourne deux tuples: les hachages
+        vus du joueur dont c'est le tour, et ceux de la même position vue de son adversaire.
+        """
+        hachages_joueur, hachages_adversaire = [], []
+        for zobrist in self.zobrist:
+            h_joueur = h_adversaire = 0
+            for position in range(self.m * self.n):
+                if joueur >> position & 1:
+                    h_joueur ^= zobrist[0][position]
+                    h_adversaire ^= zobrist[1][position]
+                elif adversaire >> position & 1:
+                    h_joueur ^= zobrist[1][position]
+                    h_adversaire ^= zobrist[0][position]
+            hachages_joueur.append(h_joueur)
+            hachages_adversaire.append(h_adversaire)
+        return tuple(hachages_joueur), tuple(hachages_adversaire)
+
+    def _complete_ligne(self, bits, position):
+        for masque in self.lignes_par_case[position]:
+            if bits & masque == masque:
+                return True
+        return False
+
+    def evaluer(self, joueur, adversaire):
+        """
+        Évalue heuristiquement une position non terminale, du point de vue du joueur dont c'est le tour:
+        chaque ligne encore ouverte pour un seul des deux joueurs vaut 10 à la puissance son nombre de pions.
+        C'est la valeur que l'évaluateur des menaces tient à jour pendant la recherche, mais calculée au complet.
+
+        Returns:
+            int: La valeur de la position (positive si elle favorise le joueur).
+        """
+        valeur = 0
+        for masque in self.lignes:
+            a = joueur & masque
+            b = adversaire & masque
+            if a and not b:
+                valeur += POIDS[bin(a).count("1")]
+            elif b and not a:
+                valeur -= POIDS[bin(b).count("1")]
+        return valeur
+
+    def _coups(self, occupees, zone, coup_table):
+        """
+        Retourne les coups à essayer dans l'ordre: celui de la table d'abord, puis l'ordre statique.
+        """
+        libres = ~occupees & self.plein
+        if self.rayon:
+            if not occupees:
+                # Sur un plateau vide, toutes les cases se valent à une symétrie près: on joue au centre.
+                return [self.ordre[0]]
+            if libres & zone:
+                libres &= zone
+        coups = [p for p in self.ordre if libres >> p & 1]
+        if coup_table is not None and libres >> coup_table & 1:
+            coups.remove(coup_table)
+            coups.insert(0, coup_table)
+        return coups
+
+    def _negamax(self, joueur, adversaire, hachages_joueur, hachages_adversaire, zone, profondeur, alpha, beta,
+                 cote=0):
+        self.noeuds += 1
+        alpha_initial = alpha
+
+        cle, symetrie = min(zip(hachages_joueur, range(len(hachages_joueur))))
+        entree = self.table.lire(cle)
+        coup_table = None
+        if entree is not None:
+            profondeur_entree, valeur, type_entree, coup_canonique = entree
+            coup_table = self.inverses[symetrie][coup_canonique]
+            if profondeur_entree >= profondeur:
+                if type_entree == EXACTE:
+                    return valeur
+                if type_entree == MINIMUM:
+                    alpha = max(alpha, valeur)
+                else:
+                    beta = min(beta, valeur)
+                if alpha >= beta:
+                    return valeur
+
+        occupees = joueur | adversaire
+        nb_pions = bin(occupees).count("1") + 1
+        coups = self._coups(occupees, zone, coup_table)
+
+        # Une victoire immédiate est toujours le meilleur coup.
+        for position in coups:
+            if self._complete_ligne(joueur | 1 << position, position):
+                meilleur, meilleur_coup = GAGNE - nb_pions, position
+                break
+        else:
+            if profondeur == 0:
+                if self.menaces is not None:
+                    meilleur = self.menaces.valeur(cote)
+                else:
+                    meilleur = self.evaluer(joueur, adversaire)
+                meilleur_coup = coups[0]
+            else:
+                meilleur, meilleur_coup = -2 * GAGNE, coups[0]
+                for position in coups:
+                    bit = 1 << position
+                    if occupees | bit == self.plein:
+                        valeur = 0
+                    else:
+                        zobrist = self.zobrist
+                        enfants_joueur = tuple(h ^ zobrist[s][1][position]
+                                               for s, h in enumerate(hachages_adversaire))
+                        enfants_adversaire = tuple(h ^ zobrist[s][0][position]
+                                                   for s, h in enumerate(hachages_joueur))
+                        if self.menaces is not None:
+                            self.menaces.jouer(position, cote)
+                        valeur = -self._negamax(adversaire, joueur | bit, enfants_joueur, enfants_adversaire,
+                                                zone | self.voisinages[position] if self.rayon else zone,
+                                                profondeur - 1, -beta, -alpha, 1 - cote)
+                        if self.menaces is not None:
+                            self.menaces.annuler(position, cote)
+                    if valeur > meilleur:
+                        meilleur, meilleur_coup = valeur, position
+                        alpha = max(alpha, valeur)
+                        if alpha >= beta:
+                            break
+
+        if meilleur <= alpha_initial:
+            type_entree = MAXIMUM
+        elif meilleur >= beta:
+            type_entree = MINIMUM
+        else:
+            type_entree = EXACTE
+        self.table.ecrire(cle, (profondeur, meilleur, type_entree, self.permutations[symetrie][meilleur_coup]))
+        return meilleur
+
+    def _zone(self, occupees):
+        zone = 0
+        if self.rayon:
+            for position in range(self.m * self.n):
+                if occupees >> position & 1:
+                    zone |= self.voisinages[position]
+        return zone
+
+    def coups_racine(self, joueur, adversaire):
+        """
+        Retourne les coups à essayer à la racine, dans l'ordre de la recherche.
+        """
+        occupees = joueur | adversaire
+        return self._coups(occupees, self._zone(occupees), None)
+
+    def valeur_coup(self, joueur, adversaire, position, alpha, beta):
+        """
+        Cherche la valeur d'un coup de la racine pour le joueur dont c'est le tour, dans la fenêtre (alpha, beta):
+        une valeur inférieure ou égale à alpha n'est qu'une borne supérieure de la vraie valeur.
+
+        Returns:
+            int: La valeur du coup, à la profondeur que choisir_coup utiliserait pour la position.
+        """
+        occupees = joueur | adversaire
+        nb_vides = self.m * self.n - bin(occupees).count("1")
+        profondeur = nb_vides if self.profondeur is None else min(self.profondeur, nb_vides)
+        self.noeuds = 1
+        bit = 1 << position
+        if self._complete_ligne(joueur | bit, position):
+            return GAGNE - (self.m * self.n - nb_vides + 1)
+        if occupees | bit == self.plein:
+            return 0
+        enfant = joueur | bit
+        hachages_joueur, hachages_adversaire = self._hachages(adversaire, enfant)
+        if self.menaces is not None:
+            self.menaces.charger(adversaire, enfant)
+        return -self._negamax(adversaire, enfant, hachages_joueur, hachages_adversaire,
+                              self._zone(occupees | bit), profondeur - 1, -beta, -alpha)
+
+    def choisir_coup(self, joueur, adversaire):
+        """
+        Cherche le meilleur coup pour le joueur dont c'est le tour et met à jour les statistiques:
+        nœuds visités, consultations et succès de la table de transposition pour ce coup.
+        Le moteur étant partagé par les parties du processus, il ne cherche qu'un coup à la fois.
+
+        Args:
+            joueur (int): Le bitboard du joueur dont c'est le tour.
+            adversaire (int): Le bitboard de son adversaire.
+
+        Returns:
+            int: La position (ligne * n + colonne) de la case à jouer.
+        """
+        with self.verrou:
+            return self._choisir_coup(joueur, adversaire)
+
+    def _choisir_coup(self, joueur, adversaire):
+        occupees = joueur | adversaire
+        assert occupees != self.plein, "Moteur: le plateau est plein."
+
+        nb_vides = self.m * self.n - bin(occupees).count("1")
+        profondeur = nb_vides if self.profondeur is None else min(self.profondeur, nb_vides)
+        zone = self._zone(occupees)
+
+        self.noeuds = 0
+        consultations, succes = self.table.consultations, self.table.succes
+        debut = time.perf_counter()
+        hachages_joueur, hachages_adversaire = self._hachages(joueur, adversaire)
+        if self.menaces is not None:
+            self.menaces.charger(joueur, adversaire)
+        valeur = self._negamax(joueur, adversaire, hachages_joueur, hachages_adversaire, zone, profondeur,
+                               -2 * GAGNE, 2 * GAGNE)
+        # L'entrée de la racine est la dernière écrite: elle contient le meilleur coup.
+        cle, symetrie = min(zip(hachages_joueur, range(len(hachages_joueur))))
+        coup = self.inverses[symetrie][self.table.entrees[cle][3]]
+
+        consultations = self.table.consultations - consultations
+        succes = self.table.succes - succes
+        self.statistiques = {
+            "noeuds": self.noeuds,
+            "consultations": consultations,
+            "succes": succes,
+            "taux_succes": succes / consultations if consultations else 0.0,
+            "evictions": self.table.evictions,
+            "valeur": valeur,
+            "duree": time.perf_counter() - debut,
+        }
+        return coup
+
+
+# Moteur et meilleure valeur partagée d'un processus de la recherche parallèle.
+_moteur_processus = None
+_borne = None
+
+
+def _initialiser_processus(m, n, k, profondeur, rayon, borne):
+    global _moteur_processus, _borne
+    _moteur_processus = Moteur(m, n, k, profondeur, rayon)
+    _borne = borne
+
+
+def _chercher_coup(joueur, adversaire, position):
+    """
+    Tâche d'un processus: cherche un coup de la racine avec, comme alpha, la meilleure valeur déjà trouvée par
+    les autres processus, et la partage si elle l'améliore.
+
+    Returns:
+        (int,int,bool,int): Le coup, sa valeur, vrai si la valeur est exacte (et non une borne), et les nœuds visités.
+    """
+    alpha = _borne.value
+    valeur = _moteur_processus.valeur_coup(joueur, adversaire, position, alpha, 2 * GAGNE)
+    if valeur > alpha:
+        with _borne.get_lock():
+            if valeur > _borne.value:
+                _borne.value = valeur
+    return position, valeur, valeur > alpha, _moteur_processus.noeuds
+
+
+class RechercheParallele:
+    """
+    Classe modélisant une recherche alpha-bêta dont les coups de la racine sont répartis sur un groupe de
+    processus, créé au premier coup et gardé ensuite. Chaque processus a son propre Moteur (et sa table de
+    transposition); seule la meilleure valeur trouvée à la racine est partagée, en mémoire partagée, et sert de
+    borne aux coups cherchés ensuite. Les positions sont envoyées sous forme de deux entiers (les bitboards).
+
+    Attributes:
+        nb_processus    (int)   : Le nombre de processus.
+        statistiques    (dict)  : Les nœuds visités, la valeur et la durée du dernier coup.
+    """
+
+    def __init__(self, m=3, n=3, k=3, profondeur=3, rayon=1, nb_processus=None):
+        self.m = m
+        self.n = n
+        self.k = k
+        self.profondeur = profondeur
+        self.rayon = rayon
+        self.nb_processus = nb_processus or multiprocessing.cpu_count()
+        self.moteur = Moteur(m, n, k, profondeur, rayon, taille_table=1)
+        self.borne = multiprocessing.Value("q", 0)
+        self.executeur = None
+        # Une seule recherche à la fois: la borne partagée est celle de la recherche en cours.
+        self.verrou = threading.Lock()
+        self.statistiques = {}
+
+    def choisir_coup(self, joueur, adversaire):
+        """
+        Cherche le meilleur coup pour le joueur dont c'est le tour (voir Moteur.choisir_coup).
+
+        Returns:
+            int: La position (ligne * n + colonne) de la case à jouer.
+        """
+        assert joueur | adversaire != self.moteur.plein, "RechercheParallele: le plateau est plein."
+        with self.verrou:
+            if self.executeur is None:
+                self.executeur = ProcessPoolExecutor(
+                    self.nb_processus, initializer=_initialiser_processus,
+                    initargs=(self.m, self.n, self.k, self.profondeur, self.rayon, self.borne))
+            debut = time.perf_counter()
+            coups = self.moteur.coups_racine(joueur, adversaire)
+            rangs = {position: rang for rang, position in enumerate(coups)}
+            self.borne.value = -2 * GAGNE
+            futurs = [self.executeur.submit(_chercher_coup, joueur, adversaire, position) for position in coups]
+            meilleur = meilleur_coup = None
+            noeuds = 0
+            for futur in as_completed(futurs):
+                position, valeur, exacte, noeuds_coup = futur.result()
+                noeuds += noeuds_coup
+                # À valeur égale, le coup qui vient en premier dans l'ordre de la recherche est gardé.
+                if exacte and (meilleur is None or (valeur, -rangs[position]) > (meilleur, -rangs[meilleur_coup])):
+                    meilleur, meilleur_coup = valeur, position
+            self.statistiques = {
+                "noeuds": noeuds,
+                "valeur": meilleur,
+                "duree": time.perf_counter() - debut,
+                "processus": self.nb_processus,
+            }
+            return meilleur_coup
+
+
+# Nombre de processus de la recherche sur les grands plateaux (voir configurer_parallele).
+_nb_processus_recherche = 0
+
+# Moteurs partagés par toutes les parties du processus, un par format de plateau.
+_moteurs = {}
+
+
+def configurer_parallele(nb_processus):
+    """
+    Répartit (nb_processus > 1) ou non la recherche des grands plateaux sur des processus. S'applique aux
+    moteurs créés ensuite par moteur().
+    """
+    global _nb_processus_recherche
+    assert isinstance(nb_processus, int) and nb_processus >= 0, "recherche: nb_processus doit être positif ou nul."
+    _nb_processus_recherche = nb_processus
+
+
+def moteur(m=3, n=3, k=3):
+    """
+    Retourne le moteur partagé pour un format de plateau, avec des réglages adaptés à sa taille:
+    recherche exacte jusqu'à 16 cases, sinon une profondeur et un voisinage limités, la recherche étant
+    répartie sur plusieurs processus si configurer_parallele l'a demandé.
+
+    Returns:
+        Moteur: Le moteur de ce format de plateau (ou une RechercheParallele, qui a la même méthode choisir_coup).
+    """
+    if (m, n, k) not in _moteurs:
+        if m * n <= 16:
+            _moteurs[m, n, k] = Moteur(m, n, k)
+        elif _nb_processus_recherche > 1:
+            _moteurs[m, n, k] = RechercheParallele(m, n, k, profondeur=3, rayon=1,
+                                                   nb_processus=_nb_processus_recherche)
+        else:
+            _moteurs[m, n, k] = Moteur(m, n, k, profondeur=3, rayon=1)
+    return _moteurs[m, n, k]
@@ -0,0 +1,285 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le solveur rétrograde des plateaux d'au plus 16 cases (jusqu'à 4 x 4, pour tout k) et le
+joueur du niveau "retrograde" qui s'en sert.
+
+Chaque position est indexée par son rang en base 3, où la case p compte pour 3 ** p et vaut 0 (vide), 1 (X)
+ou 2 (O). Sa valeur tient sur 2 bits dans un tableau NumPy (quatre positions par octet): 3 ** 16 positions
+occupent ainsi un peu moins de 11 Mo. Les valeurs sont calculées par induction à rebours, couche par couche,
+du plateau plein jusqu'au plateau vide: une position de s pions ne dépend que de celles de s + 1 pions, et
+toute une couche est traitée par des opérations vectorielles.
+
+Après chaque couche, le fichier est réécrit (puis renommé en place) avec le nombre de couches qui restent à
+résoudre: une résolution interrompue reprend à la première couche manquante.
+    python retrograde.py [-m 4] [-n 4] [-k 3] [-o chemin]
+
+Format du fichier (ordre des octets petit-boutiste):
+    En-tête (17 octets):    "RETR", version, m, n, k, couches restantes, nombre de positions (uint64).
+    Valeurs:                ceil(nombre / 4) octets, 2 bits par position, la position de rang r dans les bits
+                            2 * (r % 4) et 2 * (r % 4) + 1 de l'octet r // 4.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+from plateau import lignes_par_case, ouverture_par_x
+
+MAGIQUE = b"RETR"
+VERSION = 1
+EN_TETE = struct.Struct("<4sBBBBBQ")
+
+# Valeurs d'une position (2 bits). INCONNUE: position impossible (l'adversaire du dernier joueur a déjà gagné)
+# ou pas encore résolue.
+INCONNUE, VICTOIRE_X, VICTOIRE_O, NULLE = 0, 1, 2, 3
+
+# Score de chaque valeur du point de vue de X (X le maximise, O le minimise), et la valeur de chaque score.
+_SCORES = np.array([0, 2, 0, 1], dtype=np.int8)
+_VALEURS = np.array([VICTOIRE_O, NULLE, VICTOIRE_X], dtype=np.uint8)
+
+# Taille des tranches de rangs lors de l'énumération des couches.
+_TRANCHE = 3 ** 12
+
+
+def chemin_table(m=3, n=3, k=3):
+    """
+    Retourne le chemin par défaut de la table d'un format de plateau (à côté de ce module).
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "retrograde_{}x{}x{}.bin".format(m, n, k))
+
+
+def _lire_valeurs(valeurs, rangs):
+    return valeurs[rangs >> 2] >> ((rangs & 3) << 1).astype(np.uint8) & 3
+
+
+def _chiffres(rangs, nb_cases):
+    """
+    Retourne le contenu (0, 1 ou 2) des cases de chaque position, une ligne par rang.
+    """
+    chiffres = np.empty((len(rangs), nb_cases), dtype=np.uint8)
+    reste = rangs.copy()
+    for position in range(nb_cases):
+        chiffres[:, position] = reste % 3
+        reste //= 3
+    return chiffres
+
+
+def couches(nb_cases):
+    """
+    Retourne les rangs des positions de chaque couche: la couche s contient, en ordre croissant, les positions de
+    s pions où X a joué ceil(s / 2) fois et O floor(s / 2) fois.
+    """
+    tranches = [[] for _ in range(nb_cases + 1)]
+    for debut in range(0, 3 ** nb_cases, _TRANCHE):
+        rangs = np.arange(debut, min(debut + _TRANCHE, 3 ** nb_cases), dtype=np.uint32)
+        chiffres = _chiffres(rangs, nb_cases)
+        nb_x = np.count_nonzero(chiffres == 1, axis=1)
+        nb_o = np.count_nonzero(chiffres == 2, axis=1)
+        valides = (nb_x - nb_o == 0) | (nb_x - nb_o == 1)
+        rangs, pions = rangs[valides], (nb_x + nb_o)[valides]
+        for s in range(nb_cases + 1):
+            tranches[s].append(rangs[pions == s])
+    return [np.concatenate(tranche) for tranche in tranches]
+
+
+def _gagnants(bits, lignes):
+    gagne = np.zeros(len(bits), dtype=bool)
+    for masque in lignes:
+        gagne |= bits & masque == masque
+    return gagne
+
+
+def resoudre_couche(valeurs, rangs, s, nb_cases, lignes):
+    """
+    Résout les positions d'une couche, à partir des valeurs de la couche suivante, et les écrit dans valeurs.
+    """
+    chiffres = _chiffres(rangs, nb_cases)
+    bits_x = np.zeros(len(rangs), dtype=np.uint32)
+    bits_o = np.zeros(len(rangs), dtype=np.uint32)
+    for position in range(nb_cases):
+        bits_x |= (chiffres[:, position] == 1).astype(np.uint32) << position
+        bits_o |= (chiffres[:, position] == 2).astype(np.uint32) << position
+
+    # X joue quand la couche est paire; le dernier à avoir joué est donc O dans une couche paire (non vide).
+    x_joue = s % 2 == 0
+    dernier, autre = (bits_o, bits_x) if x_joue else (bits_x, bits_o)
+    resultat = np.full(len(rangs), NULLE, dtype=np.uint8)
+    if s > 0:
+        terminale = _gagnants(dernier, lignes)
+        resultat[terminale] = VICTOIRE_O if x_joue else VICTOIRE_X
+        resultat[_gagnants(autre, lignes) & ~terminale] = INCONNUE
+        en_cours = (resultat == NULLE) if s < nb_cases else np.zeros(len(rangs), dtype=bool)
+    else:
+        en_cours = np.ones(len(rangs), dtype=bool)
+
+    if en_cours.any():
+        rangs_en_cours, chiffres = rangs[en_cours], chiffres[en_cours]
+        meilleur = np.full(len(rangs_en_cours), -1 if x_joue else 3, dtype=np.int8)
+        for position in range(nb_cases):
+            libres = chiffres[:, position] == 0
+            enfants = rangs_en_cours[libres] + np.uint32((1 if x_joue else 2) * 3 ** position)
+            scores = _SCORES[_lire_valeurs(valeurs, enfants)]
+            if x_joue:
+                meilleur[libres] = np.maximum(meilleur[libres], scores)
+            else:
+                meilleur[libres] = np.minimum(meilleur[libres], scores)
+        resultat[en_cours] = _VALEURS[meilleur]
+
+    # Les rangs d'une couche sont distincts, mais plusieurs partagent un octet: l'écriture doit être cumulative.
+    np.bitwise_or.at(valeurs, rangs >> 2, resultat << ((rangs & 3) << 1).astype(np.uint8))
+
+
+def _ecrire(chemin, m, n, k, restantes, valeurs):
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "wb") as fichier:
+        fichier.write(EN_TETE.pack(MAGIQUE, VERSION, m, n, k, restantes, 3 ** (m * n)))
+        fichier.write(valeurs.tobytes())
+        fichier.flush()
+        os.fsync(fichier.fileno())
+    os.replace(temporaire, chemin)
+
+
+def resoudre(chemin, m=4, n=4, k=3, afficher=None):
+    """
+    Résout toutes les positions d'un format de plateau et écrit la table, en reprenant le fichier s'il contient
+    une résolution interrompue du même format.
+
+    Args:
+        chemin (string): Le chemin du fichier de la table.
+        m (int): Le nombre de lignes du plateau.
+        n (int): Le nombre de colonnes du plateau.
+        k (int): Le nombre de pions à aligner pour gagner.
+        afficher (callable): Fonction appelée avec (couche, nombre de positions, durée) après chaque couche.
+
+    Returns:
+        int: La valeur du plateau vide (VICTOIRE_X, VICTOIRE_O ou NULLE).
+    """
+    nb_cases = m * n
+    assert nb_cases <= 16, "Retrograde: la résolution est limitée aux plateaux de 16 cases."
+    valeurs, restantes = None, nb_cases + 1
+    if os.path.exists(chemin):
+        with open(chemin, "rb") as fichier:
+            magique, version, *format_, restantes_lues, nombre = EN_TETE.unpack(fichier.read(EN_TETE.size))
+            if magique == MAGIQUE and version == VERSION and tuple(format_) == (m, n, k):
+                valeurs = np.frombuffer(fichier.read(), dtype=np.uint8).copy()
+                restantes = restantes_lues
+    if valeurs is None or len(valeurs) != (3 ** nb_cases + 3) // 4:
+        valeurs, restantes = np.zeros((3 ** nb_cases + 3) // 4, dtype=np.uint8), nb_cases + 1
+
+    lignes = sorted(set(masque for masques in lignes_par_case(m, n, k) for masque in masques))
+    if restantes:
+        rangs = couches(nb_cases)
+        for s in range(restantes - 1, -1, -1):
+            debut = time.perf_counter()
+            resoudre_couche(valeurs, rangs[s], s, nb_cases, lignes)
+            _ecrire(chemin, m, n, k, s, valeurs)
+            if afficher is not None:
+                afficher(s, len(rangs[s]), time.perf_counter() - debut)
+    return int(_lire_valeurs(valeurs, np.array([0], dtype=np.uint32))[0])
+
+
+class TableRetrograde:
+    """
+    Classe modélisant une table résolue, ouverte en lecture et projetée en mémoire.
+
+    Attributes:
+        m, n, k     (int)           : Le format de plateau de la table.
+        valeurs     (memoryview)    : Les valeurs des positions, 2 bits par position.
+    """
+
+    def __init__(self, chemin):
+        """
+        Méthode spéciale ouvrant une table complètement résolue.
+
+        Args:
+            chemin (string): Le chemin du fichier.
+        """
+        with open(chemin, "rb") as fichier:
+            self.memoire = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, version, self.m, self.n, self.k, restantes, nombre = EN_TETE.unpack_from(self.memoire)
+        assert magique == MAGIQUE and version == VERSION, "Retrograde: fichier invalide."
+        assert restantes == 0, "Retrograde: la résolution de la table n'est pas terminée."
+        self.valeurs = memoryview(self.memoire)[EN_TETE.size:]
+        assert len(self.valeurs) == (nombre + 3) // 4, "Retrograde: taille de fichier invalide."
+        self.nb_cases = self.m * self.n
+        self.lignes = lignes_par_case(self.m, self.n, self.k)
+
+    def valeur(self, rang):
+        return self.valeurs[rang >> 2] >> ((rang & 3) << 1) & 3
+
+    def choisir_coup(self, bits_x, bits_o, pion):
+        """
+        Retourne le meilleur coup de pion: une victoire immédiate s'il y en a une, sinon le premier coup qui
+        conserve la meilleure valeur (gagner, puis faire nulle). Si O a ouvert la partie, la position est lue
+        avec les pions échangés (voir plateau.ouverture_par_x).
+
+        Args:
+            bits_x (int): Le bitboard de X.
+            bits_o (int): Le bitboard de O.
+            pion (string): Le pion qui joue ("X" ou "O").
+
+        Returns:
+            int: La position du coup (ligne * n + colonne).
+        """
+        bits_x, bits_o, pion = ouverture_par_x(bits_x, bits_o, pion)
+        rang = 0
+        for position in range(self.nb_cases):
+            if bits_x >> position & 1:
+                rang += 3 ** position
+            elif bits_o >> position & 1:
+                rang += 2 * 3 ** position
+        chiffre, victoire, bits = (1, VICTOIRE_X, bits_x) if pion == "X" else (2, VICTOIRE_O, bits_o)
+        preferences = (victoire, NULLE)
+        meilleur, meilleur_ordre = None, len(preferences)
+        for position in range(self.nb_cases):
+            if (bits_x | bits_o) >> position & 1:
+                continue
+            essai = bits | 1 << position
+            if any(essai & masque == masque for masque in self.lignes[position]):
+                return position
+            valeur = self.valeur(rang + chiffre * 3 ** position)
+            ordre = preferences.index(valeur) if valeur in preferences else len(preferences)
+            if meilleur is None or ordre < meilleur_ordre:
+                meilleur, meilleur_ordre = position, ordre
+        return meilleur
+
+
+# Tables ouvertes par le processus, une par format de plateau (None si le fichier n'est pas résolu).
+_tables = {}
+
+
+def table_retrograde(m=3, n=3, k=3):
+    """
+    Retourne la table d'un format de plateau, ouverte au premier appel, ou None si elle n'a pas été résolue.
+    """
+    if (m, n, k) not in _tables:
+        chemin = chemin_table(m, n, k)
+        table = None
+        if os.path.exists(chemin):
+            with open(chemin, "rb") as fichier:
+                en_tete = EN_TETE.unpack(fichier.read(EN_TETE.size))
+            if en_tete[5] == 0:
+                table = TableRetrograde(chemin)
+        _tables[m, n, k] = table
+    return _tables[m, n, k]
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Résout toutes les positions d'un format de plateau.")
+    analyseur.add_argument("-m", type=int, default=4)
+    analyseur.add_argument("-n", type=int, default=4)
+    analyseur.add_argument("-k", type=int, default=3)
+    analyseur.add_argument("-o", "--sortie", default=None, help="chemin de la table (défaut: retrograde_MxNxK.bin)")
+    arguments = analyseur.parse_args()
+
+    sortie = arguments.sortie or chemin_table(arguments.m, arguments.n, arguments.k)
+    debut = time.perf_counter()
+    valeur = resoudre(sortie, arguments.m, arguments.n, arguments.k,
+                      lambda s, nombre, duree: print("couche {:>2}: {:>9} positions en {:.2f} s".format(s, nombre, duree)))
+    print("Plateau vide: {} ({} en {:.2f} s)".format({VICTOIRE_X: "X gagne", VICTOIRE_O: "O gagne", NULLE: "nulle"}[valeur],
+                                                    sortie, time.perf_counter() - debut))
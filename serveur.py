@@ -0,0 +1,364 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient un serveur asyncio qui héberge plusieurs parties contre l'ordinateur en même temps,
+sur un port TCP ou un socket Unix. Chaque connexion a sa propre Partie, menée par un protocole texte d'une
+commande par ligne plutôt que par input(). Les coups de l'ordinateur qui demandent une recherche sont
+calculés dans un fil séparé pour ne jamais bloquer la boucle d'événements.
+
+Protocole (une commande par ligne, réponses terminées par une ligne vide):
+    NOM <nom>                           Change le nom du joueur.
+    PARTIE <X|O> [niveau] [m n k]       Commence une partie; la personne joue en premier.
+    JOUER <ligne> <colonne>             Joue un coup, suivi de la réponse de l'ordinateur.
+    ANNULER / REFAIRE                   Annule (ou refait) le dernier coup de chaque joueur.
+    PLATEAU                             Retourne "PLATEAU m n cases", les cases en ordre de lecture ("." si vide).
+    STATS                               Retourne "STATS gagnees_personne gagnees_ordinateur nulles".
+    MESURES                             Retourne les mesures de l'instrumentation au format texte de Prometheus.
+    QUITTER                             Ferme la connexion.
+Les autres réponses sont "OK", "COUP ligne colonne pion", "FIN nom_du_gagnant" ou "FIN NULLE" et "ERREUR message".
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import instrumentation
+import recherche
+from archive import EcrivainArchive
+from joueur import Joueur
+from partie import Partie
+from plateau import NIVEAUX
+from statistiques import MagasinStatistiques
+
+# Niveaux dont le coup se calcule en un temps négligeable: ils sont joués directement dans la boucle d'événements.
+NIVEAUX_RAPIDES = ("normal", "parfait")
+
+# Nombre maximal de lignes et de colonnes d'un plateau demandé par un client.
+TAILLE_MAX = 15
+
+# Nombre de connexions en attente d'acceptation (la valeur par défaut d'asyncio, 100, est trop petite quand
+# des milliers de clients se connectent en même temps).
+FILE_ATTENTE = 4096
+
+AIDE = "Commandes: NOM, PARTIE <X|O> [niveau] [m n k], JOUER <ligne> <colonne>, ANNULER, REFAIRE, PLATEAU, STATS, MESURES, QUITTER"
+
+
+class Session:
+    """
+    Classe modélisant la session d'un client connecté au serveur.
+
+    Attributes:
+        serveur     (obj Serveur)   : Le serveur qui calcule les coups de l'ordinateur.
+        nom         (str)           : Le nom du joueur.
+        partie      (obj Partie)    : La partie de la session (None avant la première commande PARTIE).
+        en_cours    (bool)          : Vrai si un match est commencé et pas encore terminé.
+    """
+
+    def __init__(self, serveur):
+        """
+        Méthode spéciale initialisant une nouvelle session.
+
+        Args:
+            serveur (Serveur): Le serveur qui héberge la session.
+        """
+        self.serveur = serveur
+        self.nom = "Joueur"
+        self.partie = None
+        self.en_cours = False
+
+    def plateau_en_texte(self):
+        plateau = self.partie.plateau
+        cases = "".join(plateau.contenu(ligne, colonne) for ligne in range(plateau.m) for colonne in range(plateau.n))
+        return "PLATEAU {} {} {}".format(plateau.m, plateau.n, cases.replace(" ", "."))
+
+    async def traiter(self, commande):
+        """
+        Exécute une commande du protocole.
+
+        Args:
+            commande (string): La ligne reçue du client, sans le saut de ligne.
+
+        Returns:
+            list: Les lignes de la réponse.
+        """
+        mots = commande.split()
+        if not mots:
+            return ["ERREUR " + AIDE]
+        action, arguments = mots[0].upper(), mots[1:]
+
+        if action == "NOM":
+            if not arguments:
+                return ["ERREUR Le nom est vide."]
+            self.nom = " ".join(arguments)
+            return ["OK"]
+        if action == "PARTIE":
+            return self.commencer(arguments)
+        if action == "MESURES":
+            if instrumentation.mesures is None:
+                return ["ERREUR L'instrumentation est désactivée (option --mesures du serveur)."]
+            return instrumentation.mesures.en_prometheus().splitlines()
+        if action == "STATS":
+            if self.partie is None:
+                return ["STATS 0 0 0"]
+            personne, ordinateur = self.partie.joueurs
+            return ["STATS {} {} {}".format(personne.nb_parties_gagnees, ordinateur.nb_parties_gagnees,
+                                            self.partie.nb_parties_nulles)]
+        if action not in ("JOUER", "ANNULER", "REFAIRE", "PLATEAU"):
+            return ["ERREUR Commande inconnue. " + AIDE]
+        if self.partie is None:
+            return ["ERREUR Aucune partie. Utilisez PARTIE <X|O>."]
+        if action == "PLATEAU":
+            return [self.plateau_en_texte()]
+        if not self.en_cours:
+            return ["ERREUR Le match est terminé. Utilisez PARTIE <X|O> pour recommencer."]
+        if action == "JOUER":
+            return await self.jouer(arguments)
+        return self.annuler_ou_refaire(action)
+
+    def commencer(self, arguments):
+        """
+        Commence un match. La Partie (et ses statistiques) est gardée tant que les dimensions ne changent pas.
+        """
+        if not arguments or arguments[0].upper() not in ("X", "O"):
+            return ["ERREUR Usage: PARTIE <X|O> [niveau] [m n k]"]
+        pion = arguments[0].upper()
+        niveau = arguments[1].lower() if len(arguments) > 1 else "normal"
+        if niveau not in NIVEAUX:
+            return ["ERREUR Niveau inconnu. Niveaux: " + ", ".join(NIVEAUX)]
+        dimensions = arguments[2:]
+        if dimensions:
+            if len(dimensions) != 3 or not all(d.isdecimal() for d in dimensions):
+                return ["ERREUR Les dimensions sont trois entiers: m n k."]
+            m, n, k = (int(d) for d in dimensions)
+            if not (0 < m <= TAILLE_MAX and 0 < n <= TAILLE_MAX and 0 < k <= max(m, n)):
+                return ["ERREUR Dimensions invalides (m et n entre 1 et {}, k entre 1 et max(m, n)).".format(TAILLE_MAX)]
+        else:
+            m, n, k = 3, 3, 3
+        if niveau == "parfait" and (m, n, k) != (3, 3, 3):
+            return ["ERREUR Le niveau parfait n'existe qu'en 3 x 3."]
+
+        plateau = None if self.partie is None else self.partie.plateau
+        if plateau is None or (plateau.m, plateau.n, plateau.k) != (m, n, k):
+            self.partie = Partie(m, n, k)
+            if self.serveur.archive is not None and self.serveur.archive.dimensions == (m, n, k):
+                self.partie.archive = self.serveur.archive
+            self.partie.magasin = self.serveur.magasin
+            personne = ordinateur = None
+        else:
+            personne, ordinateur = self.partie.joueurs
+        autre = "O" if pion == "X" else "X"
+        nouvelle_personne = Joueur("PERSONNE", pion, "1", self.nom)
+        nouvel_ordinateur = Joueur("ORDINATEUR", autre, "2", "Colosse", niveau)
+        if personne is not None:
+            nouvelle_personne.nb_parties_gagnees = personne.nb_parties_gagnees
+            nouvel_ordinateur.nb_parties_gagnees = ordinateur.nb_parties_gagnees
+        self.partie.joueurs = [nouvelle_personne, nouvel_ordinateur]
+
+        self.partie.plateau.initialiser()
+        self.partie.coups_annules.clear()
+        self.en_cours = True
+        return ["OK", self.plateau_en_texte()]
+
+    async def verifier_fin(self, joueur, reponses):
+        """
+        Comme Partie.tour: met à jour les statistiques si le coup de joueur termine le match. La ligne FIN
+        n'est ajoutée qu'une fois le résultat écrit et synchronisé dans le magasin des statistiques.
+        """
+        partie = self.partie
+        if partie.plateau.est_gagnant(joueur.pion):
+            joueur.nb_parties_gagnees += 1
+            partie.joueur_gagnant = joueur.nom
+            fin = "FIN " + joueur.nom
+        elif not partie.plateau.non_plein():
+            partie.nb_parties_nulles += 1
+            partie.joueur_gagnant = "Partie Nulle"
+            fin = "FIN NULLE"
+        else:
+            return False
+        self.en_cours = False
+        if partie.archive is not None:
+            partie.archive.ecrire_partie(partie)
+        if partie.magasin is not None:
+            try:
+                numero = partie.magasin.enregistrer_partie(partie)
+            except OSError as erreur:
+                reponses.append("ERREUR Le résultat n'a pas pu être enregistré: {}".format(erreur))
+            else:
+                try:
+                    # Le fsync commun est attendu hors de la boucle d'événements.
+                    await asyncio.get_running_loop().run_in_executor(None, partie.magasin.attendre, numero)
+                except OSError as erreur:
+                    reponses.append("ERREUR Le résultat n'est pas encore écrit (nouvel essai en cours): {}".format(erreur))
+        reponses.append(fin)
+        return True
+
+    async def jouer(self, arguments):
+        """
+        Joue le coup de la personne puis, si le match n'est pas terminé, celui de l'ordinateur.
+        """
+        plateau = self.partie.plateau
+        if len(arguments) != 2 or not all(a.isdecimal() for a in arguments):
+            return ["ERREUR Usage: JOUER <ligne> <colonne>"]
+        ligne, colonne = int(arguments[0]), int(arguments[1])
+        if ligne >= plateau.m or colonne >= plateau.n:
+            return ["ERREUR La case est hors du plateau."]
+        if not plateau.position_valide(ligne, colonne):
+            return ["ERREUR La case est déjà occupée."]
+
+        personne, ordinateur = self.partie.joueurs
+        plateau.selectionner_case(ligne, colonne, personne.pion)
+        self.partie.coups_annules.clear()
+        reponses = ["COUP {} {} {}".format(ligne, colonne, personne.pion)]
+        if not await self.verifier_fin(personne, reponses):
+            ligne, colonne = await self.serveur.coup_ordinateur(plateau, personne.pion, ordinateur.niveau)
+            plateau.jouer_coup(ligne * plateau.n + colonne, ordinateur.pion)
+            reponses.append("COUP {} {} {}".format(ligne, colonne, ordinateur.pion))
+            await self.verifier_fin(ordinateur, reponses)
+        reponses.append(self.plateau_en_texte())
+        return reponses
+
+    def annuler_ou_refaire(self, action):
+        """
+        Comme Partie.tour contre l'ordinateur: annule (ou refait) le coup de l'ordinateur et celui de la personne.
+        """
+        if action == "ANNULER":
+            if len(self.partie.plateau.historique) < 2:
+                return ["ERREUR Il n'y a aucun coup à annuler."]
+            self.partie.annuler_coup()
+            self.partie.annuler_coup()
+        else:
+            if len(self.partie.coups_annules) < 2:
+                return ["ERREUR Il n'y a aucun coup à refaire."]
+            self.partie.refaire_coup()
+            self.partie.refaire_coup()
+        return ["OK", self.plateau_en_texte()]
+
+
+class Serveur:
+    """
+    Classe modélisant le serveur de parties.
+
+    Attributes:
+        executeur   (ThreadPoolExecutor)    : Les fils qui calculent les coups de l'ordinateur.
+        archive     (obj EcrivainArchive)   : L'archive des matchs terminés (None pour ne rien archiver).
+        magasin     (obj MagasinStatistiques): Les statistiques persistantes des joueurs (None pour les garder en mémoire).
+        sessions    (set)                   : Les sessions des clients connectés.
+    """
+
+    def __init__(self, nb_fils=1, archive=None, magasin=None):
+        """
+        Méthode spéciale initialisant le serveur.
+
+        Args:
+            nb_fils (int): Le nombre de fils calculant les coups de l'ordinateur. Par défaut un seul: les moteurs
+                           de recherche partagés (voir recherche.moteur) ne cherchent qu'un coup à la fois, mais
+                           les coups déjà dans le cache des décisions (voir cache_decisions.py) se lisent en
+                           parallèle.
+            archive (EcrivainArchive): L'archive où ajouter les matchs terminés dont les dimensions correspondent.
+            magasin (MagasinStatistiques): Le magasin où enregistrer le résultat de chaque match.
+        """
+        assert isinstance(nb_fils, int) and nb_fils > 0, "Serveur: nb_fils doit être un entier positif."
+        self.executeur = ThreadPoolExecutor(nb_fils)
+        self.sessions = set()
+        self.archive = archive
+        self.magasin = magasin
+
+    async def coup_ordinateur(self, plateau, pion, niveau):
+        """
+        Retourne le coup de l'ordinateur sans bloquer la boucle d'événements.
+
+        Args:
+            plateau (Plateau): Le plateau de la session (aucune autre commande de la session n'y touche pendant le calcul).
+            pion (string): Le pion de l'adversaire de l'ordinateur.
+            niveau (string): Le niveau de l'ordinateur.
+
+        Returns:
+            (int,int): Les coordonnées de la case choisie.
+        """
+        mesures = instrumentation.mesures
+        debut = time.perf_counter_ns() if mesures is not None else 0
+        if niveau in NIVEAUX_RAPIDES:
+            coup = plateau.choisir_prochaine_case(pion, niveau)
+        else:
+            boucle = asyncio.get_running_loop()
+            coup = await boucle.run_in_executor(self.executeur, plateau.choisir_prochaine_case, pion, niveau)
+        if mesures is not None:
+            mesures.observer("reflexion", time.perf_counter_ns() - debut, niveau=niveau)
+        return coup
+
+    async def client_connecte(self, lecteur, ecrivain):
+        """
+        Sert un client jusqu'à ce qu'il envoie QUITTER ou ferme la connexion.
+        """
+        session = Session(self)
+        self.sessions.add(session)
+        try:
+            ecrivain.write("BIENVENUE {}\n\n".format(AIDE).encode())
+            await ecrivain.drain()
+            while True:
+                try:
+                    ligne = await lecteur.readline()
+                except ValueError:
+                    # Ligne plus longue que la limite du lecteur.
+                    break
+                if not ligne:
+                    break
+                commande = ligne.decode("utf-8", "replace").strip()
+                if commande.upper() == "QUITTER":
+                    ecrivain.write("***Merci et au revoir !***\n\n".encode())
+                    await ecrivain.drain()
+                    break
+                reponses = await session.traiter(commande)
+                ecrivain.write("".join(reponse + "\n" for reponse in reponses + [""]).encode())
+                await ecrivain.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            ecrivain.close()
+
+    async def servir(self, hote="127.0.0.1", port=8765, chemin_unix=None):
+        """
+        Accepte les connexions jusqu'à l'arrêt du programme.
+
+        Args:
+            hote (string): L'adresse d'écoute TCP.
+            port (int): Le port d'écoute TCP.
+            chemin_unix (string): Si donné, le chemin d'un socket Unix à utiliser plutôt que TCP.
+        """
+        if chemin_unix is not None:
+            serveur = await asyncio.start_unix_server(self.client_connecte, path=chemin_unix, backlog=FILE_ATTENTE)
+        else:
+            serveur = await asyncio.start_server(self.client_connecte, hote, port, backlog=FILE_ATTENTE)
+        async with serveur:
+            await serveur.serve_forever()
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Serveur de parties de tic-tac-toe.")
+    analyseur.add_argument("--hote", default="127.0.0.1")
+    analyseur.add_argument("-p", "--port", type=int, default=8765)
+    analyseur.add_argument("-u", "--unix", default=None, help="chemin d'un socket Unix (remplace TCP)")
+    analyseur.add_argument("-f", "--fils", type=int, default=1, help="fils pour les coups de l'ordinateur")
+    analyseur.add_argument("-a", "--archive", default=None, help="archive des matchs 3 x 3 terminés")
+    analyseur.add_argument("-s", "--statistiques", default=None, help="répertoire des statistiques des joueurs")
+    analyseur.add_argument("--mesures", action="store_true", help="active l'instrumentation (commande MESURES)")
+    analyseur.add_argument("--processus", type=int, default=0,
+                           help="processus de la recherche alpha-bêta des grands plateaux (défaut: aucun)")
+    arguments = analyseur.parse_args()
+
+    if arguments.mesures:
+        instrumentation.activer()
+    recherche.configurer_parallele(arguments.processus)
+    archive = None if arguments.archive is None else EcrivainArchive(arguments.archive)
+    magasin = None if arguments.statistiques is None else MagasinStatistiques(arguments.statistiques)
+    try:
+        asyncio.run(Serveur(arguments.fils, archive, magasin).servir(arguments.hote, arguments.port, arguments.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if archive is not None:
+            archive.fermer()
+        if magasin is not None:
+            magasin.fermer()
@@ -0,0 +1,275 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient un simulateur sans affichage qui joue des millions de parties de tic-tac-toe en lot.
+Les N plateaux sont gardés dans un tableau NumPy (N, 9) et chaque tour est joué sur tous les plateaux à la fois:
+les politiques de l'ordinateur sont vectorisées et la victoire est vérifiée par un seul produit matriciel
+contre les lignes gagnantes."""
+
+import argparse
+import time
+
+import numpy as np
+
+from plateau import LIGNES_GAGNANTES
+
+# Contenu d'une case dans le tableau des plateaux.
+VIDE, X, O = 0, 1, 2
+
+# LIGNES[position, l] vaut 1 si la position fait partie de la ligne gagnante l (matrice 9 x 8).
+LIGNES = np.array([[masque >> position & 1 for masque in LIGNES_GAGNANTES] for position in range(9)],
+                  dtype=np.float32)
+
+# Poids servant à convertir un plateau en son code en base 3 (0 <= code < 3**9).
+PUISSANCES = 3 ** np.arange(9, dtype=np.int32)
+
+
+def _decoder(code):
+    """
+    Retourne les bitboards (X, O) correspondant à un code en base 3.
+    """
+    bits_x = bits_o = 0
+    for position in range(9):
+        code, chiffre = divmod(code, 3)
+        if chiffre == X:
+            bits_x |= 1 << position
+        elif chiffre == O:
+            bits_o |= 1 << position
+    return bits_x, bits_o
+
+
+def _premiere_case_gagnante(bits, occupees):
+    """
+    Retourne la première position vide (en ordre de lecture) qui complète une ligne pour bits, ou -1.
+    """
+    for position in range(9):
+        bit = 1 << position
+        if not occupees & bit:
+            for masque in LIGNES_GAGNANTES:
+                if (bits | bit) & masque == masque:
+                    return position
+    return -1
+
+
+def _construire_table_normal(pion):
+    """
+    Déroule la partie déterministe de la politique "normal" (gagner, sinon bloquer) en un tableau dense
+    indexé par le code en base 3 du plateau. La valeur -1 signifie qu'il faut jouer au hasard.
+    """
+    table = np.empty(3 ** 9, dtype=np.int8)
+    for code in range(3 ** 9):
+        bits_x, bits_o = _decoder(code)
+        joueur, adversaire = (bits_x, bits_o) if pion == X else (bits_o, bits_x)
+        coup = _premiere_case_gagnante(joueur, bits_x | bits_o)
+        if coup < 0:
+            coup = _premiere_case_gagnante(adversaire, bits_x | bits_o)
+        table[code] = coup
+    return table
+
+
+# TABLES_NORMAL[pion][code]: coup déterministe de la politique "normal" pour le pion X ou O.
+TABLES_NORMAL = {X: _construire_table_normal(X), O: _construire_table_normal(O)}
+
+
+
+def _construire_tables_vides():
+    """
+    Construit NB_VIDES[code], le nombre de cases vides du plateau, et CASES_VIDES[code, r], sa r-ième case vide.
+    """
+    nb_vides = np.zeros(3 ** 9, dtype=np.int8)
+    cases_vides = np.zeros((3 ** 9, 9), dtype=np.int8)
+    for code in range(3 ** 9):
+        bits_x, bits_o = _decoder(code)
+        vides = [position for position in range(9) if not (bits_x | bits_o) >> position & 1]
+        nb_vides[code] = len(vides)
+        cases_vides[code, :len(vides)] = vides
+    return nb_vides, cases_vides
+
+NB_VIDES, CASES_VIDES = _construire_tables_vides()
+
+
+def _victoires(plateaux, pion):
+    """
+    Vérifie d'un seul produit matriciel quels plateaux contiennent une ligne gagnante pour le pion.
+
+    Returns:
+        ndarray: Un booléen par plateau (M,).
+    """
+    lignes_completes = (plateaux == pion).astype(np.float32) @ LIGNES == 3
+    # Les huit booléens d'un plateau occupent exactement un entier de 64 bits: il est non nul dès qu'une ligne l'est.
+    return lignes_completes.view(np.uint64).ravel() != 0
+
+
+def _coups_aleatoires(codes, pion, generateur):
+    """
+    Choisit une case vide au hasard (uniformément) sur chaque plateau.
+
+    Args:
+        codes (ndarray): Les codes en base 3 des plateaux (M,) sur lesquels c'est au pion de jouer.
+        pion (int): Le pion qui joue (X ou O).
+        generateur (Generator): Le générateur aléatoire NumPy.
+
+    Returns:
+        ndarray: La position choisie sur chaque plateau (M,).
+    """
+    # Un réel uniforme dans [0, 1) multiplié par le nombre de cases vides donne le rang de la case choisie.
+    rangs = (generateur.random(len(codes), dtype=np.float32) * NB_VIDES[codes]).astype(np.int32)
+    return CASES_VIDES.ravel()[codes * 9 + rangs]
+
+
+def _coups_normal(codes, pion, generateur):
+    """
+    Applique à tous les plateaux la même politique que Plateau.choisir_prochaine_case au niveau "normal":
+    gagner si possible, sinon bloquer l'adversaire, sinon jouer une case vide au hasard.
+    Comme dans Plateau, la première case trouvée en ordre de lecture est retenue. Les deux premières règles
+    sont lues d'un coup pour tous les plateaux dans TABLES_NORMAL.
+
+    Args:
+        codes (ndarray): Les codes en base 3 des plateaux (M,) sur lesquels c'est au pion de jouer.
+        pion (int): Le pion qui joue (X ou O).
+        generateur (Generator): Le générateur aléatoire NumPy.
+
+    Returns:
+        ndarray: La position choisie sur chaque plateau (M,).
+    """
+    coups = TABLES_NORMAL[pion][codes]
+    au_hasard = coups < 0
+    if au_hasard.any():
+        coups[au_hasard] = _coups_aleatoires(codes[au_hasard], pion, generateur)
+    return coups
+
+
+_table_parfaite = None
+
+
+def _coups_parfait(codes, pion, generateur):
+    """
+    Lit le coup de chaque plateau dans la table de jeu parfait, déroulée en un tableau dense indexé par le
+    code en base 3 du plateau. Le joueur dont c'est le tour se déduit du nombre de pions sur le plateau.
+
+    Args:
+        codes (ndarray): Les codes en base 3 des plateaux (M,) sur lesquels c'est au pion de jouer.
+        pion (int): Le pion qui joue (X ou O).
+        generateur (Generator): Le générateur aléatoire NumPy (inutilisé).
+
+    Returns:
+        ndarray: La position choisie sur chaque plateau (M,).
+    """
+    global _table_parfaite
+    if _table_parfaite is None:
+        from table_parfaite import coup_parfait
+        _table_parfaite = np.zeros(3 ** 9, dtype=np.int8)
+        for code in range(3 ** 9):
+            bits_x, bits_o = _decoder(code)
+            nb_x, nb_o = bin(bits_x).count("1"), bin(bits_o).count("1")
+            gagne = any(bits & m == m for bits in (bits_x, bits_o) for m in LIGNES_GAGNANTES)
+            if gagne or nb_x + nb_o == 9 or nb_x - nb_o not in (0, 1):
+                continue
+            if nb_x == nb_o:
+                _table_parfaite[code] = coup_parfait(bits_x, bits_o)
+            else:
+                _table_parfaite[code] = coup_parfait(bits_o, bits_x)
+    return _table_parfaite[codes]
+
+
+# Politiques disponibles, indexées par leur nom.
+POLITIQUES = {
+    "normal": _coups_normal,
+    "aleatoire": _coups_aleatoires,
+    "parfait": _coups_parfait,
+}
+
+
+def _jouer_lot(politique_x, politique_o, nb_parties, generateur):
+    """
+    Joue un lot de parties en parallèle. Les parties terminées sont retirées du tableau à chaque tour.
+    Le code en base 3 de chaque plateau est tenu à jour à chaque coup plutôt que recalculé.
+
+    Returns:
+        (int,int,int): Le nombre de victoires de X, de victoires de O et de parties nulles.
+    """
+    plateaux = np.zeros((nb_parties, 9), dtype=np.uint8)
+    codes = np.zeros(nb_parties, dtype=np.int32)
+    victoires = {X: 0, O: 0}
+    for tour in range(9):
+        pion = X if tour % 2 == 0 else O
+        politique = politique_x if pion == X else politique_o
+        coups = politique(codes, pion, generateur)
+        plateaux.ravel()[np.arange(0, plateaux.size, 9) + coups] = pion
+        codes += PUISSANCES[coups] * pion
+        # Aucune ligne ne peut être complète avant le cinquième coup.
+        if tour >= 4:
+            gagne = _victoires(plateaux, pion)
+            victoires[pion] += int(gagne.sum())
+            plateaux = plateaux[~gagne]
+            codes = codes[~gagne]
+            if len(plateaux) == 0:
+                break
+    return victoires[X], victoires[O], len(plateaux)
+
+
+def simuler(politique_x, politique_o, nb_parties, graine=None, taille_lot=200000):
+    """
+    Simule des parties entre deux politiques. X joue toujours en premier.
+
+    Args:
+        politique_x (string): Le nom de la politique qui joue X (voir POLITIQUES).
+        politique_o (string): Le nom de la politique qui joue O.
+        nb_parties (int): Le nombre de parties à simuler.
+        graine (int): La graine du générateur aléatoire, pour des résultats reproductibles.
+        taille_lot (int): Le nombre de parties jouées en même temps (limite la mémoire utilisée).
+
+    Returns:
+        dict: Le nombre de parties gagnées par "X", par "O" et de parties "nulles".
+    """
+    assert politique_x in POLITIQUES, "Simulateur: politique_x inconnue."
+    assert politique_o in POLITIQUES, "Simulateur: politique_o inconnue."
+    assert isinstance(nb_parties, int) and nb_parties >= 0, "Simulateur: nb_parties doit être un entier positif."
+
+    generateur = np.random.default_rng(graine)
+    resultats = {"X": 0, "O": 0, "nulles": 0}
+    for debut in range(0, nb_parties, taille_lot):
+        x, o, nulles = _jouer_lot(POLITIQUES[politique_x], POLITIQUES[politique_o],
+                                  min(taille_lot, nb_parties - debut), generateur)
+        resultats["X"] += x
+        resultats["O"] += o
+        resultats["nulles"] += nulles
+    return resultats
+
+
+def simuler_appariements(politiques, nb_parties, graine=None):
+    """
+    Simule chaque appariement ordonné de politiques (chacune joue X et O contre chacune des autres).
+
+    Args:
+        politiques (list): Les noms des politiques à faire jouer.
+        nb_parties (int): Le nombre de parties par appariement.
+        graine (int): La graine du générateur aléatoire.
+
+    Returns:
+        dict: Pour chaque paire (politique_x, politique_o), le dictionnaire retourné par simuler().
+    """
+    generateur = np.random.default_rng(graine)
+    return {
+        (politique_x, politique_o): simuler(politique_x, politique_o, nb_parties, generateur.integers(2 ** 32))
+        for politique_x in politiques for politique_o in politiques
+    }
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Simule des parties de tic-tac-toe en lot.")
+    analyseur.add_argument("-n", "--nb-parties", type=int, default=1000000, help="parties par appariement")
+    analyseur.add_argument("-g", "--graine", type=int, default=None)
+    analyseur.add_argument("politiques", nargs="*", default=sorted(POLITIQUES))
+    arguments = analyseur.parse_args()
+
+    debut = time.perf_counter()
+    resultats = simuler_appariements(arguments.politiques, arguments.nb_parties, arguments.graine)
+    duree = time.perf_counter() - debut
+
+    print("{:>10} {:>10} {:>10} {:>10} {:>10}".format("X", "O", "gagne X", "gagne O", "nulles"))
+    for (politique_x, politique_o), resultat in resultats.items():
+        print("{:>10} {:>10} {:>10} {:>10} {:>10}".format(politique_x, politique_o, resultat["X"], resultat["O"],
+                                                        resultat["nulles"]))
+    total = arguments.nb_parties * len(resultats)
+    print("{} parties en {:.2f} s ({:.0f} parties/s)".format(total, duree, total / duree))
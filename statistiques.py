@@ -0,0 +1,341 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient le magasin persistant des statistiques des joueurs, indexées par nom.
+
+Les résultats sont ajoutés à un journal (une ligne par match, avec une somme de contrôle) par un fil d'écriture
+qui regroupe tous les résultats en attente sous un seul fsync. Quand le journal devient long, son contenu est
+compacté dans un instantané. Les totaux sont gardés en mémoire: les lire ne coûte qu'une recherche dans un
+dictionnaire.
+
+Fichiers du répertoire:
+    instantane.json     {"generation": g, "totaux": {nom: [gagnees, nulles, perdues]}}
+    journal.<g>         Les matchs enregistrés depuis l'instantané de génération g.
+Une génération plus récente n'est utilisée qu'une fois son instantané renommé en place, de sorte qu'un arrêt
+brutal à n'importe quel moment ne perd ni ne compte deux fois un résultat déjà confirmé.
+
+Un résultat n'est confirmé qu'une fois son fsync fait: enregistrer() retourne un numéro à passer à attendre(),
+qui bloque jusque-là. Si une écriture échoue (disque plein, erreur d'entrée-sortie), le journal est tronqué à sa
+taille d'avant l'écriture, pour qu'aucune ligne du groupe n'y reste, et le fil d'écriture réessaie le même groupe
+avec une attente croissante. Tant que l'erreur dure, attendre() la relance (le résultat n'est pas confirmé mais
+reste en attente) et enregistrer() refuse les matchs suivants; fermer() abandonne les essais et relance l'erreur.
+Un résultat n'est donc ni perdu sans qu'on le sache, ni écrit deux fois.
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+
+INSTANTANE = "instantane.json"
+
+# Attentes (en secondes) avant de réessayer une écriture qui a échoué: doublée à chaque échec, jusqu'au maximum.
+REPRISE_MIN = 0.05
+REPRISE_MAX = 5.0
+
+
+def _ligne_journal(resultats):
+    donnees = json.dumps(resultats, ensure_ascii=False).encode()
+    return b"%08x %s\n" % (zlib.crc32(donnees), donnees)
+
+
+def _lire_journal(chemin):
+    """
+    Retourne les matchs d'un journal et la taille (en octets) de sa partie valide. La lecture s'arrête à la
+    première ligne incomplète ou corrompue (une écriture interrompue par un arrêt brutal).
+    """
+    matchs = []
+    taille = 0
+    if not os.path.exists(chemin):
+        return matchs, taille
+    with open(chemin, "rb") as fichier:
+        for ligne in fichier:
+            if not ligne.endswith(b"\n") or len(ligne) < 10:
+                break
+            somme, donnees = ligne[:8], ligne[9:-1]
+            if b"%08x" % zlib.crc32(donnees) != somme:
+                break
+            matchs.append(json.loads(donnees))
+            taille += len(ligne)
+    return matchs, taille
+
+
+def _ecrire_tout(journal, donnees):
+    """
+    Écrit toutes les données dans un fichier ouvert sans tampon (une écriture peut être partielle).
+    """
+    vue = memoryview(donnees)
+    while vue:
+        vue = vue[journal.write(vue):]
+
+
+def _ajouter(totaux, resultats):
+    for nom, gagnees, nulles, perdues in resultats:
+        total = totaux.get(nom)
+        if total is None:
+            totaux[nom] = [gagnees, nulles, perdues]
+        else:
+            total[0] += gagnees
+            total[1] += nulles
+            total[2] += perdues
+
+
+class MagasinStatistiques:
+    """
+    Classe modélisant le magasin des statistiques.
+
+    Attributes:
+        repertoire          (str)   : Le répertoire des fichiers du magasin.
+        delai               (float) : Le temps (en secondes) pendant lequel le fil d'écriture laisse des résultats
+                                      s'accumuler avant de les écrire ensemble.
+        seuil_compactage    (int)   : Le nombre de matchs dans le journal qui déclenche un compactage.
+        nb_synchronisations (int)   : Le nombre de fsync faits sur le journal.
+        erreur              (OSError): L'erreur de la dernière écriture, tant que le fil d'écriture la réessaie.
+    """
+
+    def __init__(self, repertoire, delai=0.01, seuil_compactage=100000):
+        """
+        Méthode spéciale ouvrant (ou créant) un magasin et relisant son instantané et son journal.
+
+        Args:
+            repertoire (string): Le répertoire des fichiers du magasin.
+            delai (float): Le temps d'accumulation des résultats avant un fsync commun.
+            seuil_compactage (int): Le nombre de matchs dans le journal qui déclenche un compactage.
+        """
+        os.makedirs(repertoire, exist_ok=True)
+        self.repertoire = repertoire
+        self.delai = delai
+        self.seuil_compactage = seuil_compactage
+        self.nb_synchronisations = 0
+
+        self.generation = 0
+        durables = {}
+        chemin = os.path.join(repertoire, INSTANTANE)
+        if os.path.exists(chemin):
+            with open(chemin, encoding="utf-8") as fichier:
+                instantane = json.load(fichier)
+            self.generation = instantane["generation"]
+            durables = instantane["totaux"]
+        matchs, taille = _lire_journal(self._chemin_journal(self.generation))
+        for resultats in matchs:
+            _ajouter(durables, resultats)
+        self._nettoyer()
+
+        # La fin corrompue éventuelle du journal est retirée avant d'y ajouter quoi que ce soit. Le journal est
+        # ouvert sans tampon: une écriture qui échoue ne laisse rien à écrire plus tard.
+        self.journal = open(self._chemin_journal(self.generation), "ab", buffering=0)
+        if self.journal.tell() > taille:
+            self.journal.truncate(taille)
+            os.fsync(self.journal.fileno())
+        self.nb_matchs_journal = len(matchs)
+
+        # durables: les totaux écrits sur disque (seul le fil d'écriture y touche).
+        # totaux: les totaux incluant les résultats encore en attente, lus par statistiques().
+        self.durables = durables
+        self.totaux = {nom: list(total) for nom, total in durables.items()}
+
+        self.verrou = threading.Lock()
+        self.condition = threading.Condition(self.verrou)
+        self.en_attente = []
+        self.numero = 0             # Numéro du dernier match enregistré.
+        self.numero_durable = 0     # Numéro du dernier match écrit et synchronisé.
+        self.ferme = False
+        self.erreur = None          # L'erreur de la dernière écriture, tant qu'elle n'a pas réussi.
+        self.fil = threading.Thread(target=self._ecrire_en_continu, name="statistiques", daemon=True)
+        self.fil.start()
+
+    def _chemin_journal(self, generation):
+        return os.path.join(self.repertoire, "journal.{}".format(generation))
+
+    def _nettoyer(self):
+        """
+        Supprime les journaux des générations déjà compactées dans l'instantané.
+        """
+        for nom in os.listdir(self.repertoire):
+            if nom.startswith("journal.") and nom != "journal.{}".format(self.generation):
+                os.remove(os.path.join(self.repertoire, nom))
+
+    def enregistrer(self, resultats):
+        """
+        Enregistre un match. Les totaux en mémoire sont mis à jour tout de suite; l'écriture sur disque
+        est faite plus tard par le fil d'écriture, avec celle des autres matchs en attente.
+
+        Args:
+            resultats (list): Les (nom, gagnees, nulles, perdues) à ajouter aux joueurs du match.
+
+        Returns:
+            int: Le numéro du match, à passer à attendre() pour s'assurer qu'il est sur disque.
+
+        Raises:
+            OSError: L'erreur de l'écriture en cours d'essai: le magasin n'accepte pas de match tant qu'elle dure.
+        """
+        resultats = [(nom, gagnees, nulles, perdues) for nom, gagnees, nulles, perdues in resultats]
+        with self.condition:
+            assert not self.ferme, "MagasinStatistiques: le magasin est fermé."
+            if self.erreur is not None:
+                raise self.erreur
+            _ajouter(self.totaux, resultats)
+            self.en_attente.append(resultats)
+            self.numero += 1
+            self.condition.notify_all()
+            return self.numero
+
+    def enregistrer_partie(self, partie):
+        """
+        Enregistre le match qui vient de se terminer dans une Partie.
+        """
+        resultats = []
+        for joueur in partie.joueurs:
+            if partie.plateau.est_gagnant(joueur.pion):
+                resultats.append((joueur.nom, 1, 0, 0))
+            elif partie.plateau.est_gagnant("O" if joueur.pion == "X" else "X"):
+                resultats.append((joueur.nom, 0, 0, 1))
+            else:
+                resultats.append((joueur.nom, 0, 1, 0))
+        return self.enregistrer(resultats)
+
+    def statistiques(self, nom):
+        """
+        Retourne les totaux d'un joueur, y compris les matchs pas encore écrits sur disque.
+
+        Returns:
+            (int,int,int): Le nombre de parties gagnées, nulles et perdues.
+        """
+        total = self.totaux.get(nom)
+        return (0, 0, 0) if total is None else tuple(total)
+
+    def attendre(self, numero=None):
+        """
+        Bloque jusqu'à ce que le match numero (par défaut, le dernier enregistré) soit écrit et synchronisé.
+
+        Raises:
+            OSError: L'erreur qui empêche d'écrire le match (il reste en attente et sera réessayé).
+        """
+        with self.condition:
+            if numero is None:
+                numero = self.numero
+            while self.numero_durable < numero:
+                if self.erreur is not None:
+                    raise self.erreur
+                self.condition.wait()
+
+    def _ecrire_en_continu(self):
+        while True:
+            with self.condition:
+                while not self.en_attente and not self.ferme:
+                    self.condition.wait()
+                if not self.en_attente:
+                    return
+            # Laisse d'autres matchs s'ajouter au groupe avant l'écriture.
+            if self.delai and not self.ferme:
+                time.sleep(self.delai)
+            with self.condition:
+                groupe, self.en_attente = self.en_attente, []
+                numero = self.numero
+
+            if not self._ecrire_groupe(groupe):
+                # Le magasin est fermé pendant une erreur: le groupe reste en attente, devant les matchs suivants.
+                with self.condition:
+                    self.en_attente[:0] = groupe
+                return
+            self.nb_synchronisations += 1
+            for resultats in groupe:
+                _ajouter(self.durables, resultats)
+            self.nb_matchs_journal += len(groupe)
+            if self.nb_matchs_journal >= self.seuil_compactage:
+                try:
+                    self._compacter()
+                except OSError:
+                    # Le groupe est déjà dans le journal courant: seul le compactage est manqué, et il sera
+                    # réessayé après le prochain groupe.
+                    pass
+
+            with self.condition:
+                self.numero_durable = numero
+                self.erreur = None
+                self.condition.notify_all()
+
+    def _ecrire_groupe(self, groupe):
+        """
+        Ajoute un groupe au journal et le synchronise, en réessayant tant que l'écriture échoue. Après un échec,
+        le journal est tronqué à sa taille d'avant le groupe: des lignes valides du groupe n'y restent pas.
+
+        Returns:
+            bool: True si le groupe est écrit, False si le magasin a été fermé avant.
+        """
+        donnees = b"".join(_ligne_journal(resultats) for resultats in groupe)
+        taille = os.fstat(self.journal.fileno()).st_size
+        attente = REPRISE_MIN
+        while True:
+            try:
+                _ecrire_tout(self.journal, donnees)
+                os.fsync(self.journal.fileno())
+                return True
+            except OSError as erreur:
+                echec = erreur
+            try:
+                self.journal.truncate(taille)
+                os.fsync(self.journal.fileno())
+            except OSError:
+                # La troncature sera refaite après le prochain échec; au redémarrage, la lecture du journal
+                # s'arrête de toute façon à la première ligne incomplète.
+                pass
+            with self.condition:
+                self.erreur = echec
+                self.condition.notify_all()
+                if self.ferme or self.condition.wait_for(lambda: self.ferme, attente):
+                    return False
+            attente = min(2 * attente, REPRISE_MAX)
+
+    def _compacter(self):
+        """
+        Écrit les totaux durables dans l'instantané de la génération suivante, puis commence un nouveau journal.
+        """
+        generation = self.generation + 1
+        temporaire = os.path.join(self.repertoire, INSTANTANE + ".tmp")
+        with open(temporaire, "w", encoding="utf-8") as fichier:
+            json.dump({"generation": generation, "totaux": self.durables}, fichier, ensure_ascii=False)
+            fichier.flush()
+            os.fsync(fichier.fileno())
+        nouveau_journal = open(self._chemin_journal(generation), "ab", buffering=0)
+        try:
+            os.replace(temporaire, os.path.join(self.repertoire, INSTANTANE))
+        except OSError:
+            nouveau_journal.close()
+            raise
+        # Une fois l'instantané en place, les matchs suivants vont dans le journal de sa génération, même si la
+        # suite échoue: l'ancien journal ne serait plus relu.
+        self.journal.close()
+        self.journal = nouveau_journal
+        self.generation = generation
+        self.nb_matchs_journal = 0
+        if hasattr(os, "O_DIRECTORY"):
+            descripteur = os.open(self.repertoire, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(descripteur)
+            finally:
+                os.close(descripteur)
+        self._nettoyer()
+
+    def fermer(self):
+        """
+        Écrit les résultats en attente et arrête le fil d'écriture. Si une écriture est en train d'échouer, les
+        essais sont abandonnés.
+
+        Raises:
+            OSError: L'erreur qui a empêché d'écrire des résultats.
+        """
+        with self.condition:
+            self.ferme = True
+            self.condition.notify_all()
+        self.fil.join()
+        self.journal.close()
+        if self.erreur is not None:
+            raise self.erreur
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.fermer()
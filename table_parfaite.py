@@ -0,0 +1,135 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier contient la table de jeu parfait du tic-tac-toe. Toutes les positions atteignables sont résolues
+une seule fois au chargement du module, réduites par les huit symétries du plateau, de sorte que chaque coup
+de l'ordinateur en mode "parfait" se résume à une recherche dans un dictionnaire."""
+
+from plateau import LIGNES_GAGNANTES, PLATEAU_PLEIN, symetries
+
+# PERMUTATIONS[s][position] donne la position obtenue en appliquant la symétrie s (les huit symétries du carré).
+PERMUTATIONS = symetries(3, 3)
+
+# INVERSES[s][position] annule la symétrie s (sert à ramener un coup canonique dans le repère du plateau).
+INVERSES = tuple(
+    tuple(permutation.index(p) for p in range(9))
+    for permutation in PERMUTATIONS
+)
+
+
+def _transformer(bits, permutation):
+    resultat = 0
+    for position in range(9):
+        if bits >> position & 1:
+            resultat |= 1 << permutation[position]
+    return resultat
+
+# TRANSFORMEES[s][bits] donne l'image d'un bitboard de 9 bits par la symétrie s (8 x 512 entrées).
+TRANSFORMEES = tuple(
+    tuple(_transformer(bits, permutation) for bits in range(PLATEAU_PLEIN + 1))
+    for permutation in PERMUTATIONS
+)
+
+
+def forme_canonique(joueur, adversaire):
+    """
+    Calcule la forme canonique d'une position, c'est-à-dire la plus petite clé parmi ses huit images symétriques.
+
+    Args:
+        joueur (int): Bitboard du joueur dont c'est le tour.
+        adversaire (int): Bitboard de son adversaire.
+
+    Returns:
+        (int,int): La clé canonique (joueur << 9 | adversaire) et l'indice de la symétrie qui y mène.
+    """
+    cle = 1 << 18
+    symetrie = 0
+    for s in range(8):
+        table = TRANSFORMEES[s]
+        candidate = table[joueur] << 9 | table[adversaire]
+        if candidate < cle:
+            cle = candidate
+            symetrie = s
+    return cle, symetrie
+
+
+def _est_gagnant(bits):
+    for masque in LIGNES_GAGNANTES:
+        if bits & masque == masque:
+            return True
+    return False
+
+
+# Table de jeu parfait: clé canonique -> (meilleur coup dans le repère canonique, score).
+# Le score est positif si le joueur dont c'est le tour gagne (d'autant plus grand que la victoire est rapide),
+# nul pour une partie nulle et négatif s'il perd.
+TABLE = {}
+
+
+def _resoudre(joueur, adversaire):
+    cle, s = forme_canonique(joueur, adversaire)
+    if cle in TABLE:
+        return TABLE[cle][1]
+
+    joueur = TRANSFORMEES[s][joueur]
+    adversaire = TRANSFORMEES[s][adversaire]
+    occupees = joueur | adversaire
+    # Un plateau plein (sans coup possible) est une partie nulle.
+    meilleur_coup, meilleur_score = None, 0 if occupees == PLATEAU_PLEIN else None
+    for position in range(9):
+        bit = 1 << position
+        if occupees & bit:
+            continue
+        essai = joueur | bit
+        if _est_gagnant(essai):
+            score = 10 - bin(essai | adversaire).count("1")
+        elif essai | adversaire == PLATEAU_PLEIN:
+            score = 0
+        else:
+            score = -_resoudre(adversaire, essai)
+        if meilleur_score is None or score > meilleur_score:
+            meilleur_coup, meilleur_score = position, score
+
+    TABLE[cle] = (meilleur_coup, meilleur_score)
+    return meilleur_score
+
+
+def coup_parfait(joueur, adversaire):
+    """
+    Retourne le meilleur coup pour le joueur dont c'est le tour.
+    Le coût est constant: huit transformations par table, une recherche dans le dictionnaire et une permutation.
+
+    Args:
+        joueur (int): Bitboard du joueur dont c'est le tour (l'ordinateur).
+        adversaire (int): Bitboard de son adversaire.
+
+    Returns:
+        int: La position (ligne * 3 + colonne) de la case à jouer.
+    """
+    cle, s = forme_canonique(joueur, adversaire)
+    if cle not in TABLE:
+        # Position hors de la table (par exemple un plateau construit à la main): on la résout une fois.
+        _resoudre(joueur, adversaire)
+    return INVERSES[s][TABLE[cle][0]]
+
+
+def valeur(joueur, adversaire):
+    """
+    Retourne la valeur théorique de la position pour le joueur dont c'est le tour.
+
+    Args:
+        joueur (int): Bitboard du joueur dont c'est le tour.
+        adversaire (int): Bitboard de son adversaire.
+
+    Returns:
+        int: 1 si le joueur gagne avec un jeu parfait, 0 pour une partie nulle, -1 s'il perd.
+    """
+    cle, s = forme_canonique(joueur, adversaire)
+    if cle not in TABLE:
+        _resoudre(joueur, adversaire)
+    score = TABLE[cle][1]
+    return (score > 0) - (score < 0)
+
+
+# Résolution unique de toutes les positions atteignables depuis le plateau vide.
+_resoudre(0, 0)
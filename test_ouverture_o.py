@@ -0,0 +1,63 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier vérifie que les niveaux lus dans une table indexée par rang (retrograde et appris) jouent aussi
+bien quand O ouvre la partie, ce que Partie et le serveur permettent, que quand X l'ouvre.
+    python -m pytest test_ouverture_o.py
+"""
+
+import os
+import random
+
+import numpy as np
+
+import apprentissage
+import retrograde
+from plateau import Plateau
+
+NB_PARTIES = 1000
+
+
+def _jouer(joueur, pion_niveau, ouvreur, generateur):
+    """
+    Joue une partie de 3 x 3 entre le joueur (qui a le pion pion_niveau) et un adversaire qui joue au hasard.
+
+    Returns:
+        int: 1 si le joueur gagne, -1 s'il perd, 0 si la partie est nulle.
+    """
+    plateau = Plateau()
+    pion = ouvreur
+    while True:
+        if pion == pion_niveau:
+            position = joueur.choisir_coup(plateau.pions["X"], plateau.pions["O"], pion)
+        else:
+            position = generateur.choice(plateau.coups_legaux())
+        plateau.jouer_coup(position, pion)
+        if plateau.a_gagne(pion):
+            return 1 if pion == pion_niveau else -1
+        if not plateau.non_plein():
+            return 0
+        pion = "O" if pion == "X" else "X"
+
+
+def _pertes(joueur, pion_niveau, ouvreur):
+    generateur = random.Random(0)
+    return sum(_jouer(joueur, pion_niveau, ouvreur, generateur) == -1 for _ in range(NB_PARTIES))
+
+
+def test_retrograde_quand_o_ouvre(tmp_path):
+    chemin = os.path.join(tmp_path, "retrograde_3x3x3.bin")
+    retrograde.resoudre(chemin, 3, 3, 3)
+    table = retrograde.TableRetrograde(chemin)
+    for pion_niveau in ("X", "O"):
+        assert _pertes(table, pion_niveau, "O") == 0
+
+
+def test_appris_quand_o_ouvre(tmp_path):
+    valeurs = np.zeros(3 ** 9, dtype=np.float32)
+    apprentissage.entrainer(valeurs, 3, 3, 3, 200000, graine=0)
+    chemin = os.path.join(tmp_path, "appris_3x3x3.bin")
+    apprentissage.ecrire(chemin, 3, 3, 3, valeurs, 200000, 0)
+    joueur = apprentissage.Apprenti(chemin)
+    for pion_niveau in ("X", "O"):
+        assert _pertes(joueur, pion_niveau, "O") == 0
@@ -0,0 +1,298 @@
+__authors__ = 'Carl Dumont et Simon Provencher'
+__date__ = "18 octobre 2026"
+
+"""Ce fichier permet d'organiser un tournoi à la ronde entre plusieurs stratégies de l'ordinateur.
+Chaque paire de stratégies s'affronte dans les deux ordres (chacune commence à tour de rôle). Les parties sont
+découpées en paquets répartis sur plusieurs processus, puis les résultats sont fusionnés pour calculer les
+victoires, les parties nulles et un classement Elo avec intervalles de confiance."""
+
+import argparse
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from plateau import Plateau
+
+# Le pion de l'adversaire de chaque pion.
+ADVERSAIRE = {"X": "O", "O": "X"}
+
+
+class Strategie:
+    """
+    Interface d'une stratégie de l'ordinateur pouvant participer à un tournoi.
+    Une stratégie doit pouvoir être copiée vers un autre processus (pickle): elle doit donc être
+    définie au niveau d'un module.
+    """
+
+    def choisir_case(self, plateau, pion):
+        """
+        Retourne la case à jouer.
+
+        Args:
+            plateau (Plateau): Le plateau de la partie en cours.
+            pion (string): Le pion de la stratégie ("X" ou "O").
+
+        Returns:
+            (int,int): Les coordonnées (ligne, colonne) d'une case vide.
+        """
+        raise NotImplementedError
+
+
+class StrategiePlateau(Strategie):
+    """
+    Stratégie utilisant Plateau.choisir_prochaine_case à un niveau donné ("normal" ou "parfait").
+    """
+
+    def __init__(self, niveau="normal"):
+        self.niveau = niveau
+
+    def choisir_case(self, plateau, pion):
+        return plateau.choisir_prochaine_case(ADVERSAIRE[pion], self.niveau)
+
+
+class StrategieAleatoire(Strategie):
+    """
+    Stratégie jouant une case vide au hasard.
+    """
+
+    def choisir_case(self, plateau, pion):
+        return plateau.case_libre_au_hasard()
+
+
+# Stratégies connues, indexées par leur nom.
+STRATEGIES = {}
+
+
+def enregistrer_strategie(nom, strategie):
+    """
+    Ajoute une stratégie à celles qui participent aux tournois par défaut.
+
+    Args:
+        nom (string): Le nom de la stratégie dans le classement.
+        strategie (Strategie): La stratégie.
+    """
+    assert isinstance(nom, str), "Tournoi: nom doit être une chaîne de caractères."
+    assert isinstance(strategie, Strategie), "Tournoi: strategie doit être une instance de Strategie."
+    STRATEGIES[nom] = strategie
+
+
+enregistrer_strategie("normal", StrategiePlateau("normal"))
+enregistrer_strategie("parfait", StrategiePlateau("parfait"))
+enregistrer_strategie("aleatoire", StrategieAleatoire())
+
+
+def jouer_paquet(strategie_x, strategie_o, nb_parties, graine):
+    """
+    Joue un paquet de parties entre deux stratégies, X commençant toujours. Cette fonction est l'unité
+    de travail envoyée aux processus.
+
+    Args:
+        strategie_x (Strategie): La stratégie qui joue X.
+        strategie_o (Strategie): La stratégie qui joue O.
+        nb_parties (int): Le nombre de parties du paquet.
+        graine (int): La graine du générateur aléatoire, pour des résultats reproductibles.
+
+    Returns:
+        (int,int,int): Le nombre de victoires de X, de victoires de O et de parties nulles.
+    """
+    random.seed(graine)
+    plateau = Plateau()
+    victoires_x = victoires_o = nulles = 0
+    for _ in range(nb_parties):
+        plateau.initialiser()
+        pion, strategie = "X", strategie_x
+        while True:
+            ligne, colonne = strategie.choisir_case(plateau, pion)
+            plateau.jouer_coup(ligne * plateau.n + colonne, pion)
+            if plateau.a_gagne(pion):
+                if pion == "X":
+                    victoires_x += 1
+                else:
+                    victoires_o += 1
+                break
+            if not plateau.non_plein():
+                nulles += 1
+                break
+            if pion == "X":
+                pion, strategie = "O", strategie_o
+            else:
+                pion, strategie = "X", strategie_x
+    return victoires_x, victoires_o, nulles
+
+
+def _inverser(matrice):
+    """
+    Inverse une petite matrice carrée (liste de listes) par élimination de Gauss-Jordan.
+    """
+    n = len(matrice)
+    augmentee = [ligne[:] + [float(i == j) for j in range(n)] for i, ligne in enumerate(matrice)]
+    for colonne in range(n):
+        pivot = max(range(colonne, n), key=lambda i: abs(augmentee[i][colonne]))
+        augmentee[colonne], augmentee[pivot] = augmentee[pivot], augmentee[colonne]
+        facteur = augmentee[colonne][colonne]
+        augmentee[colonne] = [valeur / facteur for valeur in augmentee[colonne]]
+        for i in range(n):
+            if i != colonne and augmentee[i][colonne] != 0:
+                multiple = augmentee[i][colonne]
+                augmentee[i] = [a - multiple * b for a, b in zip(augmentee[i], augmentee[colonne])]
+    return [ligne[n:] for ligne in augmentee]
+
+
+class Tournoi:
+    """
+    Classe modélisant un tournoi à la ronde entre stratégies.
+
+    Attributes:
+        strategies      (dict)  : Les stratégies participantes, indexées par leur nom.
+        resultats       (dict)  : Pour chaque paire (nom_x, nom_o), les victoires de X, de O et les nulles.
+        nb_parties_gagnees (dict): Le nombre de parties gagnées par chaque stratégie.
+        nb_parties_nulles (int) : Le nombre total de parties nulles.
+    """
+
+    def __init__(self, strategies=None):
+        """
+        Méthode spéciale initialisant un tournoi.
+
+        Args:
+            strategies (dict): Les stratégies participantes (par défaut, toutes les stratégies enregistrées).
+        """
+        if strategies is None:
+            strategies = STRATEGIES
+        assert len(strategies) >= 2, "Tournoi: il faut au moins deux stratégies."
+
+        self.strategies = dict(strategies)
+        self.resultats = {}
+        self.nb_parties_gagnees = {nom: 0 for nom in self.strategies}
+        self.nb_parties_nulles = 0
+
+    def appariements(self):
+        """
+        Retourne toutes les paires ordonnées (nom_x, nom_o) de stratégies différentes.
+        """
+        return [(nom_x, nom_o) for nom_x in self.strategies for nom_o in self.strategies if nom_x != nom_o]
+
+    def jouer(self, nb_parties, nb_processus=None, taille_paquet=10000, graine=0):
+        """
+        Joue nb_parties parties pour chaque paire ordonnée de stratégies. Les parties sont découpées en paquets
+        d'au plus taille_paquet parties, répartis sur un ProcessPoolExecutor.
+
+        Args:
+            nb_parties (int): Le nombre de parties par paire ordonnée.
+            nb_processus (int): Le nombre de processus (par défaut, le nombre de cœurs).
+            taille_paquet (int): Le nombre maximal de parties par unité de travail.
+            graine (int): La graine de départ; chaque paquet reçoit sa propre graine dérivée de celle-ci.
+        """
+        assert isinstance(nb_parties, int) and nb_parties >= 0, "Tournoi: nb_parties doit être un entier positif."
+        assert isinstance(taille_paquet, int) and taille_paquet > 0, "Tournoi: taille_paquet doit être positif."
+
+        paquets = []
+        for nom_x, nom_o in self.appariements():
+            for debut in range(0, nb_parties, taille_paquet):
+                paquets.append((nom_x, nom_o, min(taille_paquet, nb_parties - debut), graine + len(paquets)))
+
+        with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+            futurs = {
+                executeur.submit(jouer_paquet, self.strategies[nom_x], self.strategies[nom_o], nombre, graine_paquet):
+                    (nom_x, nom_o)
+                for nom_x, nom_o, nombre, graine_paquet in paquets
+            }
+            for futur in as_completed(futurs):
+                self.fusionner(*futurs[futur], *futur.result())
+
+    def fusionner(self, nom_x, nom_o, victoires_x, victoires_o, nulles):
+        """
+        Ajoute les résultats d'un paquet aux totaux du tournoi.
+        """
+        totaux = self.resultats.setdefault((nom_x, nom_o), [0, 0, 0])
+        totaux[0] += victoires_x
+        totaux[1] += victoires_o
+        totaux[2] += nulles
+        self.nb_parties_gagnees[nom_x] += victoires_x
+        self.nb_parties_gagnees[nom_o] += victoires_o
+        self.nb_parties_nulles += nulles
+
+    def classement(self, moyenne=1500, nulles_virtuelles=1, confiance=1.96):
+        """
+        Calcule le classement Elo des stratégies par maximum de vraisemblance (modèle de Bradley-Terry, une
+        partie nulle comptant pour une demi-victoire). Quelques parties nulles virtuelles sont ajoutées à chaque
+        paire pour que le classement reste fini même si une stratégie ne perd jamais.
+
+        Args:
+            moyenne (float): La moyenne des cotes Elo.
+            nulles_virtuelles (float): Le nombre de parties nulles ajoutées à chaque paire ordonnée.
+            confiance (float): Le nombre d'écarts-types de l'intervalle de confiance (1.96 pour 95 %).
+
+        Returns:
+            list: Des tuples (nom, cote, demi-largeur de l'intervalle de confiance), du meilleur au moins bon.
+        """
+        noms = list(self.strategies)
+        n = len(noms)
+        indices = {nom: i for i, nom in enumerate(noms)}
+        points = [[0.0] * n for _ in range(n)]
+        parties = [[0.0] * n for _ in range(n)]
+        for (nom_x, nom_o), (victoires_x, victoires_o, nulles) in self.resultats.items():
+            i, j = indices[nom_x], indices[nom_o]
+            nulles += nulles_virtuelles
+            total = victoires_x + victoires_o + nulles
+            points[i][j] += victoires_x + nulles / 2
+            points[j][i] += victoires_o + nulles / 2
+            parties[i][j] += total
+            parties[j][i] += total
+
+        # Méthode de Newton sur la log-vraisemblance. L'information de Fisher est singulière (seules les
+        # différences de cotes comptent); on utilise sa pseudo-inverse, obtenue en lui ajoutant 1/n partout.
+        echelle = math.log(10) / 400
+        cotes = [0.0] * n
+        for _ in range(100):
+            gradient = [0.0] * n
+            information = [[1 / n] * n for _ in range(n)]
+            for i in range(n):
+                for j in range(n):
+                    if i == j or parties[i][j] == 0:
+                        continue
+                    p = 1 / (1 + 10 ** ((cotes[j] - cotes[i]) / 400))
+                    gradient[i] += echelle * (points[i][j] - parties[i][j] * p)
+                    poids = echelle * echelle * parties[i][j] * p * (1 - p)
+                    information[i][i] += poids
+                    information[i][j] -= poids
+            covariance = [[valeur - 1 / n for valeur in ligne] for ligne in _inverser(information)]
+            pas = [sum(covariance[i][j] * gradient[j] for j in range(n)) for i in range(n)]
+            cotes = [cote + delta for cote, delta in zip(cotes, pas)]
+            if max(abs(delta) for delta in pas) < 1e-6:
+                break
+
+        return sorted(
+            ((nom, moyenne + cotes[i], confiance * math.sqrt(max(covariance[i][i], 0.0)))
+             for nom, i in indices.items()),
+            key=lambda entree: -entree[1])
+
+    def afficher_statistiques(self):
+        """
+        Affiche les résultats de chaque paire, les totaux et le classement Elo.
+        """
+        for (nom_x, nom_o), (victoires_x, victoires_o, nulles) in sorted(self.resultats.items()):
+            print("{:>12} (X) contre {:>12} (O) : {:>9} {:>9} {:>9}".format(nom_x, nom_o, victoires_x, victoires_o,
+                                                                             nulles))
+        for nom in self.strategies:
+            print("Nombre de parties gagnées par ", nom, " : ", self.nb_parties_gagnees[nom])
+        print("Nombres de parties nulles : ", self.nb_parties_nulles)
+        for rang, (nom, cote, marge) in enumerate(self.classement(), 1):
+            print("{:>2}. {:>12} {:7.1f} ± {:.1f}".format(rang, nom, cote, marge))
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Tournoi à la ronde entre les stratégies de l'ordinateur.")
+    analyseur.add_argument("-n", "--nb-parties", type=int, default=10000, help="parties par paire ordonnée")
+    analyseur.add_argument("-p", "--processus", type=int, default=None, help="nombre de processus")
+    analyseur.add_argument("-t", "--taille-paquet", type=int, default=10000, help="parties par unité de travail")
+    analyseur.add_argument("-g", "--graine", type=int, default=0)
+    arguments = analyseur.parse_args()
+
+    tournoi = Tournoi()
+    debut = time.perf_counter()
+    tournoi.jouer(arguments.nb_parties, arguments.processus, arguments.taille_paquet, arguments.graine)
+    duree = time.perf_counter() - debut
+    tournoi.afficher_statistiques()
+    total = arguments.nb_parties * len(tournoi.appariements())
+    print("{} parties en {:.2f} s ({:.0f} parties/s)".format(total, duree, total / duree))